@@ -1,89 +1,22 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
-
-# --- LÓGICA MATEMÁTICA PASSO A PASSO (Baseada nos Slides) ---
-
-def calcular_mmq_detalhado():
-    """
-    Realiza o MMQ construindo manualmente o Sistema Normal.
-    Baseado no Slide 44 e 45 do material.
-    """
-    # 1. Dados Originais
-    x = np.array([1971, 1972, 1974, 1978, 1982, 1986, 1989, 1993, 1997, 1999, 2000], dtype=float)
-    N = np.array([2250, 3300, 6000, 29000, 134000, 275000, 1200000, 3100000, 7500000, 9500000, 42000000], dtype=float)
-    n_pontos = len(x)
-
-    # 2. Linearização (Slide 38/44)
-    # Modelo: N = alpha * 10^(beta * t)
-    # Linear: log10(N) = log10(alpha) + beta * t
-    # Y = B + A * X
-    y_log = np.log10(N)
-
-    # 3. Cálculo dos Somatórios (Tabela do Slide 45)
-    sum_x = np.sum(x)
-    sum_x2 = np.sum(x ** 2)
-    sum_y = np.sum(y_log)
-    sum_xy = np.sum(x * y_log)
-
-    # 4. Montagem do Sistema Normal (Slide 44/494)
-    # Sistema na forma:
-    # [ n      sum_x  ] [ B ] = [ sum_y  ]
-    # [ sum_x  sum_x2 ] [ A ] = [ sum_xy ]
-    # Onde B é o coeficiente linear (intercepto) e A é o angular (inclinação)
-
-    matriz_coeficientes = np.array([[n_pontos, sum_x],
-                                    [sum_x, sum_x2]])
-
-    vetor_termos_indep = np.array([sum_y, sum_xy])
-
-    # 5. Resolução do Sistema Linear
-    # Resolvemos para encontrar [B, A]
-    solucao = np.linalg.solve(matriz_coeficientes, vetor_termos_indep)
-
-    B_linear = solucao[0]  # log10(alpha)
-    A_angular = solucao[1]  # beta
-
-    # 6. Retorno aos parâmetros originais
-    alpha = 10 ** B_linear
-    beta = A_angular
-
-    # Retorna dados para plotagem e string de memória de cálculo
-    detalhes_calculo = (
-        f"PASSO 1: TABELA DE SOMATÓRIOS (n={n_pontos})\n"
-        f"--------------------------------------------\n"
-        f"Σ x    = {sum_x:,.2f}\n"
-        f"Σ x²   = {sum_x2:,.2f}\n"
-        f"Σ y    = {sum_y:,.4f}  (onde y = log10(N))\n"
-        f"Σ x·y  = {sum_xy:,.4f}\n\n"
-        f"PASSO 2: SISTEMA NORMAL (Matriz)\n"
-        f"--------------------------------------------\n"
-        f"[{n_pontos}       {sum_x:,.0f}   ] [ B ]   [ {sum_y:.4f}   ]\n"
-        f"[{sum_x:,.0f}   {sum_x2:,.0f} ] [ A ] = [ {sum_xy:.4f} ]\n\n"
-        f"PASSO 3: SOLUÇÃO DO SISTEMA\n"
-        f"--------------------------------------------\n"
-        f"B (Linear/Intercepto) = {B_linear:.6f}\n"
-        f"A (Angular/Inclinação)= {A_angular:.6f}\n\n"
-        f"PASSO 4: MODELO FINAL\n"
-        f"--------------------------------------------\n"
-        f"alpha = 10^B = {alpha:.4e}\n"
-        f"Equação: N = {alpha:.4e} * 10^({A_angular:.5f} * Ano)"
-    )
-
-    return x, N, y_log, alpha, beta, B_linear, detalhes_calculo
-
-
-def prever(ano, alpha, beta):
-    return alpha * (10 ** (beta * ano))
+
+from grafico import AtualizadorBlit
+from mmq import calcular_mmq_detalhado, prever
+from reamostragem import bootstrap
+
+# Reamostras do bootstrap das faixas de previsão (vetorizado: poucos ms)
+N_REAMOSTRAS = 5000
+
+# tkinter e matplotlib só são importados quando uma janela é aberta: quem usa
+# apenas calcular_mmq_detalhado/prever não paga a inicialização da interface.
 
 
 # --- INTERFACE GRÁFICA ---
 
 class MooreAppStepByStep:
     def __init__(self, root):
+        from tkinter import ttk
+
         self.root = root
         self.root.title("Lei de Moore - Método MMQ Passo a Passo")
         self.root.state('zoomed')
@@ -100,6 +33,8 @@ class MooreAppStepByStep:
         self.criar_abas()
 
     def criar_abas(self):
+        from tkinter import ttk
+
         # Criação de Abas (Notebook)
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill="both", expand=True, padx=10, pady=10)
@@ -115,6 +50,10 @@ class MooreAppStepByStep:
         self.setup_tab_calculo(tab_calc)
 
     def setup_tab_graficos(self, parent):
+        from tkinter import ttk
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # Layout da Aba Gráficos
         frame_top = ttk.Frame(parent)
         frame_top.pack(fill="x", pady=10, padx=20)
@@ -137,14 +76,22 @@ class MooreAppStepByStep:
         self.lbl_res.pack(pady=5)
 
         # Gráficos
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 5))
+        fig = Figure(figsize=(10, 5))
+        ax1, ax2 = fig.subplots(1, 2)
 
         # Gráfico Linearizado
         x_line = np.linspace(1970, 2025, 100)
         y_line_log = self.beta * x_line + self.B_linear
 
+        # Faixa de confiança de 95% da curva (bootstrap dos resíduos)
+        faixa = bootstrap(self.x, self.y_real, previsoes=x_line, n_reamostras=N_REAMOSTRAS, semente=0)
+        faixa_inf = np.array([i.inferior for i in faixa.confianca])
+        faixa_sup = np.array([i.superior for i in faixa.confianca])
+
         ax1.scatter(self.x, self.y_log, color='red', s=80, label='Dados Originais (Log)')
         ax1.plot(x_line, y_line_log, color='blue', linewidth=3, label='Reta MMQ')
+        ax1.fill_between(x_line, np.log10(faixa_inf), np.log10(faixa_sup), color='blue', alpha=0.15,
+                         label='IC 95% (bootstrap)')
         ax1.set_title("Linearização (Log10)", fontsize=14)
         ax1.grid(True)
         ax1.legend()
@@ -153,16 +100,25 @@ class MooreAppStepByStep:
         y_line_exp = prever(x_line, self.alpha, self.beta)
         ax2.scatter(self.x, self.y_real, color='red', s=80, label='Dados Reais')
         ax2.plot(x_line, y_line_exp, color='green', linewidth=3, label='Curva Ajustada')
+        ax2.fill_between(x_line, faixa_inf, faixa_sup, color='green', alpha=0.15, label='IC 95% (bootstrap)')
         ax2.set_title("Curva Exponencial Final", fontsize=14)
         ax2.set_yscale('log')
         ax2.grid(True)
+
+        # Ponto da previsão: artista atualizado no lugar a cada cálculo
+        self.ponto_previsao, = ax2.plot([], [], '*', color='orange', markersize=20, label='Previsão')
         ax2.legend()
+        self.ax_exp = ax2
 
         canvas = FigureCanvasTkAgg(fig, master=parent)
+        self.blit_previsao = AtualizadorBlit(canvas, [self.ponto_previsao])
         canvas.draw()
         canvas.get_tk_widget().pack(fill="both", expand=True)
 
     def setup_tab_calculo(self, parent):
+        import tkinter as tk
+        from tkinter import ttk
+
         # Título
         ttk.Label(parent, text="Detalhamento do Método dos Mínimos Quadrados", style="Header.TLabel").pack(pady=20)
 
@@ -175,15 +131,34 @@ class MooreAppStepByStep:
         text_area.config(state="disabled")  # Apenas leitura
 
     def calcular_custom(self):
+        from tkinter import messagebox
+
         try:
             ano = float(self.ent_ano.get())
             res = prever(ano, self.alpha, self.beta)
-            self.lbl_res.config(text=f"Em {int(ano)}: {res:.2e} transistores")
+            pred = bootstrap(self.x, self.y_real, previsoes=[ano], n_reamostras=N_REAMOSTRAS, semente=0).predicao[0]
+            self.lbl_res.config(text=f"Em {int(ano)}: {res:.2e} transistores "
+                                     f"(predição 95%: {pred.inferior:.2e} a {pred.superior:.2e})")
+            self.mostrar_previsao(ano, res)
         except ValueError:
             messagebox.showerror("Erro", "Ano inválido")
 
+    def mostrar_previsao(self, ano, valor):
+        self.ponto_previsao.set_data([ano], [valor])
+
+        # Só redesenha a figura inteira se o ponto sair dos eixos atuais
+        ax = self.ax_exp
+        (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+        fora = not (x0 <= ano <= x1 and y0 <= valor <= y1)
+        if fora:
+            ax.set_xlim(min(x0, ano - 2), max(x1, ano + 2))
+            ax.set_ylim(min(y0, valor / 3), max(y1, valor * 3))
+        self.blit_previsao.atualizar(redesenhar_tudo=fora)
+
 
 if __name__ == "__main__":
+    import tkinter as tk
+
     root = tk.Tk()
     app = MooreAppStepByStep(root)
     root.mainloop()
\ No newline at end of file
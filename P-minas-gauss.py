@@ -2,60 +2,7 @@ import tkinter as tk
 from tkinter import messagebox
 import numpy as np
 
-def resolver_gauss_manual(A_in, B_in):
-    A = np.copy(A_in)
-    b = np.copy(B_in)
-    n = len(b)
-
-    # --- ETAPA 1: Eliminação Progressiva (Escalonamento) ---
-    for k in range(n - 1):
-        # 1.1 Pivoteamento Parcial:
-        # Encontrar a linha com o maior valor absoluto na coluna atual (k)
-        indice_max = k
-        valor_max = abs(A[k, k])
-
-        for i in range(k + 1, n):
-            if abs(A[i, k]) > valor_max:
-                valor_max = abs(A[i, k])
-                indice_max = i
-
-        if valor_max == 0:
-            raise ValueError("O sistema não tem solução única (Matriz Singular).")
-
-        # Trocar as linhas se necessário (tanto na matriz A quanto no vetor b)
-        if indice_max != k:
-            A[[k, indice_max]] = A[[indice_max, k]]
-            b[[k, indice_max]] = b[[indice_max, k]]
-
-        # 1.2 Eliminação (Zerar elementos abaixo do pivô):
-        for i in range(k + 1, n):
-            # Fator multiplicador (m)
-            fator = A[i, k] / A[k, k]
-
-            # Atualiza a linha i da matriz A: L_i = L_i - fator * L_k
-            A[i, k:] = A[i, k:] - fator * A[k, k:]
-
-            # Atualiza o vetor b também
-            b[i] = b[i] - fator * b[k]
-
-    # Verificação final para o último elemento da diagonal
-    if A[n - 1, n - 1] == 0:
-        raise ValueError("O sistema não tem solução única (Matriz Singular).")
-
-    # --- ETAPA 2: Substituição Regressiva ---
-    x = np.zeros(n)
-
-    # Começa do último índice (n-1) e vai até 0, voltando de 1 em 1
-    for i in range(n - 1, -1, -1):
-        soma_conhecidos = 0
-        # Soma os termos já encontrados (x[j] onde j > i)
-        for j in range(i + 1, n):
-            soma_conhecidos += A[i, j] * x[j]
-
-        # Isola o x[i]
-        x[i] = (b[i] - soma_conhecidos) / A[i, i]
-
-    return x
+from gauss import CacheFatoracoes, normas_residuais
 
 
 # --- Interface Gráfica ---
@@ -70,6 +17,9 @@ class AppMinas(tk.Tk):
         self.font_label = ("Arial", 10, "bold")
         self.font_entry = ("Arial", 10)
 
+        # Fatorações já calculadas: mudar só a necessidade (B) não refaz a eliminação
+        self.cache_fatoracoes = CacheFatoracoes()
+
         self.criar_interface()
 
     def criar_interface(self):
@@ -151,15 +101,14 @@ class AppMinas(tk.Tk):
                 if not val_b_str: val_b_str = "0"
                 B[i] = float(val_b_str)
 
-            x = resolver_gauss_manual(A, B)
+            x = self.cache_fatoracoes.resolver(A, B)
 
             texto = "SOLUÇÃO:\n\n"
             texto += f"  Mina 1: {x[0]:.2f} m³\n"
             texto += f"  Mina 2: {x[1]:.2f} m³\n"
             texto += f"  Mina 3: {x[2]:.2f} m³\n"
 
-            b_calc = np.dot(A, x)
-            erro = np.linalg.norm(b_calc - B)
+            erro = normas_residuais(A, x, B)
             texto += f"\n  (Erro residual: {erro:.2e})"
 
             self.lbl_resultado.config(text=texto, fg="black")
@@ -1,6 +1,15 @@
 import tkinter as tk
-from tkinter import messagebox
-import math
+from tkinter import filedialog, messagebox
+
+import numpy as np
+
+from esparsa import MatrizCSR
+from gauss_seidel import gauss_seidel, sor
+from instrumentacao import HistoricoConvergencia
+from krylov import bicgstab, gmres
+from partida_quente import CachePartidaQuente
+from reordenacao import reordenar
+from trelica_modelo import Trelica
 
 
 class TrussSolverVisual:
@@ -9,33 +18,17 @@ class TrussSolverVisual:
         self.root.title("Solver Treliça - Resultados Detalhados")
         self.root.geometry("1350x700")
 
-        # --- Definições Físicas da Treliça ---
-        self.var_names = ["F1", "F2", "F3", "F4", "F5", "F6", "F7", "H1", "V1", "V3"]
+        # --- Definições Físicas da Treliça (modelo compartilhado com trelica.py) ---
+        self.modelo = Trelica.exemplo_questao()
+        self.var_names = self.modelo.nomes_incognitas()
         self.num_vars = len(self.var_names)
+        self.num_barras = self.modelo.n_barras
 
-        # Senos e Cossenos
-        s45 = math.sin(math.radians(45))
-        c45 = math.cos(math.radians(45))
-        s60 = math.sin(math.radians(60))
-        c60 = math.cos(math.radians(60))
-        s30 = math.sin(math.radians(30))
-        c30 = math.cos(math.radians(30))
-
-        # MATRIZ (Ordenada para garantir convergência)
-        self.default_matrix = [
-            [-s45, 0, -s45, 0, 0, 0, 0, 0, 0, 0],  # Nó 4 Y
-            [0, -1.0, -c45, 0, c60, 1.0, 0, 0, 0, 0],  # Nó 2 X
-            [0, 0, s45, 0, s60, 0, 0, 0, 0, 0],  # Nó 2 Y
-            [-c45, 0, c45, 1.0, 0, 0, 0, 0, 0, 0],  # Nó 4 X
-            [0, 0, 0, 0, -s60, 0, -s30, 0, 0, 0],  # Nó 5 Y
-            [0, 0, 0, 0, 0, -1.0, -c30, 0, 0, 0],  # Nó 3 X
-            [0, 0, 0, -1.0, -c60, 0, c30, 0, 0, 0],  # Nó 5 X
-            [c45, 1.0, 0, 0, 0, 0, 0, 1.0, 0, 0],  # Nó 1 X
-            [s45, 0, 0, 0, 0, 0, 0, 0, 1.0, 0],  # Nó 1 Y
-            [0, 0, 0, 0, 0, 0, s30, 0, 0, 1.0]  # Nó 3 Y
-        ]
-
-        self.default_b = [500, 0, 0, 0, 100, 0, 0, 0, 0, 0]
+        # MATRIZ montada a partir da geometria e ordenada para garantir convergência
+        A, b = self.modelo.montar()
+        A, b, _ = reordenar(A, b)
+        self.default_matrix = A.para_densa().tolist()
+        self.default_b = (b + 0.0).tolist()
 
         # --- Interface ---
         frame_top = tk.Frame(self.root, pady=10)
@@ -51,9 +44,31 @@ class TrussSolverVisual:
         self.entry_iter.pack(side=tk.LEFT, padx=5)
         self.entry_iter.insert(0, "500")
 
+        # Método iterativo e fator de relaxação ("auto" = estimado durante as primeiras varreduras)
+        tk.Label(frame_top, text="Método:").pack(side=tk.LEFT, padx=10)
+        self.var_metodo = tk.StringVar(value="Gauss-Seidel")
+        tk.OptionMenu(frame_top, self.var_metodo, "Gauss-Seidel", "SOR", "SSOR", "GMRES", "BiCGSTAB").pack(side=tk.LEFT)
+
+        # Pré-condicionador dos métodos de Krylov
+        tk.Label(frame_top, text="Pré-cond.:").pack(side=tk.LEFT, padx=(10, 0))
+        self.var_precond = tk.StringVar(value="ILU em banda")
+        tk.OptionMenu(frame_top, self.var_precond, "Nenhum", "Jacobi", "ILU(0)", "ILU em banda").pack(side=tk.LEFT)
+
+        tk.Label(frame_top, text="ω:").pack(side=tk.LEFT, padx=(10, 0))
+        self.entry_omega = tk.Entry(frame_top, width=6)
+        self.entry_omega.pack(side=tk.LEFT, padx=5)
+        self.entry_omega.insert(0, "auto")
+
+        # Reordenação automática das equações (diagonal dominante)
+        self.var_reordenar = tk.BooleanVar(value=False)
+        tk.Checkbutton(frame_top, text="Reordenar equações", variable=self.var_reordenar).pack(side=tk.LEFT, padx=10)
+
         btn_reset = tk.Button(frame_top, text="Reiniciar Dados", command=self.load_default_data, bg="#FFD700")
         btn_reset.pack(side=tk.LEFT, padx=20)
 
+        btn_hist = tk.Button(frame_top, text="Exportar Histórico", command=self.exportar_historico)
+        btn_hist.pack(side=tk.LEFT, padx=5)
+
         # Botão Calcular Grande
         btn_calc = tk.Button(frame_top, text="CALCULAR FORÇAS AGORA", command=self.solve, bg="#4CAF50", fg="white",
                              font=("Arial", 10, "bold"))
@@ -67,6 +82,11 @@ class TrussSolverVisual:
         self.entries_b = []
         self.entries_x = []
         self.labels_results = []  # Lista para guardar os labels onde a resposta aparecerá
+        self.historico = None  # Histórico de convergência do último cálculo (Gauss-Seidel/SOR)
+        # Soluções anteriores por estrutura: novos cálculos partem da melhor delas em vez de zero
+        self.cache_partida = CachePartidaQuente()
+        # Gauss-Seidel puro de referência (comparação com SOR/SSOR), um por sistema já calculado
+        self.bases_gauss_seidel = {}
 
         self.create_grid()
         self.load_default_data()
@@ -133,7 +153,7 @@ class TrussSolverVisual:
             self.labels_results[i].config(text="---", bg="#F0F0F0", fg="black")
 
             self.entries_b[i].delete(0, tk.END)
-            self.entries_b[i].insert(0, f"{self.default_b[i]}")
+            self.entries_b[i].insert(0, f"{self.default_b[i]:g}")
 
             for j in range(self.num_vars):
                 val = self.default_matrix[i][j]
@@ -145,6 +165,9 @@ class TrussSolverVisual:
             n = self.num_vars
             tol = float(self.entry_error.get())
             max_iter = int(self.entry_iter.get())
+            metodo = self.var_metodo.get()
+            omega_str = self.entry_omega.get().strip().lower()
+            omega = None if omega_str in ("", "auto") else float(omega_str)
 
             A = []
             B = []
@@ -159,40 +182,67 @@ class TrussSolverVisual:
                     row.append(float(self.entries_matrix[i][j].get()))
                 A.append(row)
 
-            # Gauss-Seidel Loop
-            converged = False
-            iters = 0
-
-            for k in range(max_iter):
-                x_old = x[:]
-                max_err = 0.0
-
-                for i in range(n):
-                    sigma = 0
-                    for j in range(n):
-                        if j != i: sigma += A[i][j] * x[j]
-
-                    if abs(A[i][i]) < 1e-9:
-                        messagebox.showerror("Erro", f"Divisão por zero na linha {i + 1}")
-                        return
-
-                    x[i] = (B[i] - sigma) / A[i][i]
-
-                    if abs(x[i]) > 1e-9:
-                        err = abs((x[i] - x_old[i]) / x[i])
-                    else:
-                        err = abs(x[i] - x_old[i])
-
-                    if err > max_err: max_err = err
-
-                if max_err < tol:
-                    converged = True
-                    iters = k + 1
-                    break
+            # Gauss-Seidel / SOR / SSOR (núcleo vetorizado em gauss_seidel.py), só sobre os não nulos
+            A_csr = MatrizCSR.de_densa(A)
+            reordenar = self.var_reordenar.get()
+            self.historico = None
+            try:
+                # Partida quente: chute a partir das soluções anteriores da mesma estrutura
+                x_informado = x
+                chave_metodo = (metodo, omega is None)
+                if omega is None and metodo in ("SOR", "SSOR"):
+                    x, partida, omega = self.cache_partida.chute_adaptativo(A_csr, B, x, chave_metodo)
+                else:
+                    x, partida = self.cache_partida.chute(A_csr, B, x)
+
+                if metodo == "Gauss-Seidel":
+                    self.historico = HistoricoConvergencia()
+                    resultado = gauss_seidel(A_csr, B, x0=x, tol=tol, max_iter=max_iter, reordenar=reordenar,
+                                             historico=self.historico)
+                elif metodo in ("GMRES", "BiCGSTAB"):
+                    precond = {"Nenhum": None, "Jacobi": "jacobi", "ILU(0)": "ilu",
+                               "ILU em banda": "ilu_banda"}[self.var_precond.get()]
+                    krylov = gmres if metodo == "GMRES" else bicgstab
+                    resultado = krylov(A_csr, B, x0=x, tol=tol, max_iter=max_iter, precond=precond,
+                                       reordenar=reordenar)
+                else:
+                    self.historico = HistoricoConvergencia()
+                    resultado = sor(A_csr, B, x0=x, tol=tol, max_iter=max_iter, omega=omega,
+                                    simetrico=(metodo == "SSOR"), reordenar=reordenar, historico=self.historico)
+                    base = self.gauss_seidel_base(A_csr, B, x_informado, tol, max_iter, reordenar)
+                economia = self.cache_partida.registrar(A_csr, B, resultado, partida, chave_metodo)
+            except ValueError as e:
+                messagebox.showerror("Erro", str(e))
+                return
+
+            x = resultado.x
+            converged = resultado.convergiu
+            iters = resultado.iteracoes
+            max_err = resultado.erro
+
+            info_extra = ""
+            if resultado.ordem is not None:
+                info_extra = " | Ordem das equações: " + ", ".join(str(i + 1) for i in resultado.ordem)
+
+            if partida not in ("fria", "informada"):
+                economizadas = "?" if economia is None else economia
+                info_extra += f" | Partida {partida.replace('_', ' ')}: {economizadas} iterações economizadas"
+
+            if self.historico is not None and len(self.historico) > 1:
+                info_extra += f" | Taxa de convergência: {self.historico.taxa_convergencia():.3f}/iteração"
+
+            if metodo in ("GMRES", "BiCGSTAB"):
+                info_extra = f" | {metodo} + {self.var_precond.get()} (erro = resíduo relativo)" + info_extra
+            elif metodo != "Gauss-Seidel":
+                info_extra = f" | {metodo} ω = {resultado.omega:.3f}" + info_extra
+                if converged and base.convergiu:
+                    info_extra += f" | Iterações economizadas vs Gauss-Seidel: {base.iteracoes - iters}"
+                elif converged:
+                    info_extra += " | Gauss-Seidel puro não convergiu"
 
             # --- EXIBIR RESULTADOS NA TABELA ---
             if converged:
-                self.status_label.config(text=f"Convergência alcançada em {iters} iterações. Erro final: {max_err:.6e}",
+                self.status_label.config(text=f"Convergência alcançada em {iters} iterações. Erro final: {max_err:.6e}{info_extra}",
                                          fg="green")
 
                 for i in range(n):
@@ -203,7 +253,7 @@ class TrussSolverVisual:
                     cor_fundo = "#FFFFFF"
                     cor_texto = "black"
 
-                    if i < 7:  # Se for Força (F1 a F7)
+                    if i < self.num_barras:  # Se for Força nas barras (F1 a F7)
                         if val > 0:
                             tipo = " (TRAÇÃO)"
                             cor_texto = "blue"
@@ -222,7 +272,10 @@ class TrussSolverVisual:
                     self.labels_results[i].config(text=texto_final, fg=cor_texto, bg=cor_fundo)
 
             else:
-                self.status_label.config(text=f"FALHA: Não convergiu após {max_iter} iterações. Erro atual: {max_err}",
+                if metodo not in ("GMRES", "BiCGSTAB"):
+                    # A reordenação não cria dominância diagonal nas treliças: GS/SOR podem divergir
+                    info_extra += " | Tente GMRES + ILU em banda"
+                self.status_label.config(text=f"FALHA: Não convergiu após {max_iter} iterações. Erro atual: {max_err}{info_extra}",
                                          fg="red")
                 for lbl in self.labels_results:
                     lbl.config(text="Não convergiu", bg="red", fg="white")
@@ -230,8 +283,39 @@ class TrussSolverVisual:
         except ValueError:
             messagebox.showerror("Erro", "Verifique os números inseridos.")
 
+    def gauss_seidel_base(self, A_csr, B, x0, tol, max_iter, reordenar):
+        """
+        Referência para comparar com SOR/SSOR: Gauss-Seidel puro, a partir do chute digitado,
+        com os mesmos dados. Calculado uma vez por sistema; os cliques seguintes reaproveitam.
+        """
+        chave = (A_csr.data.tobytes(), A_csr.indices.tobytes(), A_csr.indptr.tobytes(),
+                 np.asarray(B, dtype=float).tobytes(), np.asarray(x0, dtype=float).tobytes(),
+                 tol, max_iter, reordenar)
+        if chave not in self.bases_gauss_seidel:
+            if len(self.bases_gauss_seidel) >= 16:
+                self.bases_gauss_seidel.clear()
+            self.bases_gauss_seidel[chave] = gauss_seidel(A_csr, B, x0=x0, tol=tol, max_iter=max_iter,
+                                                          reordenar=reordenar)
+        return self.bases_gauss_seidel[chave]
+
+    def exportar_historico(self):
+        if self.historico is None or not len(self.historico):
+            messagebox.showinfo("Histórico", "Calcule com Gauss-Seidel, SOR ou SSOR antes de exportar.")
+            return
+
+        caminho = filedialog.asksaveasfilename(defaultextension=".csv",
+                                               filetypes=[("CSV", "*.csv"), ("JSON", "*.json")])
+        if not caminho:
+            return
+
+        if caminho.lower().endswith(".json"):
+            self.historico.para_json(caminho)
+        else:
+            self.historico.para_csv(caminho)
+        self.status_label.config(text=f"Histórico exportado para {caminho}", fg="black")
+
 
 if __name__ == "__main__":
     root = tk.Tk()
     app = TrussSolverVisual(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
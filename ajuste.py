@@ -0,0 +1,451 @@
+import numpy as np
+
+
+# --- MÍNIMOS QUADRADOS GENERALIZADO (famílias de modelos linearizáveis) ---
+#
+# Todo modelo vira um problema linear X·c ≈ Y (após linearização), resolvido por QR
+# ou SVD sobre X com colunas normalizadas — sem formar o sistema normal XᵀX, que
+# eleva ao quadrado o número de condição. O sistema normal só aparece na memória
+# de cálculo, para conferência com os slides.
+
+
+class Modelo:
+    """Família de modelos: matriz de projeto X(x), transformação de y e parâmetros finais."""
+
+    nome = ""
+
+    def preparar(self, x, y):
+        """Valida os dados (e guarda o que o modelo precisar deles, ex.: domínio)."""
+
+    def matriz(self, x):
+        raise NotImplementedError
+
+    def transformar_y(self, y):
+        return y
+
+    def destransformar_y(self, y):
+        return y
+
+    def avaliar(self, x, coef):
+        return self.destransformar_y(self.matriz(np.asarray(x, dtype=float)) @ coef)
+
+    def parametros(self, coef):
+        raise NotImplementedError
+
+    def equacao(self, coef, nome_x="x", nome_y="y"):
+        raise NotImplementedError
+
+
+class _ModeloDoisParametros(Modelo):
+    """Y = B + A·X com X = tx(x) e Y = ty(y); os parâmetros finais são alpha e beta."""
+
+    log_x = False     # X = ln(x) em vez de X = x
+
+    def tx(self, x):
+        return x
+
+    def matriz(self, x):
+        return np.column_stack([np.ones(len(x)), self.tx(x)])
+
+    def alpha(self, B):
+        return B
+
+    def parametros(self, coef):
+        return {"alpha": self.alpha(coef[0]), "beta": coef[1]}
+
+
+class ModeloLinear(_ModeloDoisParametros):
+    nome = "linear"
+
+    def equacao(self, coef, nome_x="x", nome_y="y"):
+        return f"{nome_y} = {coef[0]:.4e} + {coef[1]:.5f} * {nome_x}"
+
+
+class ModeloExponencial(_ModeloDoisParametros):
+    """y = alpha · base^(beta·x), linearizado como log_base(y) = log_base(alpha) + beta·x."""
+
+    nome = "exponencial"
+
+    def __init__(self, base=np.e):
+        self.base = base
+        self._log_base = np.log(base)
+        self.texto_base = "e" if base == np.e else f"{base:g}"
+        self.texto_log = {np.e: "ln", 10: "log10", 2: "log2"}.get(base, f"log_{base:g}")
+
+    def preparar(self, x, y):
+        if np.any(y <= 0):
+            raise ValueError("O modelo exponencial exige y > 0.")
+
+    def transformar_y(self, y):
+        return np.log(y) / self._log_base
+
+    def destransformar_y(self, y):
+        return self.base ** y
+
+    def alpha(self, B):
+        return self.base ** B
+
+    def equacao(self, coef, nome_x="x", nome_y="y"):
+        return f"{nome_y} = {self.alpha(coef[0]):.4e} * {self.texto_base}^({coef[1]:.5f} * {nome_x})"
+
+
+class ModeloPotencia(_ModeloDoisParametros):
+    """y = alpha · x^beta, linearizado como ln(y) = ln(alpha) + beta·ln(x)."""
+
+    nome = "potencia"
+    log_x = True
+    texto_base = "e"
+    texto_log = "ln"
+
+    def preparar(self, x, y):
+        if np.any(x <= 0) or np.any(y <= 0):
+            raise ValueError("O modelo de potência exige x > 0 e y > 0.")
+
+    def tx(self, x):
+        return np.log(x)
+
+    def transformar_y(self, y):
+        return np.log(y)
+
+    def destransformar_y(self, y):
+        return np.exp(y)
+
+    def alpha(self, B):
+        return np.exp(B)
+
+    def equacao(self, coef, nome_x="x", nome_y="y"):
+        return f"{nome_y} = {self.alpha(coef[0]):.4e} * {nome_x}^{coef[1]:.5f}"
+
+
+class ModeloLogaritmico(_ModeloDoisParametros):
+    """y = alpha + beta·ln(x)."""
+
+    nome = "logaritmico"
+    log_x = True
+
+    def preparar(self, x, y):
+        if np.any(x <= 0):
+            raise ValueError("O modelo logarítmico exige x > 0.")
+
+    def tx(self, x):
+        return np.log(x)
+
+    def equacao(self, coef, nome_x="x", nome_y="y"):
+        return f"{nome_y} = {coef[0]:.4e} + {coef[1]:.5f} * ln({nome_x})"
+
+
+class ModeloPolinomial(Modelo):
+    """
+    y = c0 + c1·x + ... + ck·x^k. A matriz de projeto usa x mapeado para [-1, 1]
+    (domínio dos dados), o que mantém a Vandermonde bem condicionada; os
+    coeficientes reportados são convertidos para a base de potências de x.
+    """
+
+    nome = "polinomial"
+
+    def __init__(self, grau):
+        if grau < 0:
+            raise ValueError("O grau do polinômio deve ser >= 0.")
+        self.grau = int(grau)
+        self.dominio = (-1.0, 1.0)
+
+    def preparar(self, x, y):
+        if len(np.unique(x)) <= self.grau:
+            raise ValueError(f"Grau {self.grau} exige pelo menos {self.grau + 1} valores distintos de x.")
+        lo, hi = float(np.min(x)), float(np.max(x))
+        self.dominio = (lo, hi) if hi > lo else (lo - 1.0, lo + 1.0)
+
+    def _mapear(self, x):
+        lo, hi = self.dominio
+        return (2 * x - (lo + hi)) / (hi - lo)
+
+    def matriz(self, x):
+        return np.vander(self._mapear(x), self.grau + 1, increasing=True)
+
+    def _polinomio(self, coef):
+        return np.polynomial.Polynomial(coef, domain=self.dominio, window=(-1, 1)).convert()
+
+    def parametros(self, coef):
+        potencias = self._polinomio(coef).coef
+        potencias = np.pad(potencias, (0, self.grau + 1 - len(potencias)))
+        return {f"c{j}": c for j, c in enumerate(potencias)}
+
+    def equacao(self, coef, nome_x="x", nome_y="y"):
+        termos = [f"{c:+.6g}" + (f" * {nome_x}^{j}" if j > 1 else f" * {nome_x}" if j == 1 else "")
+                  for j, c in enumerate(self.parametros(coef).values())]
+        return f"{nome_y} = " + " ".join(termos)
+
+
+def criar_modelo(familia, grau=1, base=np.e):
+    """'linear', 'polinomial' (grau), 'exponencial' (base), 'potencia' ou 'logaritmico'."""
+    if isinstance(familia, Modelo):
+        return familia
+    if familia == "linear":
+        return ModeloLinear()
+    if familia == "polinomial":
+        return ModeloPolinomial(grau)
+    if familia == "exponencial":
+        return ModeloExponencial(base)
+    if familia == "potencia":
+        return ModeloPotencia()
+    if familia == "logaritmico":
+        return ModeloLogaritmico()
+    raise ValueError(f"Família de modelos desconhecida: {familia}")
+
+
+# --- RESOLUÇÃO (QR / SVD) ---
+
+def resolver_minimos_quadrados(X, Y, metodo="qr"):
+    """
+    min ||X·c - Y||₂ por QR (padrão) ou SVD. As colunas de X são normalizadas antes.
+    Retorna (c, posto, numero_condicao). Com X de posto incompleto, o QR recorre à SVD
+    (solução de norma mínima).
+    """
+    escala = np.linalg.norm(X, axis=0)
+    escala[escala == 0] = 1.0
+    Xs = X / escala
+    p = X.shape[1]
+
+    if metodo == "qr":
+        # QR de [X | Y] sem formar Q: o bloco p x p é R e a última coluna é Qᵀ·Y
+        R_aumentada = np.linalg.qr(np.column_stack([Xs, Y]), mode="r")
+        R, qty = R_aumentada[:p, :p], R_aumentada[:p, p]
+        diag = np.abs(np.diagonal(R))
+        tolerancia = max(X.shape) * np.finfo(float).eps * diag.max()
+        if np.all(diag > tolerancia):
+            c = np.linalg.solve(R, qty)
+            s = np.linalg.svd(R, compute_uv=False)  # R é p x p: barato
+            return c / escala, p, float(s[0] / s[-1])
+        metodo = "svd"
+
+    if metodo != "svd":
+        raise ValueError(f"Método de resolução desconhecido: {metodo}")
+    c, _, posto, s = np.linalg.lstsq(Xs, Y, rcond=None)
+    condicao = float(s[0] / s[-1]) if s[-1] > 0 else float("inf")
+    return c / escala, int(posto), condicao
+
+
+class ResultadoAjuste:
+    """Coeficientes (espaço linearizado), parâmetros do modelo, qualidade e memória de cálculo."""
+
+    def __init__(self, modelo, coeficientes, r2, norma_residuo, posto, condicao, n_pontos, memoria=None):
+        self.modelo = modelo
+        self.coeficientes = coeficientes
+        self.parametros = modelo.parametros(coeficientes)
+        self.r2 = r2
+        self.norma_residuo = norma_residuo
+        self.posto = posto
+        self.condicao = condicao
+        self.n_pontos = n_pontos
+        self.memoria = memoria
+
+    def prever(self, x):
+        return self.modelo.avaliar(x, self.coeficientes)
+
+    def equacao(self, nome_x="x", nome_y="y"):
+        return self.modelo.equacao(self.coeficientes, nome_x, nome_y)
+
+    def __repr__(self):
+        parametros = ", ".join(f"{k}={v:.6g}" for k, v in self.parametros.items())
+        return f"ResultadoAjuste({self.modelo.nome}: {parametros}, r2={self.r2:.6f}, n={self.n_pontos})"
+
+
+def ajustar(x, y, familia="linear", grau=1, base=np.e, metodo="qr", memoria=False,
+            nome_x="x", nome_y="y"):
+    """
+    Ajusta a família de modelos aos dados (vetorizado; milhões de pontos cabem em
+    uma única fatoração). R² e resíduo são medidos no espaço linearizado.
+    Com memoria=True gera também o texto passo a passo (ResultadoAjuste.memoria).
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    if len(x) != len(y):
+        raise ValueError("x e y devem ter o mesmo número de pontos.")
+
+    modelo = criar_modelo(familia, grau, base)
+    modelo.preparar(x, y)
+    X = modelo.matriz(x)
+    if len(x) < X.shape[1]:
+        raise ValueError(f"São necessários pelo menos {X.shape[1]} pontos.")
+    Y = modelo.transformar_y(y)
+
+    coef, posto, condicao = resolver_minimos_quadrados(X, Y, metodo)
+
+    residuo = Y - X @ coef
+    soma_total = np.sum((Y - Y.mean()) ** 2)
+    r2 = 1.0 - float(residuo @ residuo) / soma_total if soma_total > 0 else 1.0
+
+    texto = memoria_calculo(modelo, x, Y, coef, metodo, nome_x, nome_y) if memoria else None
+    return ResultadoAjuste(modelo, coef, r2, float(np.linalg.norm(residuo)), posto, condicao, len(x), texto)
+
+
+# --- MEMÓRIA DE CÁLCULO (texto passo a passo) ---
+
+def memoria_calculo(modelo, x, Y, coef, metodo="qr", nome_x="x", nome_y="y"):
+    """Texto didático: somatórios, sistema normal, solução e modelo final."""
+    if isinstance(modelo, _ModeloDoisParametros):
+        X = modelo.tx(x)
+        somas = (len(X), np.sum(X), np.sum(X ** 2), np.sum(Y), np.sum(X * Y))
+        return _memoria_dois_parametros(modelo, somas, coef, metodo, nome_x, nome_y)
+    return _memoria_polinomial(modelo, x, Y, coef, metodo, nome_x, nome_y)
+
+
+def _nota_metodo(metodo):
+    if metodo == "welford":
+        return "(resolvido pelas somas centradas na média, sem inverter o sistema normal)\n"
+    return f"(resolvido por {metodo.upper()}, sem inverter o sistema normal)\n"
+
+
+def _memoria_dois_parametros(modelo, somas, coef, metodo, nome_x, nome_y):
+    n_pontos, sum_x, sum_x2, sum_y, sum_xy = somas
+    B_linear, A_angular = coef
+    alpha = modelo.alpha(B_linear)
+
+    onde_x = f"  (onde x = ln({nome_x}))" if modelo.log_x else ""
+    texto_log = getattr(modelo, "texto_log", None)
+    onde_y = f"  (onde y = {texto_log}({nome_y}))" if texto_log else ""
+    texto_alpha = f"alpha = {modelo.texto_base}^B" if texto_log else "alpha = B"
+
+    return (
+        f"PASSO 1: TABELA DE SOMATÓRIOS (n={n_pontos})\n"
+        f"--------------------------------------------\n"
+        f"Σ x    = {sum_x:,.2f}{onde_x}\n"
+        f"Σ x²   = {sum_x2:,.2f}\n"
+        f"Σ y    = {sum_y:,.4f}{onde_y}\n"
+        f"Σ x·y  = {sum_xy:,.4f}\n\n"
+        f"PASSO 2: SISTEMA NORMAL (Matriz)\n"
+        f"--------------------------------------------\n"
+        f"[{n_pontos}       {sum_x:,.0f}   ] [ B ]   [ {sum_y:.4f}   ]\n"
+        f"[{sum_x:,.0f}   {sum_x2:,.0f} ] [ A ] = [ {sum_xy:.4f} ]\n\n"
+        f"PASSO 3: SOLUÇÃO DO SISTEMA\n"
+        f"--------------------------------------------\n"
+        f"{_nota_metodo(metodo)}"
+        f"B (Linear/Intercepto) = {B_linear:.6f}\n"
+        f"A (Angular/Inclinação)= {A_angular:.6f}\n\n"
+        f"PASSO 4: MODELO FINAL\n"
+        f"--------------------------------------------\n"
+        f"{texto_alpha} = {alpha:.4e}\n"
+        f"Equação: {modelo.equacao(coef, nome_x, nome_y)}"
+    )
+
+
+def _memoria_polinomial(modelo, x, Y, coef, metodo, nome_x, nome_y):
+    p = modelo.grau + 1
+    # Somatórios Σ x^k (k = 0..2·grau) e Σ x^k·y (k = 0..grau), na base de potências
+    potencias = np.vander(x, 2 * p - 1, increasing=True)
+    somas_x = potencias.sum(axis=0)
+    somas_xy = potencias[:, :p].T @ Y
+    normal = somas_x[np.add.outer(np.arange(p), np.arange(p))]
+
+    linhas_somas = "".join(f"Σ x^{k:<3}= {s:,.6g}\n" for k, s in enumerate(somas_x))
+    linhas_somas += "".join(f"Σ x^{k}·y = {s:,.6g}\n" for k, s in enumerate(somas_xy))
+    linhas_sistema = "".join("[ " + "  ".join(f"{v:12.5g}" for v in linha) + f" ] [ c{i} ]   [ {somas_xy[i]:12.5g} ]\n"
+                             for i, linha in enumerate(normal))
+    linhas_coef = "".join(f"c{j} = {c:.8g}\n" for j, c in enumerate(modelo.parametros(coef).values()))
+
+    return (
+        f"PASSO 1: TABELA DE SOMATÓRIOS (n={len(x)}, grau {modelo.grau})\n"
+        f"--------------------------------------------\n"
+        f"{linhas_somas}\n"
+        f"PASSO 2: SISTEMA NORMAL (Matriz)\n"
+        f"--------------------------------------------\n"
+        f"{linhas_sistema}\n"
+        f"PASSO 3: SOLUÇÃO DO SISTEMA\n"
+        f"--------------------------------------------\n"
+        f"{_nota_metodo(metodo)}"
+        f"(x mapeado para [-1, 1] no domínio [{modelo.dominio[0]:g}, {modelo.dominio[1]:g}])\n"
+        f"{linhas_coef}\n"
+        f"PASSO 4: MODELO FINAL\n"
+        f"--------------------------------------------\n"
+        f"Equação: {modelo.equacao(coef, nome_x, nome_y)}"
+    )
+
+
+# --- MMQ EM FLUXO (estatísticas suficientes acumuláveis e mescláveis) ---
+
+class AcumuladorMMQ:
+    """
+    MMQ de dois parâmetros (Y = B + A·X) sem guardar os pontos: acumula n, as médias
+    de X e Y e os somatórios centrados Sxx, Sxy, Syy (estilo Welford/Chan). Somas
+    centradas não perdem precisão com anos perto de 2000, ao contrário de Σx² cru.
+
+    adicionar() recebe blocos (ou pontos soltos) de qualquer tamanho; mesclar() junta
+    acumuladores de processos diferentes; ajuste() pode ser chamado a qualquer momento.
+    """
+
+    def __init__(self, familia="linear", base=np.e):
+        self.modelo = criar_modelo(familia, base=base)
+        if not isinstance(self.modelo, _ModeloDoisParametros):
+            raise ValueError("O acumulador trabalha com modelos de dois parâmetros (não polinomial).")
+        self.n = 0
+        self.media_x = 0.0
+        self.media_y = 0.0
+        self.sxx = 0.0
+        self.sxy = 0.0
+        self.syy = 0.0
+
+    def _combinar(self, n, media_x, media_y, sxx, sxy, syy):
+        if n == 0:
+            return
+        total = self.n + n
+        dx = media_x - self.media_x
+        dy = media_y - self.media_y
+        peso = self.n * n / total
+        self.media_x += dx * n / total
+        self.media_y += dy * n / total
+        self.sxx += sxx + dx * dx * peso
+        self.sxy += sxy + dx * dy * peso
+        self.syy += syy + dy * dy * peso
+        self.n = total
+
+    def adicionar(self, x, y):
+        """Acrescenta um bloco de pontos: estatísticas do bloco (vetorizadas) + fórmula de Chan."""
+        x = np.atleast_1d(np.asarray(x, dtype=float)).ravel()
+        y = np.atleast_1d(np.asarray(y, dtype=float)).ravel()
+        if len(x) != len(y):
+            raise ValueError("x e y devem ter o mesmo número de pontos.")
+        if len(x) == 0:
+            return self
+        self.modelo.preparar(x, y)
+        X = self.modelo.tx(x)
+        Y = self.modelo.transformar_y(y)
+
+        mx, my = X.mean(), Y.mean()
+        cx, cy = X - mx, Y - my
+        self._combinar(len(X), mx, my, cx @ cx, cx @ cy, cy @ cy)
+        return self
+
+    def consumir(self, blocos):
+        """Ingere um iterável de blocos (n, 2) com colunas x, y — ex.: lidos de um arquivo."""
+        for bloco in blocos:
+            bloco = np.asarray(bloco, dtype=float)
+            self.adicionar(bloco[:, 0], bloco[:, 1])
+        return self
+
+    def mesclar(self, outro):
+        if type(outro.modelo) is not type(self.modelo) or \
+                getattr(outro.modelo, "base", None) != getattr(self.modelo, "base", None):
+            raise ValueError("Só é possível mesclar acumuladores do mesmo modelo.")
+        self._combinar(outro.n, outro.media_x, outro.media_y, outro.sxx, outro.sxy, outro.syy)
+        return self
+
+    def __iadd__(self, outro):
+        return self.mesclar(outro)
+
+    def somas(self):
+        """(n, Σx, Σx², Σy, Σx·y) reconstruídos das somas centradas (para exibição)."""
+        n, mx, my = self.n, self.media_x, self.media_y
+        return n, n * mx, self.sxx + n * mx * mx, n * my, self.sxy + n * mx * my
+
+    def ajuste(self, memoria=False, nome_x="x", nome_y="y"):
+        if self.n < 2 or self.sxx <= 0:
+            raise ValueError("São necessários pelo menos 2 valores distintos de x.")
+        A = self.sxy / self.sxx
+        B = self.media_y - A * self.media_x
+        coef = np.array([B, A])
+
+        sse = max(self.syy - A * self.sxy, 0.0)
+        r2 = 1.0 - sse / self.syy if self.syy > 0 else 1.0
+        texto = (_memoria_dois_parametros(self.modelo, self.somas(), coef, "welford", nome_x, nome_y)
+                 if memoria else None)
+        return ResultadoAjuste(self.modelo, coef, r2, float(np.sqrt(sse)), 2, float("nan"), self.n, texto)
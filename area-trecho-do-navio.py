@@ -1,8 +1,20 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+from grafico import PerfilCasco
+from navio import SecaoIncremental
+from quadratura import integrar, simpson
+
+# Métodos com estimativa de erro oferecidos na interface (rótulo -> quadratura.integrar)
+METODOS_EXTRAS = {
+    "Simpson 3/8 na cauda": "simpson38",
+    "Romberg": "romberg",
+    "Gauss-Legendre (spline)": "gauss_spline",
+    "Simpson 1/3 + trapézio": "simpson",
+    "Trapézios": "trapezios",
+}
+
+# tkinter e matplotlib só são importados quando uma janela é aberta: quem usa
+# apenas as funções de integração não paga a inicialização da interface.
 
 
 class NavioInterativoApp:
@@ -14,10 +26,17 @@ class NavioInterativoApp:
         # --- VALORES INICIAIS DA QUESTÃO ---
         self.default_h = "0.4"
         self.default_y = "3.00, 2.92, 2.75, 2.52, 2.30, 1.84, 0.92, 0.00"
+        # Somas parciais da última seção integrada (só as cotas editadas são refeitas)
+        self.secao = None
         self.setup_ui()
         self.calcular_e_plotar()
 
     def setup_ui(self):
+        import tkinter as tk
+        from tkinter import ttk
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # --- Painel Esquerdo (Controles) ---
         panel_left = ttk.Frame(self.root, padding=20)
         panel_left.pack(side=tk.LEFT, fill=tk.Y)
@@ -37,7 +56,20 @@ class NavioInterativoApp:
 
         self.ent_y = tk.Text(panel_left, height=4, font=("Arial", 12), width=30)
         self.ent_y.insert(tk.END, self.default_y)  # Preenche valores iniciais
-        self.ent_y.pack(fill=tk.X, pady=(5, 20))
+        self.ent_y.pack(fill=tk.X, pady=(5, 15))
+
+        # Profundidades opcionais (espaçamento não uniforme; substitui h)
+        ttk.Label(panel_left, text="Profundidades (opcional):", font=("Arial", 12)).pack(anchor="w")
+        ttk.Label(panel_left, text="(Espaçamento não uniforme; se vazio usa h)", font=("Arial", 9, "italic"),
+                  foreground="gray").pack(anchor="w")
+        self.ent_z = ttk.Entry(panel_left, font=("Arial", 12))
+        self.ent_z.pack(fill=tk.X, pady=(5, 15))
+
+        # Método extra com estimativa de erro
+        ttk.Label(panel_left, text="Método com estimativa de erro:", font=("Arial", 12)).pack(anchor="w")
+        self.var_metodo = tk.StringVar(value=next(iter(METODOS_EXTRAS)))
+        ttk.Combobox(panel_left, textvariable=self.var_metodo, values=list(METODOS_EXTRAS), state="readonly",
+                     font=("Arial", 12)).pack(fill=tk.X, pady=(5, 20))
 
         # Botão Calcular
         btn_calc = ttk.Button(panel_left, text="RECALCULAR", command=self.calcular_e_plotar)
@@ -55,6 +87,10 @@ class NavioInterativoApp:
                                   foreground="#003366")
         self.lbl_simp.pack(anchor="w", pady=5)
 
+        self.lbl_extra = ttk.Label(res_frame, text="", font=("Courier New", 12, "bold"), foreground="#006633",
+                                   wraplength=300)
+        self.lbl_extra.pack(anchor="w", pady=5)
+
         self.lbl_info_simp = ttk.Label(res_frame, text="", font=("Arial", 9, "italic"), foreground="red",
                                        wraplength=250)
         self.lbl_info_simp.pack(anchor="w", pady=(10, 0))
@@ -63,11 +99,18 @@ class NavioInterativoApp:
         panel_right = ttk.Frame(self.root)
         panel_right.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
-        self.fig, self.ax = plt.subplots(figsize=(5, 5))
+        self.fig = Figure(figsize=(5, 5))
+        self.ax = self.fig.subplots()
         self.canvas = FigureCanvasTkAgg(self.fig, master=panel_right)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+        # Artistas do perfil criados uma vez; recalcular só troca os dados
+        self.perfil = PerfilCasco(self.ax)
+
     def get_dados(self):
+        import tkinter as tk
+        from tkinter import messagebox
+
         try:
             h = float(self.ent_h.get().replace(',', '.'))
 
@@ -76,89 +119,68 @@ class NavioInterativoApp:
             # Divide por vírgula e converte para float array
             y_list = [float(val.strip()) for val in raw_y.split(',')]
 
-            return h, np.array(y_list)
+            raw_z = self.ent_z.get().strip()
+            z = np.array([float(val.strip()) for val in raw_z.split(',')]) if raw_z else None
+
+            return h, np.array(y_list), z
         except ValueError:
             messagebox.showerror("Erro de Formato",
                                  "Certifique-se de usar números válidos.\nUse ponto (.) para decimais e vírgula (,) para separar as larguras.")
-            return None, None
+            return None, None, None
 
     def calcular_e_plotar(self):
-        h, y = self.get_dados()
-        if h is None or y is None: return
+        from tkinter import messagebox
 
-        n_intervalos = len(y) - 1
+        h, y, z = self.get_dados()
+        if h is None or y is None: return
 
-        if n_intervalos < 1:
-            messagebox.showerror("Erro", "É necessário pelo menos 2 pontos (1 intervalo).")
+        try:
+            if z is None:
+                area_trap, area_simp, info_msg = self.sincronizar_secao(h, y).integrar()
+                z = np.arange(len(y)) * h
+            else:
+                area_trap = integrar(y, z=z, metodo="trapezios").area  # valida as profundidades
+                area_simp = simpson(z, y)
+                info_msg = "Espaçamento não uniforme: Simpson em pares de intervalos"
+        except ValueError as e:
+            messagebox.showerror("Erro", str(e))
             return
 
-        # --- CÁLCULO 1: Regra dos Trapézios Repetida ---
-        # Formula: h/2 * (y_inicial + 2*soma_meio + y_final)
-        area_trap = (h / 2) * (y[0] + 2 * np.sum(y[1:-1]) + y[-1])
-
-        # --- CÁLCULO 2: Regra de Simpson (Adaptativa) ---
-        area_simp = 0
-        info_msg = ""
-
-        # Verifica paridade dos intervalos
-        if n_intervalos % 2 == 0:
-            # Caso ideal: Número par de intervalos -> Simpson Puro
-            # Formula: h/3 * (y0 + 4*Impares + 2*Pares + yn)
-            soma_impares = np.sum(y[1:-1:2])  # Índices 1, 3, 5...
-            soma_pares = np.sum(y[2:-1:2])  # Índices 2, 4, 6...
-            area_simp = (h / 3) * (y[0] + 4 * soma_impares + 2 * soma_pares + y[-1])
-            info_msg = "Método: Simpson 1/3 Puro (N par)"
-
-        else:
-            # Caso da questão: Número ímpar de intervalos -> Simpson Misto
-            # Estratégia: Simpson até o penúltimo ponto + Trapézio no último
-
-            # Parte A: Simpson (0 até n-1)
-            y_simp = y[:-1]  # Remove o último ponto
-            soma_impares = np.sum(y_simp[1:-1:2])
-            soma_pares = np.sum(y_simp[2:-1:2])
-            area_parte_simp = (h / 3) * (y_simp[0] + 4 * soma_impares + 2 * soma_pares + y_simp[-1])
-
-            # Parte B: Trapézio (último intervalo)
-            area_parte_trap = (h / 2) * (y[-2] + y[-1])
-
-            area_simp = area_parte_simp + area_parte_trap
-            info_msg = f"Atenção: N={n_intervalos} (ímpar).\nMétodo Misto aplicado:\nSimpson (0-{n_intervalos - 1}) + Trapézio ({n_intervalos - 1}-{n_intervalos})"
+        try:
+            extra = integrar(y, z=z, metodo=METODOS_EXTRAS[self.var_metodo.get()])
+            texto_extra = f"{self.var_metodo.get()}:\n{extra.area:.4f} ± {extra.erro:.1e} m²"
+        except ValueError as e:
+            texto_extra = f"{self.var_metodo.get()}: {e}"
 
         # Atualiza Labels
         self.lbl_trap.config(text=f"Trapézios: {area_trap:.4f} m²")
         self.lbl_simp.config(text=f"Simpson:   {area_simp:.4f} m²")
+        self.lbl_extra.config(text=texto_extra)
         self.lbl_info_simp.config(text=info_msg)
 
         # Plota Gráfico
-        self.plotar_casco(h, y)
-
-    def plotar_casco(self, h, y):
-        self.ax.clear()
-
-        # Coordenadas de profundidade (0, -0.4, -0.8...)
-        profundidades = -np.arange(len(y)) * h
+        self.plotar_casco(z, y)
 
-        # Desenha o perfil direito
-        self.ax.plot(y, profundidades, 'o-', color='navy', linewidth=2, label='Casco')
-        # Linha de centro
-        self.ax.axvline(0, color='black', linestyle='-', linewidth=0.5)
+    def sincronizar_secao(self, h, y):
+        """Aplica à seção incremental só as cotas que mudaram e as acrescentadas no fim."""
+        secao = self.secao
+        if secao is None or secao.h != h or len(y) < len(secao):
+            self.secao = SecaoIncremental(h, y)
+            return self.secao
 
-        # Preenchimento
-        self.ax.fill_betweenx(profundidades, 0, y, color='skyblue', alpha=0.6, label='Área Integrada')
-
-        # Estética
-        self.ax.set_title("Perfil da Seção Transversal", fontsize=14)
-        self.ax.set_xlabel("Largura (m)")
-        self.ax.set_ylabel("Profundidade (m)")
-        self.ax.grid(True, linestyle='--', alpha=0.5)
-        self.ax.legend()
-        self.ax.set_aspect('equal')  # Mantém a proporção visual correta
-
-        self.canvas.draw()
+        n = len(secao)
+        for i in np.flatnonzero(secao.y != y[:n]):
+            secao.alterar(i, y[i])
+        for valor in y[n:]:
+            secao.acrescentar(valor)
+        return secao
 
+    def plotar_casco(self, z, y):
+        self.perfil.atualizar(z, y)
 
 if __name__ == "__main__":
+    import tkinter as tk
+
     root = tk.Tk()
     app = NavioInterativoApp(root)
     root.mainloop()
\ No newline at end of file
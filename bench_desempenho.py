@@ -0,0 +1,350 @@
+"""
+Benchmark de desempenho dos núcleos numéricos, com curvas de escala.
+
+Para cada núcleo gera problemas de tamanho crescente (matrizes aleatórias bem
+condicionadas, treliças geradas, tabelas de cotas longas, séries temporais
+grandes), mede o tempo, confere a precisão contra uma referência do NumPy e
+estima o expoente empírico da escala (tempo ~ n^k, ajuste de potência).
+Falha (código de saída 1) se algum resultado sair da tolerância de precisão ou,
+com --comparar, se algum tempo piorar mais que o fator --regressao.
+
+    python bench_desempenho.py                          # todos os núcleos
+    python bench_desempenho.py --rapido --nucleos gauss navio_secao
+    python bench_desempenho.py --json base.json --csv base.csv
+    python bench_desempenho.py --comparar base.json --regressao 1.5
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from ajuste import ajustar
+from esparsa import MatrizCSR
+from gauss import BLOCO_PADRAO, resolver_gauss_manual, resolver_gauss_misto
+from gauss_seidel import gauss_seidel, sor
+from krylov import gmres
+from mmq import calcular_mmq_detalhado
+from navio import areas_estacoes, integrar_secao
+from partida_quente import CachePartidaQuente
+from trelica_modelo import pratt
+
+# Tempo mínimo somado das repetições de cada medição (segundos)
+TEMPO_MINIMO = 0.2
+
+# Fator de piora, em relação ao relatório de base, considerado regressão
+REGRESSAO_PADRAO = 1.5
+
+_trapezio_numpy = getattr(np, "trapezoid", None) or np.trapz
+
+
+def _erro_relativo(x, referencia):
+    x = np.asarray(x, dtype=float)
+    referencia = np.asarray(referencia, dtype=float)
+    return float(np.max(np.abs(x - referencia)) / max(np.max(np.abs(referencia)), 1e-300))
+
+
+# --- GERADORES E REFERÊNCIAS DE CADA NÚCLEO ---
+
+def _gerar_densa(n, rng):
+    """Matriz aleatória com autovalores em torno de 2·sqrt(n) (número de condição pequeno)."""
+    A = rng.standard_normal((n, n)) + 2 * np.sqrt(n) * np.eye(n)
+    return A, rng.standard_normal(n)
+
+
+def _gerar_esparsa(n, rng, vizinhos=4):
+    """Sistema esparso com diagonal estritamente dominante ('vizinhos' não nulos por linha)."""
+    linhas = np.repeat(np.arange(n), vizinhos)
+    colunas = rng.integers(0, n, size=n * vizinhos)
+    valores = rng.uniform(-1, 1, size=n * vizinhos)
+    diagonal = 2 * np.bincount(linhas, weights=np.abs(valores), minlength=n) + 1
+    A = MatrizCSR.de_coordenadas(np.concatenate([linhas, np.arange(n)]),
+                                 np.concatenate([colunas, np.arange(n)]),
+                                 np.concatenate([valores, diagonal]), (n, n))
+    return A, rng.standard_normal(n)
+
+
+def _gerar_trelica(n_paineis, rng):
+    return pratt(n_paineis, carga=1000.0).montar()
+
+
+def _gerar_secao(n, rng):
+    """Meias-larguras de um polinômio cúbico (Simpson é exato com número par de intervalos)."""
+    n += n % 2 == 0  # número ímpar de pontos
+    h = 10.0 / (n - 1)
+    z = np.arange(n) * h
+    c = rng.uniform(0.5, 1.5, size=4)
+    y = c[0] + c[1] * z + c[2] * z ** 2 / 10 - c[3] * z ** 3 / 100
+    exata = c[0] * 10 + c[1] * 50 + c[2] * 1000 / 30 - c[3] * 10000 / 400
+    return h, y, exata
+
+
+def _gerar_tabela(n_estacoes, rng, pontos=51):
+    h = 0.2
+    z = np.arange(pontos) * h
+    return h, 3 + rng.uniform(0, 1, size=(n_estacoes, 1)) * np.sin(z / z[-1] * np.pi)
+
+
+def _gerar_serie(n, rng):
+    anos = np.sort(rng.uniform(1970, 2025, size=n))
+    transistores = 10 ** (-590 + 0.3 * anos + rng.normal(0, 0.2, size=n))
+    return anos, transistores
+
+
+def _executar_gauss_misto(problema):
+    resultado = resolver_gauss_misto(*problema)
+    return resultado.x, {"passos": resultado.passos, "precisao": resultado.precisao}
+
+
+def _executar_gauss_seidel(problema):
+    A, b = problema
+    resultado = gauss_seidel(A, b, tol=1e-12, max_iter=500)
+    return resultado.x, {"iteracoes": resultado.iteracoes}
+
+
+def _executar_sor_trelica(problema):
+    A, b = problema
+    resultado = sor(A, b, tol=1e-10, max_iter=100_000, reordenar=True)
+    return resultado.x, {"iteracoes": resultado.iteracoes, "omega": round(resultado.omega, 4)}
+
+
+def _executar_gmres_trelica(problema):
+    A, b = problema
+    resultado = gmres(A, b, tol=1e-10, max_iter=1000, precond="ilu_banda", reordenar=True)
+    return resultado.x, {"iteracoes": resultado.iteracoes, "convergiu": resultado.convergiu}
+
+
+def _executar_varredura_quente(problema, passos=8):
+    """Varredura de cargas b·(1 + k/4) com partida quente; erro medido no último passo."""
+    A, b = problema
+    cache = CachePartidaQuente()
+    iteracoes = 0
+    for k in range(passos):
+        resultado = cache.resolver(sor, A, b * (1 + k / 4), tol=1e-10, max_iter=100_000, omega=None,
+                                   reordenar=True)
+        iteracoes += resultado.iteracoes
+    return resultado.x / (1 + (passos - 1) / 4), {"iteracoes": iteracoes,
+                                                  "economizadas": cache.iteracoes_economizadas}
+
+
+def _erro_secao(problema, saida):
+    h, y, exata = problema
+    area_trap, area_simp, _ = saida
+    return max(_erro_relativo(area_trap, _trapezio_numpy(y, dx=h)), _erro_relativo(area_simp, exata))
+
+
+def _erro_mmq(problema, saida):
+    anos, transistores = problema
+    beta, B_linear = np.polyfit(anos, np.log10(transistores), 1)
+    return _erro_relativo(saida[4:6], [beta, B_linear])
+
+
+class Nucleo:
+    """
+    Um núcleo medido: gerar(n, rng) cria o problema de tamanho n, executar(problema)
+    roda o núcleo e erro(problema, saida) compara com a referência.
+    executar pode devolver (saida, extras) com informações para o relatório (ex.: iterações).
+    """
+
+    def __init__(self, nome, descricao, tamanhos, tamanhos_rapidos, gerar, executar, erro, tolerancia,
+                 unidade="n", com_extras=False):
+        self.nome = nome
+        self.descricao = descricao
+        self.tamanhos = tamanhos
+        self.tamanhos_rapidos = tamanhos_rapidos
+        self.gerar = gerar
+        self.executar = executar
+        self.erro = erro
+        self.tolerancia = tolerancia
+        self.unidade = unidade
+        self.com_extras = com_extras
+
+
+NUCLEOS = [
+    Nucleo("gauss", "resolver_gauss_manual, matriz densa bem condicionada",
+           [64, 128, 256, 512], [32, 64, 128], _gerar_densa,
+           lambda p: resolver_gauss_manual(*p),
+           lambda p, x: _erro_relativo(x, np.linalg.solve(*p)), 1e-10),
+    Nucleo("gauss_blocado", f"resolver_gauss_manual em blocos de {BLOCO_PADRAO} (threads: todos os núcleos)",
+           [256, 512, 1024, 2048], [256, 512], _gerar_densa,
+           lambda p: resolver_gauss_manual(*p, bloco=BLOCO_PADRAO),
+           lambda p, x: _erro_relativo(x, np.linalg.solve(*p)), 1e-10),
+    Nucleo("gauss_misto", "resolver_gauss_misto (float32 + refinamento), matriz densa bem condicionada",
+           [64, 128, 256, 512], [32, 64, 128], _gerar_densa, _executar_gauss_misto,
+           lambda p, x: _erro_relativo(x, np.linalg.solve(*p)), 1e-10, com_extras=True),
+    Nucleo("gauss_seidel", "gauss_seidel em sistema esparso diagonal dominante",
+           [250, 500, 1000, 2000], [100, 250, 500], _gerar_esparsa, _executar_gauss_seidel,
+           lambda p, x: _erro_relativo(x, np.linalg.solve(p[0].para_densa(), p[1])), 1e-9,
+           com_extras=True),
+    Nucleo("sor_trelica", "SOR adaptativo (reordenado) em treliça Pratt gerada",
+           [4, 8, 16, 32], [4, 8], _gerar_trelica, _executar_sor_trelica,
+           lambda p, x: _erro_relativo(x, np.linalg.solve(p[0].para_densa(), p[1])), 1e-6,
+           unidade="painéis", com_extras=True),
+    Nucleo("gmres_trelica", "GMRES + ILU em banda (reordenado) em treliça Pratt gerada; erro = resíduo relativo",
+           [100, 1000, 10000], [100, 1000], _gerar_trelica, _executar_gmres_trelica,
+           lambda p, x: np.linalg.norm(p[0] @ x - p[1]) / np.linalg.norm(p[1]), 1e-9,
+           unidade="painéis", com_extras=True),
+    Nucleo("sor_trelica_quente", "varredura de 8 cargas com partida quente (CachePartidaQuente)",
+           [4, 8, 16, 32], [4, 8], _gerar_trelica, _executar_varredura_quente,
+           lambda p, x: _erro_relativo(x, np.linalg.solve(p[0].para_densa(), p[1])), 1e-6,
+           unidade="painéis", com_extras=True),
+    Nucleo("navio_secao", "integrar_secao (trapézios e Simpson) em seção longa",
+           [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7], [10 ** 3, 10 ** 4, 10 ** 5], _gerar_secao,
+           lambda p: integrar_secao(p[0], p[1]), _erro_secao, 1e-9, unidade="cotas"),
+    Nucleo("navio_tabela", "areas_estacoes em tabela de cotas (51 cotas por estação)",
+           [10 ** 3, 10 ** 4, 10 ** 5], [10 ** 2, 10 ** 3, 10 ** 4], _gerar_tabela,
+           lambda p: areas_estacoes(*p),
+           lambda p, s: _erro_relativo(s[0], _trapezio_numpy(p[1], dx=p[0], axis=1)), 1e-12,
+           unidade="estações"),
+    Nucleo("mmq", "calcular_mmq_detalhado em série temporal grande",
+           [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6], [10 ** 2, 10 ** 3, 10 ** 4], _gerar_serie,
+           lambda p: calcular_mmq_detalhado(*p), _erro_mmq, 1e-8, unidade="pontos"),
+]
+
+
+# --- MEDIÇÃO ---
+
+def cronometrar(funcao, tempo_minimo=TEMPO_MINIMO, repeticoes_min=3):
+    """
+    Roda funcao() uma vez para aquecer e repete até somar tempo_minimo (e pelo menos
+    repeticoes_min vezes). Retorna (última saída, lista de tempos em segundos).
+    """
+    saida = funcao()
+    tempos = []
+    while len(tempos) < repeticoes_min or sum(tempos) < tempo_minimo:
+        inicio = time.perf_counter()
+        saida = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return saida, tempos
+
+
+def medir_nucleo(nucleo, tamanhos, tempo_minimo=TEMPO_MINIMO, semente=0):
+    """Uma linha de resultado por tamanho: tempos, erro contra a referência e extras."""
+    linhas = []
+    for n in tamanhos:
+        problema = nucleo.gerar(n, np.random.default_rng(semente))
+        saida, tempos = cronometrar(lambda: nucleo.executar(problema), tempo_minimo)
+        extras = {}
+        if nucleo.com_extras:
+            saida, extras = saida
+        erro = nucleo.erro(problema, saida)
+        linhas.append({
+            "nucleo": nucleo.nome,
+            "n": n,
+            "unidade": nucleo.unidade,
+            "tempo_min": min(tempos),
+            "tempo_mediana": statistics.median(tempos),
+            "repeticoes": len(tempos),
+            "erro": erro,
+            "tolerancia": nucleo.tolerancia,
+            "ok": bool(erro <= nucleo.tolerancia),
+            "extras": extras,
+        })
+    return linhas
+
+
+def expoente_escala(linhas):
+    """Expoente k de tempo ~ a·n^k (ajuste de potência por MMQ); None com menos de 2 tamanhos."""
+    if len(linhas) < 2:
+        return None
+    n = np.array([linha["n"] for linha in linhas], dtype=float)
+    t = np.array([linha["tempo_min"] for linha in linhas])
+    return float(ajustar(n, t, "potencia").parametros["beta"])
+
+
+def comparar(resultados, base, fator):
+    """Medições (núcleo, n) que ficaram mais de 'fator' vezes mais lentas que na base."""
+    tempos_base = {(linha["nucleo"], linha["n"]): linha["tempo_min"] for linha in base["resultados"]}
+    regressoes = []
+    for linha in resultados:
+        anterior = tempos_base.get((linha["nucleo"], linha["n"]))
+        if anterior and linha["tempo_min"] > fator * anterior:
+            regressoes.append((linha["nucleo"], linha["n"], linha["tempo_min"] / anterior))
+    return regressoes
+
+
+def _plataforma():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "sistema": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def _escrever_csv(caminho, resultados):
+    campos = ["nucleo", "n", "unidade", "tempo_min", "tempo_mediana", "repeticoes", "erro", "tolerancia",
+              "ok", "extras"]
+    with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=campos)
+        escritor.writeheader()
+        for linha in resultados:
+            escritor.writerow({**linha, "extras": json.dumps(linha["extras"])})
+
+
+def main(argv=None):
+    nomes = [nucleo.nome for nucleo in NUCLEOS]
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nucleos", nargs="+", choices=nomes, default=nomes, help="núcleos a medir")
+    parser.add_argument("--rapido", action="store_true", help="tamanhos menores (verificação rápida)")
+    parser.add_argument("--tamanhos", type=int, nargs="+", help="substitui os tamanhos de todos os núcleos")
+    parser.add_argument("--tempo-minimo", type=float, default=TEMPO_MINIMO,
+                        help="segundos somados por medição (padrão: %(default)s)")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--json", help="grava o relatório completo em JSON")
+    parser.add_argument("--csv", help="grava as medições em CSV (uma linha por núcleo e tamanho)")
+    parser.add_argument("--comparar", help="relatório JSON de base para detectar regressões")
+    parser.add_argument("--regressao", type=float, default=REGRESSAO_PADRAO,
+                        help="fator de piora considerado regressão (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+
+    resultados, escala = [], {}
+    for nucleo in NUCLEOS:
+        if nucleo.nome not in args.nucleos:
+            continue
+        tamanhos = args.tamanhos or (nucleo.tamanhos_rapidos if args.rapido else nucleo.tamanhos)
+        print(f"{nucleo.nome}: {nucleo.descricao}")
+        linhas = medir_nucleo(nucleo, tamanhos, args.tempo_minimo, args.semente)
+        for linha in linhas:
+            extras = "".join(f"  {k}={v}" for k, v in linha["extras"].items())
+            print(f"  {'OK   ' if linha['ok'] else 'FALHA'} {nucleo.unidade + '=' + str(linha['n']):<16}"
+                  f"{linha['tempo_min'] * 1000:10.3f} ms  erro {linha['erro']:.1e}{extras}")
+        escala[nucleo.nome] = expoente_escala(linhas)
+        if escala[nucleo.nome] is not None:
+            print(f"  escala: tempo ~ {nucleo.unidade}^{escala[nucleo.nome]:.2f}")
+        resultados += linhas
+
+    relatorio = {
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "plataforma": _plataforma(),
+        "tempo_minimo": args.tempo_minimo,
+        "semente": args.semente,
+        "resultados": resultados,
+        "escala": escala,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+    if args.csv:
+        _escrever_csv(args.csv, resultados)
+
+    falhou = not all(linha["ok"] for linha in resultados)
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as arquivo:
+            regressoes = comparar(resultados, json.load(arquivo), args.regressao)
+        for nome, n, razao in regressoes:
+            print(f"REGRESSÃO {nome} n={n}: {razao:.2f}x mais lento que a base")
+        falhou |= bool(regressoes)
+
+    return 1 if falhou else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
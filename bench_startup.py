@@ -0,0 +1,81 @@
+"""
+Benchmark do tempo de inicialização do núcleo numérico (sem interface gráfica).
+
+Cada medição roda em um interpretador novo, para que nada venha do cache de
+módulos. Falha (código de saída 1) se o melhor tempo passar do orçamento ou se
+tkinter/matplotlib forem carregados só por importar as funções numéricas.
+
+    python bench_startup.py                 # orçamento padrão
+    python bench_startup.py --orcamento 0.3 --repeticoes 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# Segundos para importar todo o núcleo numérico (numpy incluso)
+ORCAMENTO_PADRAO = 0.5
+
+MODULOS_NUMERICOS = ["esparsa", "gauss", "reordenacao", "gauss_seidel", "krylov",
+                     "instrumentacao", "trelica_modelo", "navio", "quadratura", "hidrostatica",
+                     "ajuste", "mmq", "reamostragem", "casos_carga", "partida_quente"]
+
+# Scripts de interface carregados como módulo (sem abrir janela)
+SCRIPTS_GUI = ["Lei-de-Moore.py", "area-trecho-do-navio.py"]
+
+PROIBIDOS = ("tkinter", "matplotlib")
+
+_MEDICAO = r"""
+import importlib, importlib.util, sys, time
+inicio = time.perf_counter()
+for nome in {modulos!r}:
+    importlib.import_module(nome)
+for caminho in {scripts!r}:
+    spec = importlib.util.spec_from_file_location("_script", caminho)
+    spec.loader.exec_module(importlib.util.module_from_spec(spec))
+tempo = time.perf_counter() - inicio
+carregados = sorted({{m.split(".")[0] for m in sys.modules}} & set({proibidos!r}))
+print(tempo, ",".join(carregados))
+"""
+
+
+def medir(modulos, scripts=(), repeticoes=5):
+    """Menor tempo de importação em 'repeticoes' interpretadores novos e os módulos proibidos carregados."""
+    pasta = os.path.dirname(os.path.abspath(__file__))
+    codigo = _MEDICAO.format(modulos=list(modulos), scripts=[os.path.join(pasta, s) for s in scripts],
+                             proibidos=list(PROIBIDOS))
+    tempos, carregados = [], set()
+    for _ in range(repeticoes):
+        saida = subprocess.run([sys.executable, "-c", codigo], cwd=pasta, capture_output=True,
+                               text=True, check=True).stdout.split()
+        tempos.append(float(saida[0]))
+        if len(saida) > 1:
+            carregados.update(saida[1].split(","))
+    return min(tempos), sorted(carregados)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--orcamento", type=float, default=ORCAMENTO_PADRAO, help="limite em segundos")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    casos = [
+        ("núcleo numérico", MODULOS_NUMERICOS, []),
+        ("núcleo + scripts de interface (sem janela)", MODULOS_NUMERICOS, SCRIPTS_GUI),
+    ]
+
+    falhou = False
+    for rotulo, modulos, scripts in casos:
+        tempo, carregados = medir(modulos, scripts, args.repeticoes)
+        ok = tempo <= args.orcamento and not carregados
+        falhou |= not ok
+        extra = f"  carregou {', '.join(carregados)}" if carregados else ""
+        print(f"{'OK   ' if ok else 'FALHA'} {rotulo}: {tempo * 1000:.0f} ms "
+              f"(orçamento {args.orcamento * 1000:.0f} ms){extra}")
+
+    return 1 if falhou else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+"""
+Execução em lote (sem interface gráfica) dos problemas do trabalho.
+
+Não importa tkinter nem matplotlib: roda em máquinas sem display.
+Arquivos de entrada são CSV separados por vírgula (linhas não numéricas, como
+cabeçalhos, são ignoradas). Resultados vão para --saida ou para a saída padrão.
+
+Exemplos:
+    python calcular_lote.py minas --matriz A.csv --necessidades B.csv --percentual
+    python calcular_lote.py minas --matriz A_grande.csv --necessidades B.csv --precisao mista --bloco 128
+    python calcular_lote.py trelica --gerar pratt:10000
+    python calcular_lote.py trelica --modelo trelica.json --metodo bicgstab --precond ilu
+    python calcular_lote.py trelica --matriz A.csv --cargas b.csv --metodo gs --reordenar
+    python calcular_lote.py casos --gerar pratt:20 --envoltoria envoltoria.csv --escala 500
+    python calcular_lote.py navio --passo 0.4 --larguras tabela_cotas.csv
+    python calcular_lote.py navio --passo 0.4 --larguras cotas.bin --pontos 300 --bloco 65536
+    python calcular_lote.py hidrostatica --cotas casco.csv --dx 2 --dz 0.5
+    python calcular_lote.py moore --dados moore.csv --prever 2010 2020
+    python calcular_lote.py ajuste --dados pontos.csv --modelo polinomial --grau 3 --metodo svd
+"""
+import argparse
+import json
+import sys
+
+import numpy as np
+
+
+# --- LEITURA E ESCRITA ---
+
+def _ler_tabela(caminho):
+    """Lê um CSV numérico como matriz 2D, descartando linhas sem números (cabeçalhos)."""
+    tabela = np.genfromtxt(caminho, delimiter=",", ndmin=2)
+    return tabela[~np.all(np.isnan(tabela), axis=1)]
+
+
+def _escrever(saida, cabecalho, linhas):
+    arquivo = sys.stdout if saida in (None, "-") else open(saida, "w", encoding="utf-8")
+    try:
+        arquivo.write(",".join(cabecalho) + "\n")
+        for linha in linhas:
+            arquivo.write(",".join(v if isinstance(v, str) else repr(float(v)) for v in linha) + "\n")
+    finally:
+        if arquivo is not sys.stdout:
+            arquivo.close()
+
+
+# --- PROBLEMA DAS MINAS (Gauss) ---
+
+def executar_minas(args):
+    from gauss import CacheFatoracoes, normas_residuais, resolver_gauss_misto
+
+    A = _ler_tabela(args.matriz)
+    if args.percentual:
+        A = A / 100.0
+
+    # Cada linha do arquivo de necessidades é um cenário (vetor B)
+    cenarios = _ler_tabela(args.necessidades)
+    B = cenarios.T
+
+    if args.precisao == "mista":
+        resultado = resolver_gauss_misto(A, B, bloco=args.bloco, threads=args.threads)
+        x = resultado.x
+        motivo = f" ({resultado.motivo})" if resultado.motivo else ""
+        print(f"precisão {resultado.precisao}{motivo}: {resultado.passos} passos de refinamento, "
+              f"erro regressivo {resultado.erro:.3e}", file=sys.stderr)
+    else:
+        x = CacheFatoracoes(capacidade=1, bloco=args.bloco, threads=args.threads).resolver(A, B)
+    erros = normas_residuais(A, x, B)
+
+    n = A.shape[0]
+    cabecalho = ["cenario"] + [f"x{j + 1}" for j in range(n)] + ["erro_residual"]
+    linhas = ([str(k + 1)] + list(x[:, k]) + [erros[k]] for k in range(x.shape[1]))
+    _escrever(args.saida, cabecalho, linhas)
+
+
+# --- TRELIÇA (Gauss-Seidel / SOR / Krylov) ---
+
+def _carregar_trelica(args):
+    from trelica_modelo import Trelica, howe, pratt, warren
+
+    if args.gerar:
+        tipo, _, paineis = args.gerar.partition(":")
+        geradores = {"pratt": pratt, "howe": howe, "warren": warren}
+        if tipo not in geradores or not paineis:
+            raise SystemExit("--gerar deve ser pratt:N, howe:N ou warren:N")
+        return geradores[tipo](int(paineis), carga=args.carga)
+
+    with open(args.modelo, encoding="utf-8") as arquivo:
+        dados = json.load(arquivo)
+    return Trelica(dados["nos"], dados["barras"], [tuple(a) for a in dados["apoios"]], dados.get("cargas"))
+
+
+def executar_trelica(args):
+    from esparsa import MatrizCSR
+
+    if args.matriz:
+        A = MatrizCSR.de_densa(_ler_tabela(args.matriz))
+        b = _ler_tabela(args.cargas).ravel()
+        nomes = [f"x{i + 1}" for i in range(len(b))]
+    else:
+        trelica = _carregar_trelica(args)
+        A, b = trelica.montar()
+        nomes = trelica.nomes_incognitas()
+
+    # Nas treliças montadas a diagonal tem zeros (divisão por zero sem reordenar):
+    # reordena por padrão, exceto com --matriz
+    reordenar = not args.matriz if args.reordenar is None else args.reordenar
+    comum = dict(tol=args.tol, max_iter=args.max_iter, reordenar=reordenar)
+    if args.metodo in ("gmres", "bicgstab"):
+        import krylov
+        resultado = getattr(krylov, args.metodo)(A, b, precond=args.precond, **comum)
+    else:
+        from gauss_seidel import sor
+        omega = 1.0 if args.metodo == "gs" else args.omega
+        resultado = sor(A, b, omega=omega, simetrico=(args.metodo == "ssor"), **comum)
+
+    estado = "convergiu" if resultado.convergiu else "NAO convergiu"
+    print(f"{args.metodo}: {estado} em {resultado.iteracoes} iterações, erro {resultado.erro:.3e}",
+          file=sys.stderr)
+
+    if not resultado.convergiu and args.metodo in ("gs", "sor", "ssor"):
+        from reordenacao import razao_dominancia, reordenar as reordenar_equacoes
+        dominancia = razao_dominancia(reordenar_equacoes(A, b)[0] if reordenar else A).min()
+        if dominancia < 1:
+            print(f"dica: menor razão de dominância diagonal {dominancia:.2f} (< 1, sem convergência "
+                  f"garantida); use --metodo gmres --precond ilu_banda", file=sys.stderr)
+
+    _escrever(args.saida, ["incognita", "valor"], zip(nomes, resultado.x))
+    if not resultado.convergiu:
+        raise SystemExit(1)
+
+
+# --- CASOS DE CARGA E LINHAS DE INFLUÊNCIA DA TRELIÇA ---
+
+def executar_casos(args):
+    from casos_carga import Envoltoria, linhas_influencia, resolver_casos
+
+    trelica = _carregar_trelica(args)
+    comum = dict(metodo=args.metodo, tol=args.tol, max_iter=args.max_iter)
+    if args.cargas:
+        # Cada linha do CSV é um caso: Px, Py de cada nó (2 x n_nos valores)
+        cargas = _ler_tabela(args.cargas).reshape(-1, trelica.n_nos, 2)
+        resultado = resolver_casos(trelica, cargas, **comum)
+        cabecalho = ["caso"] + resultado.nomes
+    else:
+        nos = None if args.nos is None else [no - 1 for no in args.nos]
+        resultado = linhas_influencia(trelica, nos, args.direcao, **comum)
+        cabecalho = ["caso", "posicao"] + resultado.nomes
+
+    if args.metodo != "lu":
+        estado = "convergiu" if resultado.convergiu else "NAO convergiu"
+        print(f"{args.metodo}: {estado} em {resultado.iteracoes} iterações ({len(resultado.casos)} casos)",
+              file=sys.stderr)
+
+    _escrever(args.saida, cabecalho, resultado.linhas())
+    if args.envoltoria:
+        Envoltoria(resultado, args.escala).para_csv(args.envoltoria)
+    if not resultado.convergiu:
+        raise SystemExit(1)
+
+
+# --- SEÇÃO DO NAVIO (Trapézios / Simpson) ---
+
+def executar_navio(args):
+    from navio import integrar_tabela, ler_blocos_binario, ler_blocos_csv
+
+    # Cada linha/estação: meias-larguras do topo até a quilha. A tabela é lida e
+    # integrada em blocos, e cada bloco é escrito assim que fica pronto.
+    if args.larguras.endswith(".npy") or args.pontos:
+        blocos = ler_blocos_binario(args.larguras, args.pontos, args.dtype, args.bloco)
+    else:
+        blocos = ler_blocos_csv(args.larguras, args.bloco, args.pular_linhas)
+
+    linhas = ([str(inicio + k + 1), trap, simp]
+              for inicio, areas_trap, areas_simp in integrar_tabela(args.passo, blocos)
+              for k, (trap, simp) in enumerate(zip(areas_trap, areas_simp)))
+    _escrever(args.saida, ["estacao", "area_trapezios", "area_simpson"], linhas)
+
+
+# --- HIDROSTÁTICA DO CASCO ---
+
+def executar_hidrostatica(args):
+    from hidrostatica import TabelaHidrostatica
+
+    # Uma estação por linha, meias-larguras da quilha para cima
+    cotas = np.load(args.cotas) if args.cotas.endswith(".npy") else _ler_tabela(args.cotas)
+    tabela = TabelaHidrostatica(cotas, args.dx, args.dz, args.calados or None, args.densidade)
+
+    linhas = ([linha[campo] for campo in tabela.CAMPOS] for linha in tabela.linhas())
+    _escrever(args.saida, list(tabela.CAMPOS), linhas)
+
+
+# --- LEI DE MOORE (MMQ) ---
+
+def executar_moore(args):
+    from mmq import calcular_mmq_detalhado, prever
+
+    if args.dados:
+        dados = _ler_tabela(args.dados)
+        x, N, _, alpha, beta, B_linear, detalhes = calcular_mmq_detalhado(dados[:, 0], dados[:, 1])
+    else:
+        x, N, _, alpha, beta, B_linear, detalhes = calcular_mmq_detalhado()
+
+    if args.memoria:
+        with open(args.memoria, "w", encoding="utf-8") as arquivo:
+            arquivo.write(detalhes + "\n")
+
+    linhas = [["alpha", alpha], ["beta", beta], ["B_linear", B_linear]]
+    linhas += [[f"previsao_{ano:g}", prever(ano, alpha, beta)] for ano in args.prever]
+
+    if args.intervalos:
+        import reamostragem
+
+        opcoes = dict(previsoes=args.prever, nivel=args.nivel)
+        if args.intervalos == "bootstrap":
+            opcoes.update(n_reamostras=args.reamostras, processos=args.processos, semente=args.semente)
+        faixas = getattr(reamostragem, args.intervalos)(x, N, "exponencial", base=10, **opcoes)
+
+        for nome, intervalo in faixas.parametros.items():
+            linhas += [[f"{nome}_inferior", intervalo.inferior], [f"{nome}_superior", intervalo.superior]]
+        for ano, conf, pred in zip(args.prever, faixas.confianca, faixas.predicao):
+            linhas += [[f"previsao_{ano:g}_conf_inferior", conf.inferior],
+                       [f"previsao_{ano:g}_conf_superior", conf.superior],
+                       [f"previsao_{ano:g}_pred_inferior", pred.inferior],
+                       [f"previsao_{ano:g}_pred_superior", pred.superior]]
+
+    _escrever(args.saida, ["parametro", "valor"], linhas)
+
+
+# --- AJUSTE GENÉRICO (MMQ) ---
+
+def executar_ajuste(args):
+    from ajuste import AcumuladorMMQ, ajustar
+
+    base = 10.0 if args.base10 else np.e
+    if args.online:
+        # Arquivo lido em blocos; só as somas centradas ficam em memória
+        from navio import ler_blocos_csv
+        acumulador = AcumuladorMMQ(args.modelo, base).consumir(
+            ler_blocos_csv(args.dados, args.bloco, args.pular_linhas))
+        resultado = acumulador.ajuste(memoria=bool(args.memoria))
+    else:
+        dados = _ler_tabela(args.dados)
+        resultado = ajustar(dados[:, 0], dados[:, 1], args.modelo, grau=args.grau, base=base,
+                            metodo=args.metodo, memoria=bool(args.memoria))
+    print(f"{resultado.equacao()}  (R² = {resultado.r2:.6f})", file=sys.stderr)
+
+    if args.memoria:
+        with open(args.memoria, "w", encoding="utf-8") as arquivo:
+            arquivo.write(resultado.memoria + "\n")
+
+    linhas = [[nome, valor] for nome, valor in resultado.parametros.items()]
+    linhas += [["r2", resultado.r2], ["norma_residuo", resultado.norma_residuo]]
+    linhas += [[f"previsao_{x:g}", resultado.prever([x])[0]] for x in args.prever]
+    _escrever(args.saida, ["parametro", "valor"], linhas)
+
+
+# --- LINHA DE COMANDO ---
+
+def criar_parser():
+    parser = argparse.ArgumentParser(description="Cálculo numérico em lote, sem interface gráfica.")
+    sub = parser.add_subparsers(dest="problema", required=True)
+
+    p = sub.add_parser("minas", help="Sistema das minas por eliminação de Gauss (vários cenários de B).")
+    p.add_argument("--matriz", required=True, help="CSV n x n com a composição das minas")
+    p.add_argument("--necessidades", required=True, help="CSV com um vetor B (n valores) por linha")
+    p.add_argument("--percentual", action="store_true", help="divide A por 100 (valores em %%, como na interface)")
+    p.add_argument("--precisao", default="float64", choices=["float64", "mista"],
+                   help="mista: fatora em float32 e refina em float64 (sistemas densos grandes)")
+    p.add_argument("--bloco", type=int, default=None,
+                   help="fatoração em blocos com esse tamanho de bloco (ex.: 128; padrão: por colunas)")
+    p.add_argument("--threads", type=int, default=None, help="threads da fatoração em blocos (padrão: todos os núcleos)")
+    p.set_defaults(executar=executar_minas)
+
+    p = sub.add_parser("trelica", help="Forças na treliça por método iterativo.")
+    origem = p.add_mutually_exclusive_group(required=True)
+    origem.add_argument("--matriz", help="CSV com a matriz A (exige --cargas)")
+    origem.add_argument("--modelo", help="JSON com nos, barras, apoios e cargas (índices base 0)")
+    origem.add_argument("--gerar", help="treliça gerada: pratt:N, howe:N ou warren:N")
+    p.add_argument("--cargas", help="CSV com o vetor b (usado com --matriz)")
+    p.add_argument("--carga", type=float, default=1.0, help="carga por nó nas treliças geradas")
+    p.add_argument("--metodo", default="gmres", choices=["gs", "sor", "ssor", "gmres", "bicgstab"],
+                   help="padrão: gmres (com --precond ilu_banda converge em 1 ou 2 iterações nas "
+                        "treliças geradas; gs/sor/ssor em geral não convergem nelas)")
+    p.add_argument("--omega", type=float, default=None, help="fator de relaxação (padrão: automático)")
+    p.add_argument("--precond", default="ilu_banda", choices=["jacobi", "ilu", "ilu_banda"],
+                   help="pré-condicionador de gmres/bicgstab (ilu e ilu_banda exigem diagonal não nula)")
+    p.add_argument("--reordenar", action="store_true", default=None,
+                   help="reordena as equações para diagonal não nula e máxima (padrão com --modelo e "
+                        "--gerar; não torna gs/sor convergentes nas treliças geradas)")
+    p.add_argument("--sem-reordenar", dest="reordenar", action="store_false",
+                   help="resolve na ordem de montagem")
+    p.add_argument("--tol", type=float, default=1e-4)
+    p.add_argument("--max-iter", type=int, default=500)
+    p.set_defaults(executar=executar_trelica)
+
+    p = sub.add_parser("casos", help="Treliça com vários casos de carga ou linhas de influência (carga móvel).")
+    origem = p.add_mutually_exclusive_group(required=True)
+    origem.add_argument("--modelo", help="JSON com nos, barras, apoios e cargas (índices base 0)")
+    origem.add_argument("--gerar", help="treliça gerada: pratt:N, howe:N ou warren:N")
+    p.add_argument("--carga", type=float, default=1.0, help="carga por nó nas treliças geradas")
+    p.add_argument("--cargas", help="CSV com um caso por linha (Px, Py de cada nó); sem ele, linhas de influência")
+    p.add_argument("--nos", type=int, nargs="+", help="nós percorridos pela carga unitária (base 1; padrão: todos)")
+    p.add_argument("--direcao", default="y", choices=["x", "y"], help="direção da carga unitária")
+    p.add_argument("--metodo", default="gmres", choices=["gmres", "lu", "gs", "sor", "ssor"],
+                   help="padrão: gmres com fatoração em banda (lu é densa, só para treliças pequenas)")
+    p.add_argument("--tol", type=float, default=1e-10)
+    p.add_argument("--max-iter", type=int, default=10000)
+    p.add_argument("--envoltoria", help="arquivo CSV para a envoltória (máximo/mínimo de cada incógnita)")
+    p.add_argument("--escala", type=float, default=1.0, help="fator dos casos na envoltória (ex.: valor da carga móvel)")
+    p.set_defaults(executar=executar_casos)
+
+    p = sub.add_parser("navio", help="Área de seções do casco (Trapézios e Simpson).")
+    p.add_argument("--passo", type=float, required=True, help="passo vertical h em metros")
+    p.add_argument("--larguras", required=True,
+                   help="tabela de cotas: CSV (uma estação por linha), .npy ou binário cru (com --pontos)")
+    p.add_argument("--pontos", type=int, help="pontos por estação do binário cru")
+    p.add_argument("--dtype", default="<f8", help="tipo dos valores do binário cru (padrão: float64)")
+    p.add_argument("--bloco", type=int, default=4096, help="estações processadas por vez")
+    p.add_argument("--pular-linhas", type=int, default=0, help="linhas de cabeçalho do CSV")
+    p.set_defaults(executar=executar_navio)
+
+    p = sub.add_parser("hidrostatica", help="Curvas hidrostáticas (volume, LCB, KB, BM, ...) por calado.")
+    p.add_argument("--cotas", required=True, help="CSV ou .npy: meias-larguras, estação por linha, da quilha para cima")
+    p.add_argument("--dx", type=float, required=True, help="espaçamento entre estações (m)")
+    p.add_argument("--dz", type=float, required=True, help="espaçamento entre linhas d'água (m)")
+    p.add_argument("--calados", type=float, nargs="*", default=[], help="calados (padrão: cada linha d'água)")
+    p.add_argument("--densidade", type=float, default=1.025, help="t/m³ (padrão: água salgada)")
+    p.set_defaults(executar=executar_hidrostatica)
+
+    p = sub.add_parser("moore", help="Ajuste da Lei de Moore por mínimos quadrados.")
+    p.add_argument("--dados", help="CSV com colunas ano,transistores (padrão: dados da questão)")
+    p.add_argument("--prever", type=float, nargs="*", default=[], help="anos para prever")
+    p.add_argument("--memoria", help="arquivo para gravar a memória de cálculo passo a passo")
+    p.add_argument("--intervalos", choices=["bootstrap", "jackknife"],
+                   help="intervalos de confiança/predição por reamostragem")
+    p.add_argument("--nivel", type=float, default=0.95, help="nível de confiança (padrão: 0.95)")
+    p.add_argument("--reamostras", type=int, default=10000, help="reamostras do bootstrap")
+    p.add_argument("--processos", type=int, default=None, help="processos para o bootstrap")
+    p.add_argument("--semente", type=int, default=None, help="semente aleatória (resultados reprodutíveis)")
+    p.set_defaults(executar=executar_moore)
+
+    p = sub.add_parser("ajuste", help="Mínimos quadrados para uma família de modelos.")
+    p.add_argument("--dados", required=True, help="CSV com colunas x,y")
+    p.add_argument("--modelo", default="linear",
+                   choices=["linear", "polinomial", "exponencial", "potencia", "logaritmico"])
+    p.add_argument("--grau", type=int, default=1, help="grau do polinômio")
+    p.add_argument("--base10", action="store_true", help="exponencial na base 10 (padrão: base e)")
+    p.add_argument("--metodo", default="qr", choices=["qr", "svd"])
+    p.add_argument("--online", action="store_true",
+                   help="lê o arquivo em blocos e acumula as somas (modelos de 2 parâmetros)")
+    p.add_argument("--bloco", type=int, default=65536, help="linhas por bloco no modo --online")
+    p.add_argument("--pular-linhas", type=int, default=0, help="linhas de cabeçalho (modo --online)")
+    p.add_argument("--prever", type=float, nargs="*", default=[], help="valores de x para prever")
+    p.add_argument("--memoria", help="arquivo para gravar a memória de cálculo passo a passo")
+    p.set_defaults(executar=executar_ajuste)
+
+    for p in sub.choices.values():
+        p.add_argument("--saida", default="-", help="arquivo CSV de saída (padrão: saída padrão)")
+
+    return parser
+
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    if args.problema == "trelica" and args.matriz and not args.cargas:
+        raise SystemExit("--matriz exige --cargas")
+    try:
+        args.executar(args)
+    except ValueError as erro:
+        raise SystemExit(str(erro))
+
+
+if __name__ == "__main__":
+    main()
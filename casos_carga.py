@@ -0,0 +1,168 @@
+import csv
+
+import numpy as np
+
+from gauss import BLOCO_PADRAO, FatoracaoLU
+from gauss_seidel import sor
+from krylov import PrecondILUBanda, gmres
+from reordenacao import reordenar
+
+
+# --- VÁRIOS CASOS DE CARGA, LINHAS DE INFLUÊNCIA E ENVOLTÓRIAS DA TRELIÇA ---
+#
+# A matriz do equilíbrio A·F = b só depende da geometria: é montada (e fatorada
+# ou reordenada) uma vez e todos os casos de carga são resolvidos juntos, como
+# colunas de um bloco B.
+
+METODOS = ("gmres", "lu", "gs", "sor", "ssor")
+
+
+class ResultadoCasos:
+    """
+    forcas:    (n_incognitas, n_casos), uma coluna por caso (barras F1..Fm e reações)
+    nomes:     nomes das incógnitas (Trelica.nomes_incognitas): as n_barras primeiras são barras
+    casos:     rótulo de cada caso
+    posicoes:  abscissa x da carga unitária de cada caso (linhas de influência)
+    """
+
+    def __init__(self, forcas, nomes, casos, metodo, iteracoes=0, convergiu=True, posicoes=None,
+                 n_barras=None):
+        self.forcas = forcas
+        self.nomes = list(nomes)
+        self.n_barras = len(self.nomes) if n_barras is None else n_barras
+        self.casos = list(casos)
+        self.metodo = metodo
+        self.iteracoes = iteracoes
+        self.convergiu = convergiu
+        self.posicoes = posicoes
+
+    def __repr__(self):
+        iteracoes = f", iteracoes={self.iteracoes}" if self.metodo != "lu" else ""
+        return (f"ResultadoCasos({len(self.casos)} casos, {len(self.nomes)} incógnitas, "
+                f"metodo='{self.metodo}'{iteracoes})")
+
+    def forca(self, nome):
+        """Valores de uma incógnita (ex.: 'F3', 'V1') em todos os casos."""
+        return self.forcas[self.nomes.index(nome)]
+
+    def linhas(self):
+        """Uma linha por caso: rótulo (e posição da carga) seguidos das incógnitas."""
+        extra = [] if self.posicoes is None else [self.posicoes]
+        return [[caso, *valores] for caso, *valores in zip(self.casos, *extra, *self.forcas)]
+
+
+class Envoltoria:
+    """
+    Maior e menor valor de cada incógnita entre os casos, com o caso em que ocorre.
+    Nas barras (tração positiva) o máximo é a maior tração e o mínimo a maior compressão;
+    uma barra que nunca fica tracionada (comprimida) tem tracao_max (compressao_max) nula.
+
+    escala multiplica todos os casos (ex.: o valor da carga móvel das linhas de influência).
+    """
+
+    CAMPOS = ("incognita", "maximo", "caso_maximo", "minimo", "caso_minimo")
+
+    def __init__(self, resultado, escala=1.0):
+        F = resultado.forcas * escala
+        self.nomes = resultado.nomes
+        self.maximo = F.max(axis=1)
+        self.minimo = F.min(axis=1)
+        self.caso_maximo = [resultado.casos[k] for k in F.argmax(axis=1)]
+        self.caso_minimo = [resultado.casos[k] for k in F.argmin(axis=1)]
+        self.n_barras = resultado.n_barras
+
+    @property
+    def tracao_max(self):
+        return np.maximum(self.maximo[:self.n_barras], 0.0)
+
+    @property
+    def compressao_max(self):
+        return np.minimum(self.minimo[:self.n_barras], 0.0)
+
+    def linhas(self):
+        colunas = [self.nomes, map(float, self.maximo), self.caso_maximo, map(float, self.minimo), self.caso_minimo]
+        return [dict(zip(self.CAMPOS, valores)) for valores in zip(*colunas)]
+
+    def para_csv(self, caminho):
+        with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+            escritor = csv.DictWriter(arquivo, fieldnames=self.CAMPOS)
+            escritor.writeheader()
+            escritor.writerows(self.linhas())
+
+
+def _resolver_bloco(A, B, metodo, tol, max_iter):
+    """Resolve A·X = B (uma coluna por caso). Retorna (X, iteracoes, convergiu)."""
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconhecido: {metodo}")
+
+    if metodo == "lu":
+        # Uma fatoração densa O(n³) para todos os casos; só para treliças pequenas
+        return FatoracaoLU(A.para_densa(), bloco=BLOCO_PADRAO).resolver(B), 0, True
+
+    # Reordenação (diagonal dominante) feita uma vez para todos os casos
+    A, B, _ = reordenar(A, B)
+
+    if metodo == "gmres":
+        # Uma fatoração em banda, O(n) na treliça; o bloco inteiro passa por uma só
+        # substituição e o GMRES, com o mesmo fator, refina só os casos que precisarem
+        M = PrecondILUBanda(A)
+        X = M.aplicar(B)
+        iteracoes, convergiu = 0, True
+        for k in range(B.shape[1]):
+            resultado = gmres(A, B[:, k], x0=X[:, k], tol=tol, max_iter=max_iter, precond=M)
+            X[:, k] = resultado.x
+            iteracoes = max(iteracoes, resultado.iteracoes)
+            convergiu = convergiu and resultado.convergiu
+        return X, iteracoes, convergiu
+
+    omega = 1.0 if metodo == "gs" else None
+    resultado = sor(A, B, tol=tol, max_iter=max_iter, omega=omega, simetrico=(metodo == "ssor"))
+    return resultado.x, resultado.iteracoes, resultado.convergiu
+
+
+def resolver_casos(trelica, cargas, casos=None, metodo="gmres", tol=1e-10, max_iter=10_000):
+    """
+    Forças na treliça para vários casos de carga em uma chamada.
+
+    cargas: (n_casos, n_nos, 2) forças (Px, Py) em cada nó por caso, ou (n_nos, 2) para um só.
+    metodo="gmres": equações reordenadas e fatoração LU em banda (PrecondILUBanda) uma
+    vez; cada caso custa uma substituição e, se preciso, poucas iterações de GMRES com o
+    mesmo fator (padrão; memória e tempo lineares no número de barras);
+    "lu": uma fatoração LU densa reaproveitada por todos os casos, O(n²) de memória e
+    O(n³) de tempo (treliças pequenas);
+    "gs", "sor", "ssor": Gauss-Seidel/SOR sobre o bloco de casos reordenado. Nas treliças
+    geradas em geral divergem ou exigem dezenas de milhares de varreduras.
+    """
+    cargas = np.asarray(cargas, dtype=float)
+    if cargas.ndim == 2:
+        cargas = cargas[np.newaxis]
+    if cargas.shape[1:] != trelica.nos.shape:
+        raise ValueError(f"As cargas devem ter formato (n_casos, {trelica.n_nos}, 2).")
+
+    casos = [f"Caso {k + 1}" for k in range(len(cargas))] if casos is None else list(casos)
+    if len(casos) != len(cargas):
+        raise ValueError("Informe um rótulo para cada caso de carga.")
+
+    A, _ = trelica.montar()
+    B = -cargas.reshape(len(cargas), -1).T
+    forcas, iteracoes, convergiu = _resolver_bloco(A, B, metodo, tol, max_iter)
+    return ResultadoCasos(forcas, trelica.nomes_incognitas(), casos, metodo, iteracoes, convergiu,
+                          n_barras=trelica.n_barras)
+
+
+def linhas_influencia(trelica, nos=None, direcao="y", metodo="gmres", tol=1e-10, max_iter=10_000):
+    """
+    Linhas de influência: uma carga unitária (para baixo em 'y', para a direita em 'x')
+    percorre os nós 'nos' (base 0; padrão: todos, da esquerda para a direita) e cada
+    posição vira um caso. resultado.forca('F3') é a linha de influência da barra 3.
+    """
+    if direcao not in ("x", "y"):
+        raise ValueError("A direção da carga deve ser 'x' ou 'y'.")
+    nos = np.argsort(trelica.nos[:, 0], kind="stable") if nos is None else np.asarray(nos, dtype=np.int64)
+
+    cargas = np.zeros((len(nos), trelica.n_nos, 2))
+    cargas[np.arange(len(nos)), nos, 0 if direcao == "x" else 1] = 1.0 if direcao == "x" else -1.0
+
+    resultado = resolver_casos(trelica, cargas, [f"Nó {no + 1}" for no in nos], metodo, tol, max_iter)
+    resultado.posicoes = trelica.nos[nos, 0]
+    return resultado
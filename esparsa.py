@@ -0,0 +1,104 @@
+import numpy as np
+
+
+# --- MATRIZ ESPARSA NO FORMATO CSR (Compressed Sparse Row) ---
+
+class MatrizCSR:
+    """
+    Matriz esparsa em linhas comprimidas, só com NumPy.
+
+    data[indptr[i]:indptr[i + 1]] são os valores não nulos da linha i e
+    indices[...] as colunas correspondentes (em ordem crescente).
+    A memória é proporcional ao número de não nulos (nnz).
+    """
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = tuple(shape)
+
+        if len(self.indptr) != self.shape[0] + 1 or len(self.data) != len(self.indices):
+            raise ValueError("Estrutura CSR inconsistente.")
+
+        # Linha de cada não nulo (usada nos produtos vetorizados)
+        self._linhas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    @classmethod
+    def de_coordenadas(cls, linhas, colunas, valores, shape):
+        """Monta a matriz a partir de triplas (i, j, a_ij); entradas repetidas são somadas."""
+        linhas = np.asarray(linhas, dtype=np.int64)
+        colunas = np.asarray(colunas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+
+        # Ordena por (linha, coluna) e soma as duplicatas
+        ordem = np.lexsort((colunas, linhas))
+        linhas, colunas, valores = linhas[ordem], colunas[ordem], valores[ordem]
+
+        if len(linhas):
+            novo = np.ones(len(linhas), dtype=bool)
+            novo[1:] = (linhas[1:] != linhas[:-1]) | (colunas[1:] != colunas[:-1])
+            grupos = np.cumsum(novo) - 1
+            valores = np.bincount(grupos, weights=valores)
+            linhas, colunas = linhas[novo], colunas[novo]
+
+        # Descarta zeros exatos (ex.: cossenos de barras verticais)
+        nao_nulos = valores != 0
+        linhas, colunas, valores = linhas[nao_nulos], colunas[nao_nulos], valores[nao_nulos]
+
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(linhas, minlength=shape[0]), out=indptr[1:])
+
+        return cls(valores, colunas, indptr, shape)
+
+    @classmethod
+    def de_densa(cls, A_in):
+        A = np.asarray(A_in, dtype=float)
+        linhas, colunas = np.nonzero(A)
+        return cls.de_coordenadas(linhas, colunas, A[linhas, colunas], A.shape)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def coordenadas(self):
+        """Triplas (linhas, colunas, valores) dos não nulos, em ordem de linha."""
+        return self._linhas, self.indices, self.data
+
+    def para_densa(self):
+        A = np.zeros(self.shape)
+        A[self._linhas, self.indices] = self.data
+        return A
+
+    def diagonal(self):
+        d = np.zeros(min(self.shape))
+        na_diagonal = self._linhas == self.indices
+        d[self._linhas[na_diagonal]] = self.data[na_diagonal]
+        return d
+
+    def filtrar(self, manter):
+        """Nova matriz só com os não nulos onde a máscara booleana 'manter' é verdadeira."""
+        return MatrizCSR.de_coordenadas(self._linhas[manter], self.indices[manter],
+                                        self.data[manter], self.shape)
+
+    def triangular_estrita(self):
+        """Partes estritamente inferior (L) e superior (U), sem a diagonal."""
+        return (self.filtrar(self.indices < self._linhas),
+                self.filtrar(self.indices > self._linhas))
+
+    def __matmul__(self, x):
+        """Produto matriz-vetor em O(nnz); com x (n, k), um produto por coluna."""
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 2:
+            return np.column_stack([self @ coluna for coluna in x.T]) if x.shape[1] else np.zeros((self.shape[0], 0))
+        return np.bincount(self._linhas, weights=self.data * x[self.indices], minlength=self.shape[0])
+
+    def permutar(self, linhas=None, colunas=None):
+        """
+        Nova matriz B com B[i, j] = A[linhas[i], colunas[j]]
+        (reordenação de equações e/ou de incógnitas).
+        """
+        nova_linha = np.arange(self.shape[0]) if linhas is None else np.argsort(linhas)
+        nova_coluna = np.arange(self.shape[1]) if colunas is None else np.argsort(colunas)
+        return MatrizCSR.de_coordenadas(nova_linha[self._linhas], nova_coluna[self.indices],
+                                        self.data, self.shape)
@@ -0,0 +1,440 @@
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+# --- LÓGICA MATEMÁTICA (sem dependência de interface gráfica) ---
+
+def _preparar_matriz(A_in, dtype=float):
+    """Converte A para o formato em lote (p, n, n) com cópia em float (ou no dtype pedido)."""
+    A = np.array(A_in, dtype=dtype)
+
+    if A.ndim == 2:
+        A = A[np.newaxis]
+    elif A.ndim != 3:
+        raise ValueError("A matriz deve ter formato (n, n) ou (p, n, n).")
+
+    if A.shape[-1] != A.shape[-2]:
+        raise ValueError("A matriz de coeficientes deve ser quadrada.")
+
+    return A
+
+
+def _preparar_lados_direitos(B_in, p, n, unico):
+    """
+    Converte B para o formato em lote (p, n, m).
+
+    Formatos aceitos:
+      A (n, n)    com B (n,) ou (n, m)        -> um sistema, m lados direitos
+      A (p, n, n) com B (p, n) ou (p, n, m)   -> p sistemas independentes
+    Retorna também a função que devolve a solução no formato original de B.
+    """
+    b = np.array(B_in, dtype=float)
+
+    if unico:
+        b = b[np.newaxis]
+    vetor = b.ndim == 2
+    if vetor:
+        b = b[..., np.newaxis]
+
+    if b.shape[:2] != (p, n):
+        raise ValueError("Dimensões incompatíveis entre A e B.")
+
+    if unico:
+        formato = (lambda x: x[0, :, 0]) if vetor else (lambda x: x[0])
+    else:
+        formato = (lambda x: x[..., 0]) if vetor else (lambda x: x)
+
+    return b, formato
+
+
+def _fatorar_lote(A):
+    """
+    Eliminação Progressiva com pivoteamento parcial, feita no próprio A (p, n, n).
+
+    Ao final, a parte triangular superior de A é U e abaixo da diagonal ficam
+    os fatores multiplicadores (L com diagonal unitária). 'perm' guarda a ordem
+    das linhas após as trocas, de modo que A_original[perm] = L·U.
+    """
+    p, n = A.shape[:2]
+    lotes = np.arange(p)
+    perm = np.tile(np.arange(n), (p, 1))
+
+    for k in range(n - 1):
+        # Pivoteamento Parcial: maior valor absoluto na coluna k (primeiro em caso de empate)
+        indice_max = k + np.argmax(np.abs(A[:, k:, k]), axis=1)
+
+        if np.any(A[lotes, indice_max, k] == 0):
+            raise ValueError("O sistema não tem solução única (Matriz Singular).")
+
+        # Trocar as linhas (inclusive os fatores já guardados, como na troca de b)
+        A[lotes, k], A[lotes, indice_max] = A[lotes, indice_max], A[lotes, k]
+        perm[lotes, k], perm[lotes, indice_max] = perm[lotes, indice_max], perm[lotes, k]
+
+        # Eliminação: atualização de posto 1 de todas as linhas abaixo do pivô
+        fatores = A[:, k + 1:, k] / A[:, k, k, np.newaxis]
+        A[:, k + 1:, k + 1:] -= fatores[:, :, np.newaxis] * A[:, np.newaxis, k, k + 1:]
+        A[:, k + 1:, k] = fatores
+
+    # Verificação final para o último elemento da diagonal
+    if np.any(A[:, n - 1, n - 1] == 0):
+        raise ValueError("O sistema não tem solução única (Matriz Singular).")
+
+    return A, perm
+
+
+# Largura do painel (e lado dos ladrilhos) da fatoração em blocos: 128 colunas float64
+# de um ladrilho 128 x 128 ocupam 128 KiB, cabem no cache L2 dos processadores comuns
+BLOCO_PADRAO = 128
+
+
+def _fatorar_lote_blocado(A, bloco=BLOCO_PADRAO, threads=None):
+    """
+    Mesma eliminação de _fatorar_lote (mesmos pivôs e mesma 'perm'), organizada em blocos:
+
+      1. painel: eliminação com pivoteamento nas colunas k0:k1, atualizando só o painel
+         (as trocas de linha são feitas na linha inteira);
+      2. U12 = L11⁻¹·A12, a faixa de U à direita do painel, por substituição progressiva;
+      3. submatriz restante: A22 -= L21·U12, em ladrilhos bloco x bloco repartidos entre
+         'threads' threads (o produto de matrizes do NumPy libera o GIL).
+
+    O passo 3 concentra quase todo o trabalho e é feito com produtos de matrizes sobre
+    ladrilhos que cabem no cache, em vez de uma atualização de posto 1 por coluna.
+    """
+    p, n = A.shape[:2]
+    lotes = np.arange(p)
+    perm = np.tile(np.arange(n), (p, 1))
+    threads = (os.cpu_count() or 1) if threads is None else max(1, int(threads))
+
+    def atualizar_ladrilho(k0, k1, i0, j0):
+        A[:, i0:i0 + bloco, j0:j0 + bloco] -= A[:, i0:i0 + bloco, k0:k1] @ A[:, k0:k1, j0:j0 + bloco]
+
+    pool = ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
+    try:
+        for k0 in range(0, n, bloco):
+            k1 = min(k0 + bloco, n)
+
+            # 1. Painel
+            for k in range(k0, k1):
+                indice_max = k + np.argmax(np.abs(A[:, k:, k]), axis=1)
+
+                if np.any(A[lotes, indice_max, k] == 0):
+                    raise ValueError("O sistema não tem solução única (Matriz Singular).")
+
+                A[lotes, k], A[lotes, indice_max] = A[lotes, indice_max], A[lotes, k]
+                perm[lotes, k], perm[lotes, indice_max] = perm[lotes, indice_max], perm[lotes, k]
+
+                fatores = A[:, k + 1:, k] / A[:, k, k, np.newaxis]
+                A[:, k + 1:, k + 1:k1] -= fatores[:, :, np.newaxis] * A[:, np.newaxis, k, k + 1:k1]
+                A[:, k + 1:, k] = fatores
+
+            if k1 == n:
+                break
+
+            # 2. Faixa de U à direita do painel: substituição progressiva com L11 (diagonal unitária)
+            _substituicao_progressiva_blocada(A[:, k0:k1, k0:k1], A[:, k0:k1, k1:])
+
+            # 3. Submatriz restante, ladrilho a ladrilho (cada um escreve numa região própria)
+            ladrilhos = [(i0, j0) for i0 in range(k1, n, bloco) for j0 in range(k1, n, bloco)]
+            if pool is None:
+                for i0, j0 in ladrilhos:
+                    atualizar_ladrilho(k0, k1, i0, j0)
+            else:
+                list(pool.map(lambda ij: atualizar_ladrilho(k0, k1, *ij), ladrilhos))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return A, perm
+
+
+def _fatorar(A, bloco=None, threads=None):
+    """Fatoração por colunas (bloco=None, a original) ou em blocos (ver _fatorar_lote_blocado)."""
+    if bloco is None or bloco >= A.shape[-1]:
+        return _fatorar_lote(A)
+    if bloco < 1:
+        raise ValueError("O tamanho do bloco deve ser pelo menos 1.")
+    return _fatorar_lote_blocado(A, int(bloco), threads)
+
+
+def _substituicao_progressiva(LU, y):
+    """Resolve L y' = y (L com diagonal unitária) em lote, sobrescrevendo y (p, n, m)."""
+    n = LU.shape[-1]
+
+    for i in range(1, n):
+        y[:, i] -= np.einsum('pj,pjm->pm', LU[:, i, :i], y[:, :i])
+
+    return y
+
+
+def _substituicao_progressiva_blocada(L, y, sub=32):
+    """Como _substituicao_progressiva, em sub-blocos de 'sub' linhas (o resto vira produto de matrizes)."""
+    n = L.shape[-1]
+    for i0 in range(0, n, sub):
+        i1 = min(i0 + sub, n)
+        _substituicao_progressiva(L[:, i0:i1, i0:i1], y[:, i0:i1])
+        y[:, i1:] -= L[:, i1:, i0:i1] @ y[:, i0:i1]
+    return y
+
+
+def _substituicao_regressiva(U, y):
+    """
+    Resolve U x = y com U triangular superior, em lote: U (p, n, n), y (p, n, m).
+    Cada linha usa um produto vetorizado com as incógnitas já encontradas.
+    """
+    n = U.shape[-1]
+    x = np.zeros_like(y)
+
+    # Começa do último índice (n-1) e vai até 0
+    for i in range(n - 1, -1, -1):
+        soma_conhecidos = np.einsum('pj,pjm->pm', U[:, i, i + 1:], x[:, i + 1:])
+        x[:, i] = (y[:, i] - soma_conhecidos) / U[:, i, i, np.newaxis]
+
+    return x
+
+
+def _resolver_fatorado(LU, perm, b):
+    """Aplica a permutação de linhas e as duas substituições: custo O(n²) por coluna de b."""
+    lotes = np.arange(LU.shape[0])[:, np.newaxis]
+    y = _substituicao_progressiva(LU, b[lotes, perm])
+    return _substituicao_regressiva(LU, y)
+
+
+def resolver_gauss_manual(A_in, B_in, bloco=None, threads=None):
+    """
+    Eliminação de Gauss com pivoteamento parcial.
+    A busca do pivô, a atualização da submatriz e a substituição regressiva
+    são feitas com operações inteiras do NumPy (sem laços internos em Python).
+
+    B pode ser um vetor, um bloco (n, m) de lados direitos resolvidos de uma vez,
+    ou A pode ser uma pilha (p, n, n) de sistemas independentes (ver _preparar_lados_direitos).
+
+    Com 'bloco' (ex.: BLOCO_PADRAO) a fatoração é feita em blocos, com a atualização
+    da submatriz repartida entre 'threads' threads (padrão: todos os núcleos);
+    indicada para sistemas grandes (milhares de incógnitas).
+    """
+    A = _preparar_matriz(A_in)
+    p, n = A.shape[:2]
+    b, formato = _preparar_lados_direitos(B_in, p, n, unico=np.ndim(A_in) == 2)
+
+    LU, perm = _fatorar(A, bloco, threads)
+    return formato(_resolver_fatorado(LU, perm, b))
+
+
+def normas_residuais(A, x, B):
+    """
+    Norma euclidiana do resíduo A·x - B, uma por coluna (ou por sistema do lote).
+    Para um único vetor B equivale a np.linalg.norm(np.dot(A, x) - B).
+    """
+    A = np.asarray(A, dtype=float)
+    x = np.asarray(x, dtype=float)
+    B = np.asarray(B, dtype=float)
+
+    if A.ndim == 3 and x.ndim == 2:
+        # Pilha de sistemas com um vetor cada: resíduo por sistema
+        return np.linalg.norm(np.einsum('pij,pj->pi', A, x) - B, axis=-1)
+
+    residuo = np.matmul(A, x) - B
+    if residuo.ndim == 1:
+        return np.linalg.norm(residuo)
+    return np.linalg.norm(residuo, axis=-2)
+
+
+# --- PRECISÃO MISTA (fatoração em float32 + refinamento iterativo em float64) ---
+
+# Limite de passos de refinamento (o mesmo do dsgesv do LAPACK)
+MAX_REFINAMENTOS = 30
+
+
+class ResultadoRefinamento:
+    """
+    Solução de resolver_gauss_misto: passos de refinamento feitos, precisão efetivamente
+    usada ("mista" ou "float64" quando caiu na eliminação completa) e o erro regressivo
+    final ‖b - A·x‖∞ / (‖A‖∞·‖x‖∞ + ‖b‖∞), o maior entre as colunas/sistemas.
+    """
+
+    def __init__(self, x, passos, precisao, erro, motivo=""):
+        self.x = x
+        self.passos = passos
+        self.precisao = precisao
+        self.erro = erro
+        # Por que caiu para float64 (vazio quando a precisão mista bastou)
+        self.motivo = motivo
+
+    def __repr__(self):
+        motivo = f", motivo='{self.motivo}'" if self.motivo else ""
+        return (f"ResultadoRefinamento(precisao='{self.precisao}', passos={self.passos}, "
+                f"erro={self.erro:.3e}{motivo})")
+
+
+def _erro_regressivo(A, x, b, norma_A):
+    """Resíduo r = b - A·x (em float64) e o maior erro regressivo relativo entre as colunas."""
+    r = b - np.matmul(A, x)
+    escala = norma_A * np.abs(x).max(axis=1) + np.abs(b).max(axis=1)
+    erro = np.abs(r).max(axis=1) / np.where(escala > 0, escala, 1.0)
+    return r, float(erro.max())
+
+
+def _resolver_float32(LU, perm, r):
+    """Resolve com os fatores em float32; cada coluna é normalizada antes (sem under/overflow)."""
+    escala = np.abs(r).max(axis=1, keepdims=True)
+    escala[escala == 0] = 1.0
+    y = _resolver_fatorado(LU, perm, (r / escala).astype(np.float32))
+    return y.astype(float) * escala
+
+
+def resolver_gauss_misto(A_in, B_in, tol=None, max_passos=MAX_REFINAMENTOS, bloco=None, threads=None):
+    """
+    Eliminação de Gauss em precisão mista: a fatoração (O(n³)) é feita numa cópia em
+    float32, com metade da memória e da banda, e a precisão de float64 é recuperada por
+    refinamento iterativo: r = b - A·x em float64, correção resolvida com os fatores
+    float32. A matriz original só é lida (não é copiada se já for float64).
+
+    Se A for mal condicionada demais para o float32 (pivô nulo, valores fora do alcance
+    ou correções que não diminuem pelo menos à metade a cada passo), resolve tudo de novo
+    em float64 com resolver_gauss_manual. Aceita os mesmos formatos de A e B e as
+    mesmas opções de fatoração em blocos (bloco, threads).
+    Retorna um ResultadoRefinamento.
+    """
+    unico = np.ndim(A_in) == 2
+    with np.errstate(over="ignore"):
+        A32 = _preparar_matriz(A_in, np.float32)
+    A = np.asarray(A_in, dtype=float).reshape(A32.shape)
+    p, n = A.shape[:2]
+    b, formato = _preparar_lados_direitos(B_in, p, n, unico)
+
+    if tol is None:
+        tol = np.sqrt(n) * np.finfo(float).eps
+    norma_A = np.abs(A).sum(axis=2).max(axis=1)[:, np.newaxis]
+
+    passos = 0
+    motivo = ""
+    with np.errstate(all="ignore"):
+        try:
+            if not np.all(np.isfinite(A32)):
+                raise ValueError("valores fora do alcance do float32")
+            LU, perm = _fatorar(A32, bloco, threads)
+            if not np.all(np.isfinite(LU)):
+                raise ValueError("fatoração float32 instável")
+        except ValueError as e:
+            motivo = str(e)
+
+        if not motivo:
+            x = _resolver_float32(LU, perm, b)
+            variacao_anterior = np.inf
+            while True:
+                r, erro = _erro_regressivo(A, x, b, norma_A)
+                if erro <= tol:
+                    return ResultadoRefinamento(formato(x), passos, "mista", erro)
+                if passos == max_passos:
+                    motivo = f"sem convergência em {max_passos} passos de refinamento"
+                    break
+
+                correcao = _resolver_float32(LU, perm, r)
+                x += correcao
+                passos += 1
+
+                # Contração ~ cond(A)·eps(float32): se não cai à metade, o float32 não basta
+                variacao = float(np.abs(correcao).max() / max(np.abs(x).max(), 1e-300))
+                if not np.isfinite(variacao) or variacao > variacao_anterior / 2:
+                    motivo = "matriz mal condicionada para float32"
+                    break
+                variacao_anterior = variacao
+
+    x = _preparar_lados_direitos(resolver_gauss_manual(A_in, B_in, bloco, threads), p, n, unico)[0]
+    _, erro = _erro_regressivo(A, x, b, norma_A)
+    return ResultadoRefinamento(formato(x), passos, "float64", erro, motivo)
+
+
+# --- FATORAÇÃO REUTILIZÁVEL ---
+
+class FatoracaoLU:
+    """
+    Fatoração LU de uma matriz (n, n) com a mesma permutação do pivoteamento parcial
+    de resolver_gauss_manual. É calculada uma vez (O(n³)) e depois cada novo
+    lado direito custa só as substituições (O(n²)).
+    bloco/threads: fatoração em blocos, como em resolver_gauss_manual.
+    """
+
+    def __init__(self, A_in, bloco=None, threads=None):
+        A = _preparar_matriz(A_in)
+        if A.shape[0] != 1:
+            raise ValueError("FatoracaoLU recebe uma única matriz (n, n).")
+
+        self._LU, self._perm = _fatorar(A, bloco, threads)
+        self.n = A.shape[-1]
+
+    @property
+    def L(self):
+        return np.tril(self._LU[0], -1) + np.eye(self.n)
+
+    @property
+    def U(self):
+        return np.triu(self._LU[0])
+
+    @property
+    def perm(self):
+        """Ordem das linhas de A após as trocas: A[perm] = L·U."""
+        return self._perm[0].copy()
+
+    def resolver(self, B_in):
+        """Resolve A x = B para B vetor (n,) ou bloco (n, m)."""
+        b, formato = _preparar_lados_direitos(B_in, 1, self.n, unico=True)
+        return formato(_resolver_fatorado(self._LU, self._perm, b))
+
+
+def chave_matriz(A_in):
+    """Chave de cache pelo conteúdo da matriz (formato + bytes em float64)."""
+    A = np.ascontiguousarray(A_in, dtype=float)
+    return A.shape, hashlib.sha1(A.tobytes()).hexdigest()
+
+
+class CacheFatoracoes:
+    """
+    Cache LRU de FatoracaoLU indexado pelo conteúdo da matriz.
+    Quando passa da capacidade, descarta a fatoração usada há mais tempo.
+    """
+
+    def __init__(self, capacidade=32, bloco=None, threads=None):
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser pelo menos 1.")
+
+        self.capacidade = capacidade
+        # Opções da fatoração em blocos repassadas a FatoracaoLU
+        self.bloco = bloco
+        self.threads = threads
+        self._itens = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    def __len__(self):
+        return len(self._itens)
+
+    def obter(self, A_in):
+        """Devolve a fatoração de A, calculando-a apenas se ainda não estiver no cache."""
+        chave = chave_matriz(A_in)
+
+        if chave in self._itens:
+            self._itens.move_to_end(chave)
+            self.acertos += 1
+            return self._itens[chave]
+
+        self.falhas += 1
+        fatoracao = FatoracaoLU(A_in, self.bloco, self.threads)
+        self._itens[chave] = fatoracao
+        if len(self._itens) > self.capacidade:
+            self._itens.popitem(last=False)
+
+        return fatoracao
+
+    def resolver(self, A_in, B_in):
+        """Atalho para obter(A).resolver(B)."""
+        return self.obter(A_in).resolver(B_in)
+
+    def limpar(self):
+        self._itens.clear()
+        self.acertos = 0
+        self.falhas = 0
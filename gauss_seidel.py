@@ -0,0 +1,288 @@
+import time
+
+import numpy as np
+
+from esparsa import MatrizCSR
+from reordenacao import reordenar as reordenar_equacoes
+
+
+# --- LÓGICA MATEMÁTICA (sem dependência de interface gráfica) ---
+
+class ResultadoIterativo:
+    """Resultado de um método iterativo: solução, convergência, iterações e erro final."""
+
+    def __init__(self, x, convergiu, iteracoes, erro, ordem=None, omega=1.0, omega_estimado=False):
+        self.x = x
+        self.convergiu = convergiu
+        self.iteracoes = iteracoes
+        self.erro = erro
+        # Ordem das equações usada (None quando o sistema não foi reordenado)
+        self.ordem = ordem
+        # Fator de relaxação final (1.0 no Gauss-Seidel)
+        self.omega = omega
+        # True quando omega foi estimado pelo SOR adaptativo (e não fixado ou ainda no aquecimento)
+        self.omega_estimado = omega_estimado
+
+    def __repr__(self):
+        relaxacao = f", omega={self.omega:.4f}" if self.omega != 1.0 else ""
+        return (f"ResultadoIterativo(convergiu={self.convergiu}, iteracoes={self.iteracoes}, "
+                f"erro={self.erro:.3e}{relaxacao})")
+
+
+def _inverso_diagonal(diagonal):
+    """Inverso da diagonal, com a mesma verificação de pivô nulo do solver original."""
+    nulos = np.flatnonzero(np.abs(diagonal) < 1e-9)
+    if nulos.size:
+        raise ValueError(f"Divisão por zero na linha {nulos[0] + 1}")
+    return 1.0 / diagonal
+
+
+def _por_linha(v, x):
+    """v (n,) ajustado para operar com x (n,) ou com um bloco x (n, k) de casos."""
+    return v if x.ndim == 1 else v[:, np.newaxis]
+
+
+def erro_relativo_maximo(x, x_old):
+    """
+    Critério de parada do solver da treliça: erro relativo |(x - x_old) / x|
+    em cada componente (absoluto quando |x| <= 1e-9), retornando o maior.
+    """
+    delta = np.abs(x - x_old)
+    modulo = np.abs(x)
+    relativo = modulo > 1e-9
+    err = np.divide(delta, modulo, out=delta.copy(), where=relativo)
+    return float(err.max()) if err.size else 0.0
+
+
+class _VarreduraDensa:
+    """
+    Varreduras de Gauss-Seidel/SOR para matriz densa.
+
+    Na varredura progressiva a parte U estrita usa o x da varredura anterior
+    (um produto matriz-vetor, c = b - U·x) e a parte L estrita usa o x já
+    atualizado, linha a linha. A regressiva (usada no SSOR) faz o oposto.
+    """
+
+    def __init__(self, A):
+        self.inv_diag = _inverso_diagonal(np.diagonal(A).copy())
+        self.U = np.triu(A, 1)
+        self.L = np.tril(A, -1)
+
+    def residuo(self, x, b):
+        return np.linalg.norm(b - self.L @ x - self.U @ x - x / _por_linha(self.inv_diag, x))
+
+    def progressiva(self, x, c, omega):
+        L, inv_diag = self.L, self.inv_diag
+        for i in range(len(x)):
+            x[i] = (1 - omega) * x[i] + omega * (c[i] - L[i, :i] @ x[:i]) * inv_diag[i]
+
+    def regressiva(self, x, c, omega):
+        U, inv_diag = self.U, self.inv_diag
+        for i in range(len(x) - 1, -1, -1):
+            x[i] = (1 - omega) * x[i] + omega * (c[i] - U[i, i + 1:] @ x[i + 1:]) * inv_diag[i]
+
+
+class _VarreduraEsparsa:
+    """Mesmas varreduras para MatrizCSR: o custo por iteração é proporcional a nnz."""
+
+    def __init__(self, A):
+        self.inv_diag = _inverso_diagonal(A.diagonal())
+        self.L, self.U = A.triangular_estrita()
+        self._linhas_L, self._vazias_L = self._fatias(self.L)
+        self._linhas_U, self._vazias_U = self._fatias(self.U)
+        self._linhas_U.reverse()
+
+    @staticmethod
+    def _fatias(T):
+        # Fatias por linha (linhas sem termos na parte triangular não fazem produto)
+        linhas = [(i, T.indices[s:e], T.data[s:e])
+                  for i, (s, e) in enumerate(zip(T.indptr[:-1], T.indptr[1:])) if e > s]
+        vazias = np.setdiff1d(np.arange(T.shape[0]), [i for i, _, _ in linhas])
+        return linhas, vazias
+
+    def residuo(self, x, b):
+        return np.linalg.norm(b - self.L @ x - self.U @ x - x / _por_linha(self.inv_diag, x))
+
+    def _varrer(self, x, c, omega, linhas, vazias):
+        inv_diag = self.inv_diag
+        # Linhas sem dependência dentro da varredura são atualizadas de uma vez
+        x[vazias] = (1 - omega) * x[vazias] + omega * c[vazias] * _por_linha(inv_diag[vazias], x)
+        for i, colunas, valores in linhas:
+            x[i] = (1 - omega) * x[i] + omega * (c[i] - valores @ x[colunas]) * inv_diag[i]
+
+    def progressiva(self, x, c, omega):
+        self._varrer(x, c, omega, self._linhas_L, self._vazias_L)
+
+    def regressiva(self, x, c, omega):
+        self._varrer(x, c, omega, self._linhas_U, self._vazias_U)
+
+
+def omega_otimo(rho_gs, simetrico=False):
+    """
+    Estimativa clássica (Young) do fator de relaxação ótimo a partir do raio
+    espectral observado do Gauss-Seidel (rho_gs ≈ μ², μ = raio do Jacobi).
+    Retorna 1.0 (Gauss-Seidel puro) quando a estimativa não é utilizável.
+    """
+    if not 0 < rho_gs < 1:
+        return 1.0
+    if simetrico:
+        return 2.0 / (1.0 + np.sqrt(2.0 * (1.0 - np.sqrt(rho_gs))))
+    return 2.0 / (1.0 + np.sqrt(1.0 - rho_gs))
+
+
+class _RelaxacaoAdaptativa:
+    """
+    Escolha automática de omega a partir da taxa de convergência observada.
+
+    1. Aquecimento com Gauss-Seidel (omega = 1): se a razão ||x_k - x_{k-1}|| / ||x_{k-1} - x_{k-2}||
+       estabiliza, o autovalor dominante é real e vale a fórmula de Young (omega_otimo).
+    2. Se a razão oscila (autovalor dominante complexo, comum na treliça não simétrica),
+       a fórmula não se aplica: testa sub-relaxações 0.9, 0.8, ... por 'aquecimento'
+       varreduras cada e fica com a de menor taxa média, parando quando piora.
+    """
+
+    CANDIDATOS_SUB = (0.9, 0.8, 0.7, 0.6, 0.5)
+
+    def __init__(self, aquecimento, simetrico):
+        self.aquecimento = aquecimento
+        self.simetrico = simetrico
+        self.omega = 1.0
+        self.ativo = True
+        self._razoes = []
+        self._passo_anterior = None
+        self._taxas = {}
+        self._candidatos = list(self.CANDIDATOS_SUB)
+
+    def _taxa_media(self):
+        # Média geométrica das razões, descartando a primeira (transitório da troca de omega)
+        razoes = np.array(self._razoes[1:] or self._razoes)
+        return float(np.exp(np.mean(np.log(np.maximum(razoes, 1e-300)))))
+
+    def observar(self, passo):
+        """Recebe ||x_k - x_{k-1}|| e devolve o omega para a próxima varredura."""
+        if self._passo_anterior:
+            self._razoes.append(passo / self._passo_anterior)
+        self._passo_anterior = passo
+
+        razoes = self._razoes
+        if (not self._taxas and len(razoes) >= 3 and razoes[-1] < 1
+                and abs(razoes[-1] - razoes[-2]) < 1e-3 * razoes[-1]):
+            # Convergência monótona: estimativa de Young e fim da adaptação
+            self.omega = omega_otimo(razoes[-1], self.simetrico)
+            self.ativo = False
+        elif len(razoes) >= self.aquecimento:
+            self._taxas[self.omega] = self._taxa_media()
+            melhor = min(self._taxas, key=self._taxas.get)
+
+            if self._candidatos and melhor == self.omega:
+                # Ainda melhorando: testa a próxima sub-relaxação
+                self.omega = self._candidatos.pop(0)
+                self._razoes = []
+            else:
+                self.omega = melhor
+                self.ativo = False
+
+        return self.omega
+
+
+# Fator de crescimento de |x| (sobre a escala de b e do chute) tratado como divergência
+LIMITE_DIVERGENCIA = 1e100
+
+
+def _estimado(adaptativo):
+    return adaptativo is not None and not adaptativo.ativo
+
+
+def sor(A_in, b_in, x0=None, tol=1e-4, max_iter=500, omega=None, simetrico=False,
+        reordenar=False, aquecimento=10, callback=None, historico=None):
+    """
+    Sobre-relaxação sucessiva (SOR) ou simétrica (SSOR, simetrico=True).
+
+    omega=None ativa o modo automático (_RelaxacaoAdaptativa): as primeiras varreduras
+    são Gauss-Seidel puro e a taxa de convergência observada define omega.
+    Com omega=1 e simetrico=False é exatamente o Gauss-Seidel.
+    O teste de parada é o mesmo da interface: maior erro relativo < tol. Se x diverge
+    (não finito, ou acima de LIMITE_DIVERGENCIA vezes a escala dos dados) o método para
+    na hora, com convergiu=False e as iterações feitas até ali.
+
+    Com reordenar=True as equações são permutadas antes (ver reordenacao.py) para
+    maximizar a diagonal; a ordem aplicada fica em resultado.ordem.
+
+    b pode ser um bloco (n, k) de casos de carga: cada varredura percorre as linhas uma
+    vez para todos os casos, e o teste de parada usa o maior erro entre eles.
+
+    Instrumentação (desligada por padrão, sem custo no laço):
+      callback(k, x, erro) é chamado após cada varredura; se retornar True, o método para.
+      historico (HistoricoConvergencia) recebe erro, resíduo e tempos de cada varredura.
+    """
+    ordem = None
+    if reordenar:
+        A_in, b_in, ordem = reordenar_equacoes(A_in, b_in)
+
+    b = np.asarray(b_in, dtype=float)
+    monitorar = callback is not None or historico is not None
+
+    if isinstance(A_in, MatrizCSR):
+        varredura = _VarreduraEsparsa(A_in)
+    else:
+        varredura = _VarreduraDensa(np.asarray(A_in, dtype=float))
+
+    x = np.zeros(b.shape)
+    if x0 is not None:
+        x0 = np.asarray(x0, dtype=float)
+        # Com um bloco de casos, um chute inicial único vale para todos
+        x[...] = x0[:, np.newaxis] if x0.ndim < b.ndim else x0
+    x_old = np.empty(b.shape)
+
+    # Divergência: |x| passa LIMITE_DIVERGENCIA vezes a escala dos dados (antes do overflow)
+    limite = LIMITE_DIVERGENCIA * max(1.0, float(np.abs(b).max(initial=0.0)), float(np.abs(x).max(initial=0.0)))
+
+    adaptativo = _RelaxacaoAdaptativa(aquecimento, simetrico) if omega is None else None
+    w = 1.0 if adaptativo else float(omega)
+
+    max_err = 0.0
+    if monitorar:
+        inicio = time.perf_counter()
+
+    for k in range(max_iter):
+        if monitorar:
+            t0 = time.perf_counter()
+
+        x_old[:] = x
+
+        varredura.progressiva(x, b - varredura.U @ x, w)
+        if simetrico:
+            varredura.regressiva(x, b - varredura.L @ x, w)
+
+        max_err = erro_relativo_maximo(x, x_old)
+
+        if monitorar:
+            t1 = time.perf_counter()
+            if historico is not None:
+                residuo = varredura.residuo(x, b) if historico.calcular_residuo else None
+                historico.registrar(k + 1, max_err, residuo, t1 - t0, t1 - inicio, w)
+            if callback is not None and callback(k + 1, x, max_err):
+                return ResultadoIterativo(x, max_err < tol, k + 1, max_err, ordem, w, _estimado(adaptativo))
+
+        if max_err < tol:
+            return ResultadoIterativo(x, True, k + 1, max_err, ordem, w, _estimado(adaptativo))
+
+        if not np.isfinite(max_err) or np.abs(x).max(initial=0.0) > limite:
+            return ResultadoIterativo(x, False, k + 1, max_err, ordem, w, _estimado(adaptativo))
+
+        if adaptativo and adaptativo.ativo:
+            w = adaptativo.observar(np.linalg.norm(x - x_old))
+
+    return ResultadoIterativo(x, False, max_iter, max_err, ordem, w, _estimado(adaptativo))
+
+
+def gauss_seidel(A_in, b_in, x0=None, tol=1e-4, max_iter=500, reordenar=False, callback=None, historico=None):
+    """
+    Método de Gauss-Seidel com matriz densa (NumPy) ou esparsa (MatrizCSR).
+
+    A diagonal é invertida uma vez; cada linha faz um produto escalar com a parte
+    fora da diagonal (L estrita com o x já atualizado no lugar, U estrita com o x
+    da varredura anterior). Equivale a sor(..., omega=1.0).
+    """
+    return sor(A_in, b_in, x0=x0, tol=tol, max_iter=max_iter, omega=1.0, reordenar=reordenar,
+               callback=callback, historico=historico)
@@ -0,0 +1,130 @@
+import numpy as np
+
+
+# --- ATUALIZAÇÃO DE GRÁFICOS SEM RECONSTRUIR OS EIXOS ---
+#
+# Os eixos e o canvas vêm prontos de quem chama; matplotlib só é importado aqui
+# ao criar os artistas, para não pesar na importação dos scripts.
+
+# Acima disso a série é reduzida antes de ir para a tela (mais pontos que pixels)
+MAX_PONTOS_TELA = 4000
+
+
+def decimar_envelope(x, y, max_pontos=MAX_PONTOS_TELA):
+    """
+    Reduz a série a no máximo ~max_pontos preservando o envelope: em cada bloco de
+    índices guarda o ponto de menor e o de maior x, na ordem original. Picos e
+    cantos do casco continuam visíveis. Retorna (x, y) possivelmente sem cópia.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+    if n <= max_pontos:
+        return x, y
+
+    tamanho = int(np.ceil(n / (max_pontos // 2)))
+    n_blocos = n // tamanho
+    corpo = x[:n_blocos * tamanho].reshape(n_blocos, tamanho)
+    base = np.arange(n_blocos)[:, np.newaxis] * tamanho
+    extremos = np.concatenate([base + corpo.argmin(axis=1)[:, np.newaxis],
+                               base + corpo.argmax(axis=1)[:, np.newaxis]], axis=1)
+    indices = np.unique(np.concatenate([[0], extremos.ravel(), np.arange(n_blocos * tamanho, n), [n - 1]]))
+    return x[indices], y[indices]
+
+
+class AtualizadorBlit:
+    """
+    Redesenha só os artistas dinâmicos sobre um fundo guardado (blitting).
+
+    O fundo (eixos, grade, legenda, artistas estáticos) é capturado a cada desenho
+    completo do canvas. Sem suporte a blit, ou quando os limites dos eixos mudam,
+    cai no desenho completo.
+    """
+
+    def __init__(self, canvas, artistas):
+        self.canvas = canvas
+        self.artistas = list(artistas)
+        self._fundo = None
+        for artista in self.artistas:
+            artista.set_animated(True)
+        canvas.mpl_connect("draw_event", self._ao_desenhar)
+
+    def _ao_desenhar(self, evento):
+        self._fundo = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._desenhar_artistas()
+
+    def _desenhar_artistas(self):
+        figura = self.canvas.figure
+        for artista in self.artistas:
+            figura.draw_artist(artista)
+
+    def atualizar(self, redesenhar_tudo=False):
+        if redesenhar_tudo or self._fundo is None or not self.canvas.supports_blit:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._fundo)
+        self._desenhar_artistas()
+        self.canvas.blit(self.canvas.figure.bbox)
+        self.canvas.flush_events()
+
+
+def _ajustar_limites(ax, xmin, xmax, ymin, ymax, folga=0.05):
+    """Amplia os limites quando os dados saem deles ou ocupam pouco espaço. Retorna se mudou."""
+    x0, x1 = ax.get_xlim()
+    y0, y1 = ax.get_ylim()
+    dx = (xmax - xmin) or 1.0
+    dy = (ymax - ymin) or 1.0
+    fora = xmin < x0 or xmax > x1 or ymin < y0 or ymax > y1
+    # Dados muito menores que a janela (ex.: nova seção menor) também pedem reajuste
+    pequeno = (x1 - x0) > 4 * dx or (y1 - y0) > 4 * dy
+    if not (fora or pequeno):
+        return False
+    ax.set_xlim(xmin - folga * dx, xmax + folga * dx)
+    ax.set_ylim(ymin - folga * dy, ymax + folga * dy)
+    return True
+
+
+class PerfilCasco:
+    """
+    Perfil da seção transversal (casco, área preenchida e linha de centro) criado uma
+    vez; atualizar(z, y) só troca os dados dos artistas.
+    """
+
+    def __init__(self, ax, max_pontos=MAX_PONTOS_TELA):
+        from matplotlib.patches import Polygon
+
+        self.ax = ax
+        self.max_pontos = max_pontos
+
+        self.preenchimento = Polygon(np.zeros((1, 2)), closed=True, facecolor='skyblue', alpha=0.6,
+                                     edgecolor='none', label='Área Integrada')
+        ax.add_patch(self.preenchimento)
+        self.linha, = ax.plot([], [], 'o-', color='navy', linewidth=2, label='Casco')
+        ax.axvline(0, color='black', linestyle='-', linewidth=0.5)
+
+        # Estética (fixa)
+        ax.set_title("Perfil da Seção Transversal", fontsize=14)
+        ax.set_xlabel("Largura (m)")
+        ax.set_ylabel("Profundidade (m)")
+        ax.grid(True, linestyle='--', alpha=0.5)
+        ax.legend(handles=[self.linha, self.preenchimento])
+        ax.set_aspect('equal')  # Mantém a proporção visual correta
+
+        self.blit = AtualizadorBlit(ax.figure.canvas, [self.preenchimento, self.linha])
+
+    def atualizar(self, z, y):
+        profundidades = -np.asarray(z, dtype=float)
+        larguras, profundidades = decimar_envelope(np.asarray(y, dtype=float), profundidades, self.max_pontos)
+
+        # Marcadores só fazem sentido com poucos pontos
+        self.linha.set_marker('o' if len(larguras) <= 200 else '')
+        self.linha.set_data(larguras, profundidades)
+
+        # Polígono: casco de cima para baixo e volta pela linha de centro
+        eixo = np.zeros_like(profundidades)
+        self.preenchimento.set_xy(np.column_stack([np.concatenate([larguras, eixo[::-1]]),
+                                                   np.concatenate([profundidades, profundidades[::-1]])]))
+
+        mudou = _ajustar_limites(self.ax, min(0.0, larguras.min()), max(0.0, larguras.max()),
+                                 profundidades.min(), profundidades.max())
+        self.blit.atualizar(redesenhar_tudo=mudou)
@@ -0,0 +1,128 @@
+import csv
+
+import numpy as np
+
+from navio import pesos_simpson
+
+
+# --- HIDROSTÁTICA DO CASCO A PARTIR DA TABELA DE COTAS ---
+#
+# Convenções:
+#   meias_larguras[i, j] = meia-largura na estação i (x = i·dx, a partir da popa)
+#                          e na linha d'água j (z = j·dz, a partir da quilha)
+#   Integrais em z e em x usam a mesma regra de Simpson de navio.py (com o trapézio
+#   no último intervalo quando o número de intervalos é ímpar).
+#   Calados fora da grade: Simpson até a linha d'água abaixo + trapézio até o calado,
+#   com a meia-largura interpolada linearmente.
+
+
+def _pesos_vertical(calados, n_linhas, dz):
+    """
+    Matrizes (n_calados, n_linhas) que, multiplicadas pelas meias-larguras de uma
+    estação, dão: ∫₀ᵀ y dz (area), ∫₀ᵀ y·z dz (momento) e y(T) (linha d'água).
+    """
+    z = np.arange(n_linhas) * dz
+    W_area = np.zeros((len(calados), n_linhas))
+    W_momento = np.zeros((len(calados), n_linhas))
+    W_linha = np.zeros((len(calados), n_linhas))
+
+    for k, T in enumerate(calados):
+        j = min(int(np.floor(T / dz + 1e-9)), n_linhas - 1)
+        if j >= 1:
+            w = pesos_simpson(j + 1, dz)
+            W_area[k, :j + 1] = w
+            W_momento[k, :j + 1] = w * z[:j + 1]
+
+        # Trecho parcial z_j..T (trapézio), com y(T) interpolado entre j e j+1
+        resto = T - z[j]
+        if resto > 1e-9 * dz:
+            t = resto / dz
+            W_linha[k, j] = 1 - t
+            W_linha[k, j + 1] = t
+            W_area[k, j] += resto / 2
+            W_area[k] += resto / 2 * W_linha[k]
+            W_momento[k, j] += resto / 2 * z[j]
+            W_momento[k] += resto / 2 * T * W_linha[k]
+        else:
+            W_linha[k, j] = 1.0
+
+    return W_area, W_momento, W_linha
+
+
+def curva_areas_secionais(meias_larguras, dz, calado):
+    """Área imersa de cada estação (casco simétrico: 2·∫ y dz) para um calado."""
+    Y = np.asarray(meias_larguras, dtype=float)
+    W_area, _, _ = _pesos_vertical([calado], Y.shape[1], dz)
+    return 2 * (Y @ W_area[0])
+
+
+class TabelaHidrostatica:
+    """
+    Curvas hidrostáticas para vários calados (um valor por calado em cada atributo).
+
+    volume, deslocamento, lcb, vcb (KB), area_flutuacao, lcf, inercia_transversal,
+    inercia_longitudinal (em torno do LCF), bmt, bml, kmt, kml, tpc e cb.
+    Posições longitudinais medidas a partir da estação 0; verticais a partir da quilha.
+    """
+
+    CAMPOS = ("calado", "volume", "deslocamento", "lcb", "vcb", "area_flutuacao", "lcf",
+              "inercia_transversal", "inercia_longitudinal", "bmt", "bml", "kmt", "kml", "tpc", "cb")
+
+    def __init__(self, meias_larguras, dx, dz, calados=None, densidade=1.025):
+        Y = np.asarray(meias_larguras, dtype=float)
+        if Y.ndim != 2 or Y.shape[0] < 2 or Y.shape[1] < 2:
+            raise ValueError("A tabela de cotas precisa de pelo menos 2 estações e 2 linhas d'água.")
+
+        n_estacoes, n_linhas = Y.shape
+        calado_max = (n_linhas - 1) * dz
+        self.calado = (np.arange(1, n_linhas) * dz if calados is None
+                       else np.atleast_1d(np.asarray(calados, dtype=float)))
+        if np.any(self.calado <= 0) or np.any(self.calado > calado_max * (1 + 1e-12)):
+            raise ValueError(f"Calados devem estar em (0, {calado_max:g}].")
+
+        x = np.arange(n_estacoes) * dx
+        wx = pesos_simpson(n_estacoes, dx)
+        W_area, W_momento, W_linha = _pesos_vertical(self.calado, n_linhas, dz)
+
+        # Curvas de áreas secionais e momentos verticais: (n_estacoes, n_calados)
+        areas = 2 * (Y @ W_area.T)
+        momentos_z = 2 * (Y @ W_momento.T)
+        y_flutuacao = Y @ W_linha.T
+
+        # Integração ao longo do comprimento
+        self.volume = wx @ areas
+        self.deslocamento = densidade * self.volume
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.lcb = (wx * x) @ areas / self.volume
+            self.vcb = wx @ momentos_z / self.volume
+
+            # Plano de flutuação
+            self.area_flutuacao = 2 * (wx @ y_flutuacao)
+            self.lcf = 2 * ((wx * x) @ y_flutuacao) / self.area_flutuacao
+            self.inercia_transversal = (2 / 3) * (wx @ y_flutuacao ** 3)
+            self.inercia_longitudinal = (2 * ((wx * x ** 2) @ y_flutuacao)
+                                         - self.area_flutuacao * self.lcf ** 2)
+
+            self.bmt = self.inercia_transversal / self.volume
+            self.bml = self.inercia_longitudinal / self.volume
+            self.kmt = self.vcb + self.bmt
+            self.kml = self.vcb + self.bml
+            self.tpc = self.area_flutuacao * densidade / 100
+
+            boca = 2 * y_flutuacao.max(axis=0)
+            self.cb = self.volume / ((n_estacoes - 1) * dx * boca * self.calado)
+
+        self.areas_secionais = areas
+
+    def __len__(self):
+        return len(self.calado)
+
+    def linhas(self):
+        colunas = [getattr(self, campo) for campo in self.CAMPOS]
+        return [dict(zip(self.CAMPOS, map(float, valores))) for valores in zip(*colunas)]
+
+    def para_csv(self, caminho):
+        with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+            escritor = csv.DictWriter(arquivo, fieldnames=self.CAMPOS)
+            escritor.writeheader()
+            escritor.writerows(self.linhas())
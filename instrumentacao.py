@@ -0,0 +1,72 @@
+import csv
+import json
+
+import numpy as np
+
+
+# --- HISTÓRICO DE CONVERGÊNCIA DOS MÉTODOS ITERATIVOS ---
+
+class HistoricoConvergencia:
+    """
+    Registro por iteração: erro do critério de parada, norma do resíduo ||b - A·x||,
+    tempo da varredura e tempo acumulado (segundos).
+
+    Só é preenchido quando passado ao solver (historico=...); sem ele o laço
+    não mede tempo nem calcula resíduo.
+    """
+
+    CAMPOS = ("iteracao", "erro", "residuo", "tempo_varredura", "tempo_total", "omega")
+
+    def __init__(self, calcular_residuo=True):
+        self.calcular_residuo = calcular_residuo
+        self.registros = []
+
+    def __len__(self):
+        return len(self.registros)
+
+    def registrar(self, iteracao, erro, residuo, tempo_varredura, tempo_total, omega=1.0):
+        self.registros.append({
+            "iteracao": iteracao,
+            "erro": float(erro),
+            "residuo": None if residuo is None else float(residuo),
+            "tempo_varredura": tempo_varredura,
+            "tempo_total": tempo_total,
+            "omega": float(omega),
+        })
+
+    def coluna(self, campo):
+        return np.array([np.nan if r[campo] is None else r[campo] for r in self.registros], dtype=float)
+
+    def taxa_convergencia(self, janela=10):
+        """
+        Fator médio de redução por iteração nas últimas 'janela' iterações
+        (média geométrica de e_k / e_{k-1}); < 1 indica convergência.
+        Usa a norma do resíduo quando registrada, senão o erro do critério de parada.
+        """
+        campo = "residuo" if self.calcular_residuo else "erro"
+        erros = self.coluna(campo)[-(janela + 1):]
+        erros = erros[np.isfinite(erros) & (erros > 0)]
+        if len(erros) < 2:
+            return float("nan")
+        return float(np.exp(np.mean(np.diff(np.log(erros)))))
+
+    def resumo(self):
+        tempos = self.coluna("tempo_varredura")
+        taxa = self.taxa_convergencia()
+        return {
+            "iteracoes": len(self.registros),
+            "erro_final": self.registros[-1]["erro"] if self.registros else None,
+            "taxa_convergencia": taxa if np.isfinite(taxa) else None,
+            "tempo_total": self.registros[-1]["tempo_total"] if self.registros else 0.0,
+            "tempo_medio_varredura": float(tempos.mean()) if len(tempos) else 0.0,
+        }
+
+    def para_csv(self, caminho):
+        with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+            escritor = csv.DictWriter(arquivo, fieldnames=self.CAMPOS)
+            escritor.writeheader()
+            escritor.writerows(self.registros)
+
+    def para_json(self, caminho):
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump({"resumo": self.resumo(), "registros": self.registros}, arquivo, indent=2)
@@ -0,0 +1,349 @@
+import numpy as np
+
+from esparsa import MatrizCSR
+from gauss_seidel import ResultadoIterativo, _inverso_diagonal
+from reordenacao import largura_banda, ordem_banda, reordenar as reordenar_equacoes
+
+
+# --- MÉTODOS DE KRYLOV (GMRES reiniciado e BiCGSTAB) PARA A TRELIÇA NÃO SIMÉTRICA ---
+
+def _operador(A):
+    """
+    Converte A em uma função x -> A·x.
+    Aceita matriz densa, MatrizCSR ou uma função (modo sem matriz, 'matrix-free').
+    """
+    if callable(A) and not isinstance(A, (np.ndarray, MatrizCSR)):
+        return A
+    if isinstance(A, MatrizCSR):
+        return lambda x: A @ x
+    A = np.asarray(A, dtype=float)
+    return lambda x: A @ x
+
+
+class PrecondJacobi:
+    """Pré-condicionador de Jacobi: M⁻¹·r = r / diag(A)."""
+
+    def __init__(self, diagonal):
+        self.inv_diag = _inverso_diagonal(np.asarray(diagonal, dtype=float))
+
+    @classmethod
+    def de_matriz(cls, A):
+        if isinstance(A, MatrizCSR):
+            return cls(A.diagonal())
+        return cls(np.diagonal(np.asarray(A, dtype=float)))
+
+    def aplicar(self, r):
+        return r * self.inv_diag
+
+
+class PrecondILU0:
+    """
+    Fatoração LU incompleta sem preenchimento (ILU(0)): L e U têm o mesmo padrão de
+    não nulos de A. Aplicar custa duas substituições esparsas, O(nnz).
+    """
+
+    def __init__(self, A):
+        A = A if isinstance(A, MatrizCSR) else MatrizCSR.de_densa(A)
+        n = A.shape[0]
+        indptr, indices = A.indptr, A.indices
+        valores = A.data.copy()
+
+        # Posição da diagonal em cada linha
+        linhas, _, _ = A.coordenadas()
+        diag_pos = np.full(n, -1, dtype=np.int64)
+        na_diagonal = np.flatnonzero(linhas == indices)
+        diag_pos[linhas[na_diagonal]] = na_diagonal
+        if np.any(diag_pos < 0):
+            raise ValueError(f"Divisão por zero na linha {np.flatnonzero(diag_pos < 0)[0] + 1}")
+
+        # Eliminação restrita ao padrão de A (algoritmo IKJ)
+        for i in range(1, n):
+            s, e = indptr[i], indptr[i + 1]
+            colunas_i = indices[s:e]
+            for p in range(s, diag_pos[i]):
+                k = indices[p]
+                if abs(valores[diag_pos[k]]) < 1e-300:
+                    raise ValueError(f"Divisão por zero na linha {k + 1}")
+                valores[p] /= valores[diag_pos[k]]
+
+                # a_ij -= a_ik · a_kj apenas para j > k presente nas duas linhas
+                sk, ek = diag_pos[k] + 1, indptr[k + 1]
+                pos = np.searchsorted(colunas_i, indices[sk:ek])
+                pos_valida = pos < len(colunas_i)
+                comuns = np.zeros(ek - sk, dtype=bool)
+                comuns[pos_valida] = colunas_i[pos[pos_valida]] == indices[sk:ek][pos_valida]
+                valores[s + pos[comuns]] -= valores[p] * valores[sk:ek][comuns]
+
+        self._fatias_L = [(i, indices[indptr[i]:diag_pos[i]], valores[indptr[i]:diag_pos[i]])
+                          for i in range(n) if diag_pos[i] > indptr[i]]
+        self._fatias_U = [(i, indices[diag_pos[i] + 1:indptr[i + 1]], valores[diag_pos[i] + 1:indptr[i + 1]])
+                          for i in range(n - 1, -1, -1)]
+        self.inv_diag = _inverso_diagonal(valores[diag_pos])
+
+    def aplicar(self, r):
+        y = np.array(r, dtype=float)
+        # L com diagonal unitária
+        for i, colunas, valores in self._fatias_L:
+            y[i] -= valores @ y[colunas]
+        # U
+        for i, colunas, valores in self._fatias_U:
+            y[i] = (y[i] - valores @ y[colunas]) * self.inv_diag[i]
+        return y
+
+
+class PrecondILUBanda:
+    """
+    LU incompleta restrita a uma faixa: as incógnitas são renumeradas por Cuthill-McKee
+    reverso (ordem_banda, mesma ordem nas equações) e a eliminação guarda todo o
+    preenchimento a até 'largura' posições da diagonal, descartando o resto.
+
+    Quando a banda de A renumerada cabe na faixa a fatoração é exata: é o caso das
+    treliças geradas já reordenadas (banda ~5), em que o GMRES converge em uma ou duas
+    iterações qualquer que seja o vão, enquanto com ILU(0) precisa de ~1 por painel.
+    Memória O(n·largura); fatorar custa O(n·largura²) e aplicar O(n·largura).
+    """
+
+    LARGURA_MAXIMA = 32
+
+    def __init__(self, A, largura=None):
+        A = A if isinstance(A, MatrizCSR) else MatrizCSR.de_densa(A)
+        n = A.shape[0]
+        self.ordem = ordem_banda(A)
+        A = A.permutar(linhas=self.ordem, colunas=self.ordem)
+        w = min(largura_banda(A), self.LARGURA_MAXIMA) if largura is None else int(largura)
+        self.largura = w
+
+        # Faixa densa: F[i, w + j - i] = a_ij para |i - j| <= w
+        linhas, colunas, valores = A.coordenadas()
+        na_faixa = np.abs(colunas - linhas) <= w
+        F = np.zeros((n, 2 * w + 1))
+        F[linhas[na_faixa], w + colunas[na_faixa] - linhas[na_faixa]] = valores[na_faixa]
+
+        # Eliminação sem pivoteamento (a diagonal já vem da reordenação): a linha k + d
+        # guarda o multiplicador em w - d e atualiza as posições w + 1 - d ... 2w - d
+        d = np.arange(1, w + 1)
+        posicoes = (w + 1 - d)[:, np.newaxis] + np.arange(w)
+        for k in range(n):
+            pivo = F[k, w]
+            if abs(pivo) < 1e-300:
+                raise ValueError(f"Divisão por zero na linha {self.ordem[k] + 1}")
+            m = min(w, n - 1 - k)
+            if m == 0:
+                continue
+            linhas = k + d[:m]
+            multiplicadores = F[linhas, w - d[:m]] / pivo
+            F[linhas, w - d[:m]] = multiplicadores
+            F[linhas[:, np.newaxis], posicoes[:m]] -= multiplicadores[:, np.newaxis] * F[k, w + 1:]
+
+        self._F = F
+        self.inv_diag = 1.0 / F[:, w]
+
+    def aplicar(self, r):
+        n, w = len(self.ordem), self.largura
+        F = self._F
+        # y com w zeros à frente e atrás: as fatias das bordas não precisam de tratamento.
+        # r pode ser um bloco (n, k): as substituições andam em todas as colunas juntas
+        r = np.asarray(r, dtype=float)
+        y = np.zeros((n + 2 * w,) + r.shape[1:])
+        y[w:w + n] = r[self.ordem]
+        for i in range(n):
+            y[w + i] -= F[i, :w] @ y[i:w + i]
+        for i in range(n - 1, -1, -1):
+            y[w + i] = (y[w + i] - F[i, w + 1:] @ y[w + i + 1:2 * w + i + 1]) * self.inv_diag[i]
+        z = np.empty(r.shape)
+        z[self.ordem] = y[w:w + n]
+        return z
+
+
+def _precondicionador(A, precond):
+    """Aceita None, 'jacobi', 'ilu', 'ilu_banda' ou um objeto com o método aplicar(r)."""
+    if precond is None:
+        return lambda r: r
+    if hasattr(precond, "aplicar"):
+        return precond.aplicar
+    if callable(A) and not isinstance(A, (np.ndarray, MatrizCSR)):
+        raise ValueError("No modo sem matriz informe o pré-condicionador já construído.")
+    if precond == "jacobi":
+        return PrecondJacobi.de_matriz(A).aplicar
+    if precond == "ilu":
+        return PrecondILU0(A).aplicar
+    if precond == "ilu_banda":
+        return PrecondILUBanda(A).aplicar
+    raise ValueError(f"Pré-condicionador desconhecido: {precond}")
+
+
+def _preparar(A_in, b_in, x0, precond, reordenar):
+    ordem = None
+    if reordenar:
+        A_in, b_in, ordem = reordenar_equacoes(A_in, b_in)
+
+    b = np.asarray(b_in, dtype=float)
+    x = np.zeros(len(b)) if x0 is None else np.array(x0, dtype=float)
+    return _operador(A_in), _precondicionador(A_in, precond), b, x, ordem
+
+
+# Reinício do GMRES automático: começa em REINICIO_INICIAL e dobra, até REINICIO_MAXIMO,
+# quando um ciclo quase não reduz o resíduo. O teto limita a base de Krylov (m + 1 vetores
+# de tamanho n, o dobro com pré-condicionador) a O(n·REINICIO_MAXIMO) de memória.
+REINICIO_INICIAL = 50
+REINICIO_MAXIMO = 200
+
+
+def gmres(A_in, b_in, x0=None, tol=1e-4, max_iter=500, reinicio=None, precond=None, reordenar=False):
+    """
+    GMRES reiniciado, com pré-condicionamento à direita (o resíduo monitorado é o
+    verdadeiro). Para quando ||b - A·x|| / ||b|| < tol; 'iteracoes' conta os produtos
+    matriz-vetor internos.
+
+    reinicio=None (automático): começa com REINICIO_INICIAL vetores e dobra o reinício
+    sempre que um ciclo reduz o resíduo menos que à metade, até REINICIO_MAXIMO.
+    Um inteiro fixa o reinício (GMRES(m) clássico).
+
+    O número de iterações depende do pré-condicionador, não do reinício: nas treliças
+    geradas (reordenar=True), com precond="ilu" (ILU(0)) são ~1 por painel e o método
+    estagna a partir de algumas centenas de painéis; com precond="ilu_banda"
+    (PrecondILUBanda, exata na banda estreita da treliça) são 1 ou 2 em qualquer vão.
+    """
+    A, M, b, x, ordem = _preparar(A_in, b_in, x0, precond, reordenar)
+    n = len(b)
+    norma_b = np.linalg.norm(b) or 1.0
+    adaptativo = reinicio is None
+    m = min(REINICIO_INICIAL if adaptativo else reinicio, n)
+    m_maximo = min(REINICIO_MAXIMO, n)
+
+    iteracoes = 0
+    r = b - A(x)
+    erro = np.linalg.norm(r) / norma_b
+
+    while erro >= tol and iteracoes < max_iter:
+        beta = np.linalg.norm(r)
+        V = np.zeros((m + 1, n))
+        Z = np.zeros((m, n))
+        H = np.zeros((m + 1, m))
+        cs, sn = np.zeros(m), np.zeros(m)
+        g = np.zeros(m + 1)
+        g[0] = beta
+        V[0] = r / beta
+
+        j = 0
+        while j < m and iteracoes < max_iter:
+            # Arnoldi com Gram-Schmidt clássico repetido (duas passadas: estável e vetorizado)
+            Z[j] = M(V[j])
+            w = A(Z[j])
+            for _ in range(2):
+                h = V[:j + 1] @ w
+                w -= h @ V[:j + 1]
+                H[:j + 1, j] += h
+            H[j + 1, j] = np.linalg.norm(w)
+            exato = H[j + 1, j] == 0  # subespaço invariante: a solução já está nele
+            if not exato:
+                V[j + 1] = w / H[j + 1, j]
+
+            # Rotações de Givens mantêm H triangular
+            for i in range(j):
+                H[i, j], H[i + 1, j] = cs[i] * H[i, j] + sn[i] * H[i + 1, j], -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+            raio = np.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = (H[j, j] / raio, H[j + 1, j] / raio) if raio > 0 else (1.0, 0.0)
+            H[j, j] = raio
+            H[j + 1, j] = 0.0
+            g[j + 1] = -sn[j] * g[j]
+            g[j] = cs[j] * g[j]
+
+            j += 1
+            iteracoes += 1
+            if abs(g[j]) / norma_b < tol or exato:
+                break
+
+        # Atualiza x com a combinação que minimiza o resíduo no subespaço
+        y = np.linalg.lstsq(np.triu(H[:j, :j]), g[:j], rcond=None)[0]
+        x += y @ Z[:j]
+        r = b - A(x)
+        novo_erro = np.linalg.norm(r) / norma_b
+        estagnou = novo_erro >= erro
+        lento = novo_erro > erro / 2
+        erro = novo_erro
+        if adaptativo and lento and m < m_maximo:
+            m = min(2 * m, m_maximo)
+        elif estagnou:
+            break
+
+    return ResultadoIterativo(x, bool(erro < tol), iteracoes, erro, ordem)
+
+
+def bicgstab(A_in, b_in, x0=None, tol=1e-4, max_iter=500, precond=None, reordenar=False):
+    """
+    BiCGSTAB com pré-condicionamento à direita. Três multiplicações por A por iteração,
+    memória constante. Para quando ||b - A·x|| / ||b|| < tol; se não convergir, devolve
+    o iterado de menor resíduo (nunca pior que o chute inicial).
+    """
+    A, M, b, x, ordem = _preparar(A_in, b_in, x0, precond, reordenar)
+    norma_b = np.linalg.norm(b) or 1.0
+
+    r = b - A(x)
+    erro = np.linalg.norm(r) / norma_b
+    iteracoes = 0
+    reinicios_seguidos = 0
+
+    # O resíduo do BiCGSTAB não é monótono: guarda o melhor iterado, devolvido em caso
+    # de ruptura, divergência ou fim das iterações
+    x_melhor, erro_melhor = x.copy(), erro
+
+    # Em caso de ruptura (r_hat·r ou r_hat·v nulos) o resíduo-sombra é reiniciado com o
+    # resíduo atual; duas rupturas seguidas sem progresso encerram o método.
+    r_hat = None
+    while erro >= tol and iteracoes < max_iter:
+        if r_hat is None:
+            r_hat = r.copy()
+            rho = alfa = omega = 1.0
+            v = np.zeros_like(b)
+            p = np.zeros_like(b)
+
+        rho_novo = r_hat @ r
+        escala = np.finfo(float).eps * np.linalg.norm(r_hat) * np.linalg.norm(r)
+        if abs(rho_novo) <= escala or omega == 0:
+            if reinicios_seguidos:
+                break
+            reinicios_seguidos += 1
+            r_hat = None
+            continue
+        beta = (rho_novo / rho) * (alfa / omega)
+        rho = rho_novo
+        iteracoes += 1
+
+        p = r + beta * (p - omega * v)
+        p_hat = M(p)
+        v = A(p_hat)
+        r_hat_v = r_hat @ v
+        if abs(r_hat_v) <= np.finfo(float).eps * np.linalg.norm(r_hat) * np.linalg.norm(v):
+            if reinicios_seguidos:
+                break
+            reinicios_seguidos += 1
+            r_hat = None
+            continue
+        reinicios_seguidos = 0
+        alfa = rho / r_hat_v
+        s = r - alfa * v
+
+        if np.linalg.norm(s) / norma_b < tol:
+            x += alfa * p_hat
+            erro = np.linalg.norm(b - A(x)) / norma_b
+            break
+
+        s_hat = M(s)
+        t = A(s_hat)
+        t_t = t @ t
+        omega = (t @ s) / t_t if t_t > 0 else 0.0
+        x += alfa * p_hat + omega * s_hat
+        # Resíduo verdadeiro (um produto por A a mais): o recursivo s - omega·t se afasta
+        # dele nos sistemas mal condicionados e indicaria um "melhor" iterado falso
+        r = b - A(x)
+        erro = np.linalg.norm(r) / norma_b
+        if not np.isfinite(erro):
+            break
+        if erro < erro_melhor:
+            x_melhor[:], erro_melhor = x, erro
+
+    if not erro <= erro_melhor:
+        x, erro = x_melhor, erro_melhor
+
+    return ResultadoIterativo(x, bool(erro < tol), iteracoes, erro, ordem)
@@ -0,0 +1,33 @@
+import numpy as np
+
+from ajuste import ajustar
+
+
+# --- LÓGICA MATEMÁTICA PASSO A PASSO (Baseada nos Slides) ---
+
+# Dados Originais (ano, número de transistores)
+ANOS = [1971, 1972, 1974, 1978, 1982, 1986, 1989, 1993, 1997, 1999, 2000]
+TRANSISTORES = [2250, 3300, 6000, 29000, 134000, 275000, 1200000, 3100000, 7500000, 9500000, 42000000]
+
+
+def calcular_mmq_detalhado(anos=None, transistores=None):
+    """
+    MMQ da Lei de Moore: N = alpha * 10^(beta * t), linearizado como
+    log10(N) = B + A * t (Slides 38/44). A memória de cálculo mostra os somatórios
+    e o Sistema Normal dos Slides 44 e 45; a solução vem do motor de ajuste (QR).
+    Sem argumentos usa os dados originais da questão (ANOS, TRANSISTORES).
+    """
+    # 1. Dados
+    x = np.array(ANOS if anos is None else anos, dtype=float)
+    N = np.array(TRANSISTORES if transistores is None else transistores, dtype=float)
+
+    # 2. Ajuste exponencial na base 10 (Y = log10(N) = B + A * X)
+    resultado = ajustar(x, N, "exponencial", base=10, memoria=True, nome_x="Ano", nome_y="N")
+    B_linear, beta = resultado.coeficientes
+    alpha = resultado.parametros["alpha"]
+
+    return x, N, np.log10(N), alpha, beta, B_linear, resultado.memoria
+
+
+def prever(ano, alpha, beta):
+    return alpha * (10 ** (beta * ano))
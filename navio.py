@@ -0,0 +1,250 @@
+import numpy as np
+
+
+# --- LÓGICA MATEMÁTICA (sem dependência de interface gráfica) ---
+
+def regra_trapezios(h, y):
+    """Regra dos Trapézios Repetida: h/2 * (y_inicial + 2*soma_meio + y_final)."""
+    y = np.asarray(y, dtype=float)
+    return (h / 2) * (y[0] + 2 * np.sum(y[1:-1]) + y[-1])
+
+
+def _simpson_puro(h, y):
+    # Formula: h/3 * (y0 + 4*Impares + 2*Pares + yn)
+    soma_impares = np.sum(y[1:-1:2])  # Índices 1, 3, 5...
+    soma_pares = np.sum(y[2:-1:2])  # Índices 2, 4, 6...
+    return (h / 3) * (y[0] + 4 * soma_impares + 2 * soma_pares + y[-1])
+
+
+def regra_simpson(h, y):
+    """
+    Regra de Simpson 1/3 (Adaptativa).
+    Com número ímpar de intervalos aplica Simpson até o penúltimo ponto + Trapézio no último.
+    Retorna (area, mensagem descrevendo o método aplicado).
+    """
+    y = np.asarray(y, dtype=float)
+    n_intervalos = len(y) - 1
+
+    # Verifica paridade dos intervalos
+    if n_intervalos % 2 == 0:
+        # Caso ideal: Número par de intervalos -> Simpson Puro
+        return _simpson_puro(h, y), "Método: Simpson 1/3 Puro (N par)"
+
+    # Caso da questão: Número ímpar de intervalos -> Simpson Misto
+    # Parte A: Simpson (0 até n-1)
+    area_parte_simp = _simpson_puro(h, y[:-1]) if n_intervalos > 1 else 0.0
+
+    # Parte B: Trapézio (último intervalo)
+    area_parte_trap = (h / 2) * (y[-2] + y[-1])
+
+    info_msg = (f"Atenção: N={n_intervalos} (ímpar).\nMétodo Misto aplicado:\n"
+                f"Simpson (0-{n_intervalos - 1}) + Trapézio ({n_intervalos - 1}-{n_intervalos})")
+    return area_parte_simp + area_parte_trap, info_msg
+
+
+def integrar_secao(h, y):
+    """Área da seção pelas duas regras. Retorna (area_trap, area_simp, info_msg)."""
+    if len(y) < 2:
+        raise ValueError("É necessário pelo menos 2 pontos (1 intervalo).")
+
+    area_simp, info_msg = regra_simpson(h, y)
+    return regra_trapezios(h, y), area_simp, info_msg
+
+
+# --- TABELA DE COTAS COMPLETA (muitas estações, em blocos) ---
+
+def pesos_trapezios(n_pontos, h):
+    """Pesos w tais que regra_trapezios(h, y) == w @ y."""
+    w = np.full(n_pontos, h)
+    w[[0, -1]] = h / 2
+    return w
+
+
+def pesos_simpson(n_pontos, h):
+    """Pesos w tais que regra_simpson(h, y)[0] == w @ y (Simpson puro ou misto)."""
+    n_intervalos = n_pontos - 1
+    w = np.zeros(n_pontos)
+    n_simp = n_intervalos if n_intervalos % 2 == 0 else n_intervalos - 1
+
+    if n_simp > 0:
+        w[1:n_simp:2] = 4
+        w[2:n_simp:2] = 2
+        w[[0, n_simp]] = 1
+        w *= h / 3
+    if n_simp < n_intervalos:
+        # Trapézio no último intervalo
+        w[-2:] += h / 2
+    return w
+
+
+def areas_estacoes(h, Y):
+    """
+    Áreas de todas as estações de uma vez: Y tem uma estação por linha (do topo até a quilha).
+    Estações mais curtas são completadas com NaN à direita.
+    Retorna (area_trap, area_simp), um valor por estação.
+    """
+    Y = np.asarray(Y, dtype=float)
+    if Y.ndim == 1:
+        Y = Y[np.newaxis, :]
+
+    validos = Y.shape[1] - np.argmax(~np.isnan(Y[:, ::-1]), axis=1)
+    validos[np.all(np.isnan(Y), axis=1)] = 0
+    if np.any(validos < 2):
+        raise ValueError("É necessário pelo menos 2 pontos (1 intervalo).")
+
+    area_trap = np.empty(len(Y))
+    area_simp = np.empty(len(Y))
+    # Um produto matriz-vetor por comprimento de estação (normalmente um só)
+    for n in np.unique(validos):
+        grupo = validos == n
+        bloco = Y[grupo, :n]
+        area_trap[grupo] = bloco @ pesos_trapezios(n, h)
+        area_simp[grupo] = bloco @ pesos_simpson(n, h)
+    return area_trap, area_simp
+
+
+def ler_blocos_csv(caminho, linhas_por_bloco=4096, pular_linhas=0):
+    """
+    Lê uma tabela de cotas CSV (uma estação por linha) em blocos de 'linhas_por_bloco'
+    estações, sem carregar o arquivo inteiro. Use 'nan' para completar estações curtas.
+    """
+    from itertools import islice
+
+    with open(caminho, encoding="utf-8") as arquivo:
+        for _ in range(pular_linhas):
+            next(arquivo, None)
+        while True:
+            linhas = list(islice(arquivo, linhas_por_bloco))
+            if not linhas:
+                return
+            bloco = np.loadtxt(linhas, delimiter=",", ndmin=2)
+            if len(bloco):
+                yield bloco
+
+
+def ler_blocos_binario(caminho, n_pontos=None, dtype="<f8", linhas_por_bloco=65536):
+    """
+    Percorre uma tabela binária mapeada em memória, em blocos de estações.
+    Aceita .npy (forma lida do cabeçalho) ou binário cru com 'n_pontos' valores por estação.
+    """
+    if str(caminho).endswith(".npy"):
+        tabela = np.load(caminho, mmap_mode="r")
+    else:
+        if n_pontos is None:
+            raise ValueError("Informe o número de pontos por estação do arquivo binário.")
+        tabela = np.memmap(caminho, dtype=dtype, mode="r").reshape(-1, n_pontos)
+
+    for inicio in range(0, len(tabela), linhas_por_bloco):
+        yield tabela[inicio:inicio + linhas_por_bloco]
+
+
+def integrar_tabela(h, blocos):
+    """
+    Integra um fluxo de blocos de estações (ler_blocos_csv / ler_blocos_binario ou
+    qualquer iterável de matrizes). Emite (primeira_estacao, area_trap, area_simp)
+    a cada bloco, com primeira_estacao em base 0.
+    """
+    inicio = 0
+    for bloco in blocos:
+        area_trap, area_simp = areas_estacoes(h, bloco)
+        yield inicio, area_trap, area_simp
+        inicio += len(area_trap)
+
+
+# --- INTEGRAÇÃO INCREMENTAL (edição ao vivo de uma seção) ---
+
+class SecaoIncremental:
+    """
+    Mantém as somas parciais dos Trapézios e de Simpson de uma seção, atualizadas em O(1)
+    quando uma cota muda (alterar) ou um ponto é acrescentado no fim (acrescentar).
+
+    Basta guardar a soma das cotas de índice par e a de índice ímpar: os pesos das duas
+    regras dependem só da paridade e das pontas, inclusive no caso misto (N ímpar).
+    As somas são refeitas do zero a cada 'recalcular_a_cada' atualizações para não
+    acumular erro de arredondamento.
+    """
+
+    def __init__(self, h, y=(), recalcular_a_cada=100_000):
+        self.h = h
+        self.recalcular_a_cada = recalcular_a_cada
+        y = np.asarray(y, dtype=float)
+        self._y = np.empty(max(16, 2 * len(y)))
+        self._y[:len(y)] = y
+        self._n = len(y)
+        self.recalcular()
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def y(self):
+        return self._y[:self._n]
+
+    def recalcular(self):
+        self._soma_par = float(np.sum(self._y[0:self._n:2]))
+        self._soma_impar = float(np.sum(self._y[1:self._n:2]))
+        self._atualizacoes = 0
+
+    def _contar(self):
+        self._atualizacoes += 1
+        if self._atualizacoes >= self.recalcular_a_cada:
+            self.recalcular()
+
+    def alterar(self, i, valor):
+        if not -self._n <= i < self._n:
+            raise IndexError(f"Cota {i} fora da seção de {self._n} pontos.")
+        i %= self._n
+        delta = float(valor) - self._y[i]
+        if i % 2:
+            self._soma_impar += delta
+        else:
+            self._soma_par += delta
+        self._y[i] = valor
+        self._contar()
+
+    def acrescentar(self, valor):
+        if self._n == len(self._y):
+            self._y = np.concatenate([self._y, np.empty(len(self._y))])  # capacidade dobra
+        self._y[self._n] = valor
+        if self._n % 2:
+            self._soma_impar += float(valor)
+        else:
+            self._soma_par += float(valor)
+        self._n += 1
+        self._contar()
+
+    def _verificar(self):
+        if self._n < 2:
+            raise ValueError("É necessário pelo menos 2 pontos (1 intervalo).")
+
+    @property
+    def area_trapezios(self):
+        self._verificar()
+        y = self._y
+        return self.h * (self._soma_par + self._soma_impar - (y[0] + y[self._n - 1]) / 2)
+
+    @property
+    def area_simpson(self):
+        self._verificar()
+        y, h, N = self._y, self.h, self._n - 1
+
+        if N % 2 == 0:
+            # Simpson puro: pontas peso 1, ímpares peso 4, pares internos peso 2
+            return (h / 3) * (y[0] + y[N] + 4 * self._soma_impar + 2 * (self._soma_par - y[0] - y[N]))
+
+        # Misto: Simpson de 0 a N-1 (N-1 par) + Trapézio no último intervalo
+        if N == 1:
+            return (h / 2) * (y[0] + y[1])
+        simp = (h / 3) * (y[0] + y[N - 1] + 4 * (self._soma_impar - y[N])
+                          + 2 * (self._soma_par - y[0] - y[N - 1]))
+        return simp + (h / 2) * (y[N - 1] + y[N])
+
+    def integrar(self):
+        """Mesmo retorno de integrar_secao: (area_trap, area_simp, info_msg)."""
+        N = self._n - 1
+        if N % 2 == 0:
+            info_msg = "Método: Simpson 1/3 Puro (N par)"
+        else:
+            info_msg = (f"Atenção: N={N} (ímpar).\nMétodo Misto aplicado:\n"
+                        f"Simpson (0-{N - 1}) + Trapézio ({N - 1}-{N})")
+        return self.area_trapezios, self.area_simpson, info_msg
@@ -0,0 +1,163 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from esparsa import MatrizCSR
+
+
+# --- PARTIDA QUENTE: CHUTE INICIAL A PARTIR DE SOLUÇÕES ANTERIORES ---
+#
+# Entre um cálculo e outro da treliça costuma mudar só a carga (b) ou um pouco a
+# geometria (valores de A, mesma estrutura). As soluções recentes de cada estrutura
+# ficam guardadas e o novo cálculo parte da melhor combinação delas, em vez de zero.
+
+def chave_estrutura(A_in):
+    """Chave pela estrutura de A (formato e posição dos não nulos), não pelos valores."""
+    A = A_in if isinstance(A_in, MatrizCSR) else MatrizCSR.de_densa(A_in)
+    assinatura = hashlib.sha1(A.indptr.tobytes() + A.indices.tobytes()).hexdigest()
+    return A.shape, assinatura
+
+
+def _partida_fria(b, x0):
+    """(x0, "informada") com um chute não nulo informado; senão (zeros, "fria")."""
+    if x0 is not None and np.any(np.asarray(x0, dtype=float)):
+        return np.array(x0, dtype=float), "informada"
+    return np.zeros_like(b), "fria"
+
+
+class CachePartidaQuente:
+    """
+    Cache LRU de soluções recentes por estrutura (até 'historico' por estrutura).
+
+    chute(A, b) escolhe, pelo menor resíduo ||b - A·x0||, entre:
+      "fria":        zeros (ou o x0 informado, "informada");
+      "mais_proxima": a solução guardada cujo b é o mais próximo do novo;
+      "extrapolada": a combinação das soluções guardadas que melhor reproduz o novo b
+                     (mínimos quadrados nos b anteriores). Como o sistema é linear, é
+                     exata quando o novo b é combinação dos anteriores: numa varredura
+                     de cargas b0 + k·Δ, a partir do segundo passo.
+
+    registrar(A, b, resultado, metodo=...) guarda a solução convergida e devolve as
+    iterações economizadas em relação ao último cálculo de partida fria da mesma
+    estrutura com o mesmo método (as soluções servem de chute para qualquer método).
+
+    O omega final do SOR adaptativo também é guardado (omega(A, metodo)): perto da
+    solução as variações são pequenas demais para estimar a taxa de convergência de novo.
+    Só guarda omega estimado pelo SOR adaptativo (resultado.omega_estimado): o 1.0 do
+    Gauss-Seidel, de um GMRES ou do aquecimento faria o SOR automático virar Gauss-Seidel.
+    """
+
+    def __init__(self, capacidade=8, historico=4):
+        if capacidade < 1 or historico < 1:
+            raise ValueError("A capacidade e o histórico do cache devem ser pelo menos 1.")
+
+        self.capacidade = capacidade
+        self.historico = historico
+        self._itens = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+        self.iteracoes_economizadas = 0
+
+    def __len__(self):
+        return len(self._itens)
+
+    def _entrada(self, A_in):
+        chave = chave_estrutura(A_in)
+        entrada = self._itens.get(chave)
+        if entrada is not None:
+            self._itens.move_to_end(chave)
+        return chave, entrada
+
+    def chute(self, A_in, b_in, x0=None):
+        """Devolve (x0, partida) para o sistema A·x = b, com partida = tipo de chute escolhido."""
+        b = np.asarray(b_in, dtype=float)
+        fria, partida = _partida_fria(b, x0)
+        candidatos = {partida: fria}
+
+        _, entrada = self._entrada(A_in)
+        if entrada is None or not entrada["b"]:
+            self.falhas += 1
+            return fria, partida
+        self.acertos += 1
+
+        B_ant = np.column_stack(entrada["b"])
+        X_ant = np.column_stack(entrada["x"])
+        mais_proxima = np.argmin(np.linalg.norm(B_ant - b[:, np.newaxis], axis=0))
+        candidatos["mais_proxima"] = X_ant[:, mais_proxima].copy()
+        coeficientes = np.linalg.lstsq(B_ant, b, rcond=None)[0]
+        candidatos["extrapolada"] = X_ant @ coeficientes
+
+        residuos = {nome: np.linalg.norm(b - A_in @ x) for nome, x in candidatos.items()}
+        partida = min(residuos, key=residuos.get)
+        return candidatos[partida], partida
+
+    def chute_adaptativo(self, A_in, b_in, x0=None, metodo=None):
+        """
+        Chute para o SOR adaptativo: devolve (x0, partida, omega). A partida quente só é
+        usada com um omega já estimado para a estrutura e o método; sem ele, parte frio,
+        pois perto da solução as variações não bastam para estimar omega.
+        """
+        chute, partida = self.chute(A_in, b_in, x0)
+        omega = self.omega(A_in, metodo)
+        if omega is None and partida not in ("fria", "informada"):
+            chute, partida = _partida_fria(np.asarray(b_in, dtype=float), x0)
+        return chute, partida, omega
+
+    def registrar(self, A_in, b_in, resultado, partida="fria", metodo=None):
+        """
+        Guarda a solução (se convergiu) e devolve as iterações economizadas por esta partida
+        (None enquanto não houver um cálculo de partida fria da estrutura com o mesmo
+        'metodo' para comparar).
+        """
+        chave, entrada = self._entrada(A_in)
+        if entrada is None:
+            entrada = self._itens[chave] = {"b": [], "x": [], "iteracoes_frias": {}, "omega": {}}
+            if len(self._itens) > self.capacidade:
+                self._itens.popitem(last=False)
+
+        frias = entrada["iteracoes_frias"]
+        if partida in ("fria", "informada"):
+            frias[metodo] = resultado.iteracoes
+            economia = 0 if partida == "fria" else None
+        elif metodo not in frias:
+            economia = None
+        else:
+            economia = frias[metodo] - resultado.iteracoes
+            self.iteracoes_economizadas += economia
+
+        if resultado.convergiu:
+            if getattr(resultado, "omega_estimado", False):
+                entrada["omega"][metodo] = resultado.omega
+            entrada["b"].append(np.array(b_in, dtype=float))
+            entrada["x"].append(np.array(resultado.x, dtype=float))
+            del entrada["b"][:-self.historico], entrada["x"][:-self.historico]
+        return economia
+
+    def omega(self, A_in, metodo=None):
+        """Omega do último SOR adaptativo convergido da estrutura com esse método (None se não houver)."""
+        _, entrada = self._entrada(A_in)
+        return None if entrada is None else entrada["omega"].get(metodo)
+
+    def resolver(self, resolvedor, A_in, b_in, x0=None, **opcoes):
+        """
+        Atalho: chute + resolvedor(A, b, x0=chute, **opcoes) + registrar.
+        Com omega=None (SOR adaptativo) explícito em opcoes, usa chute_adaptativo.
+        O resultado ganha os atributos 'partida' e 'iteracoes_economizadas'.
+        """
+        adaptativo = "omega" in opcoes and opcoes["omega"] is None
+        metodo = (resolvedor.__name__, bool(opcoes.get("simetrico")), adaptativo)
+        if adaptativo:
+            chute, partida, opcoes["omega"] = self.chute_adaptativo(A_in, b_in, x0, metodo)
+        else:
+            chute, partida = self.chute(A_in, b_in, x0)
+        resultado = resolvedor(A_in, b_in, x0=chute, **opcoes)
+        resultado.partida = partida
+        resultado.iteracoes_economizadas = self.registrar(A_in, b_in, resultado, partida, metodo)
+        return resultado
+
+    def limpar(self):
+        self._itens.clear()
+        self.acertos = 0
+        self.falhas = 0
+        self.iteracoes_economizadas = 0
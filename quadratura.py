@@ -0,0 +1,300 @@
+import numpy as np
+
+
+# --- QUADRATURAS COM ESTIMATIVA DE ERRO (seções do casco) ---
+#
+# Todas as regras aceitam espaçamento não uniforme (abscissas z) e devolvem uma
+# estimativa do erro, para saber se as cotas medidas bastam para a tolerância.
+
+class ResultadoQuadratura:
+    """Área integrada, estimativa do erro absoluto, método usado e nº de pontos (cotas)."""
+
+    def __init__(self, area, erro, metodo, n_pontos, info=""):
+        self.area = area
+        self.erro = erro
+        self.metodo = metodo
+        self.n_pontos = n_pontos
+        self.info = info
+
+    def __repr__(self):
+        return (f"ResultadoQuadratura(area={self.area:.6g}, erro={self.erro:.2e}, "
+                f"metodo='{self.metodo}', n_pontos={self.n_pontos})")
+
+
+def _abscissas(y, h=None, z=None):
+    y = np.asarray(y, dtype=float)
+    if len(y) < 2:
+        raise ValueError("É necessário pelo menos 2 pontos (1 intervalo).")
+    if z is None:
+        if h is None:
+            raise ValueError("Informe o passo h ou as abscissas z.")
+        z = np.arange(len(y)) * h
+    z = np.asarray(z, dtype=float)
+    if len(z) != len(y):
+        raise ValueError("As abscissas e as larguras devem ter o mesmo número de pontos.")
+    if np.any(np.diff(z) <= 0):
+        raise ValueError("As abscissas devem ser estritamente crescentes.")
+    return z, y
+
+
+def _uniforme(z):
+    passos = np.diff(z)
+    return np.allclose(passos, passos[0], rtol=1e-9, atol=0)
+
+
+def _pesos_interpolatorios(z, a=None, b=None):
+    """Pesos que integram exatamente o polinômio interpolador dos pontos z, de a a b."""
+    a = z[0] if a is None else a
+    b = z[-1] if b is None else b
+    # Centrado e normalizado para a Vandermonde ficar bem condicionada
+    c, s = (z[0] + z[-1]) / 2, (z[-1] - z[0]) / 2
+    t = (z - c) / s
+    ta, tb = (a - c) / s, (b - c) / s
+    k = np.arange(len(z))
+    momentos = (tb ** (k + 1) - ta ** (k + 1)) / (k + 1)
+    return np.linalg.solve(np.vander(t, increasing=True).T, momentos) * s
+
+
+# --- REGRAS COMPOSTAS (uniformes ou não) ---
+
+def trapezios(z, y):
+    return float(np.sum(np.diff(z) * (y[:-1] + y[1:]) / 2))
+
+
+def simpson(z, y, cauda="trapezio"):
+    """
+    Simpson 1/3 composto em pares de intervalos (parábola por 3 pontos, mesmo com passos
+    diferentes). Com número ímpar de intervalos, o último é coberto por:
+      cauda="trapezio": trapézio no último intervalo (regra original da questão);
+      cauda="3/8": Simpson 3/8 (cúbica) nos três últimos intervalos.
+    """
+    n_intervalos = len(z) - 1
+    if n_intervalos == 1:
+        return trapezios(z, y)
+
+    fim = n_intervalos
+    if n_intervalos % 2:
+        fim = n_intervalos - 3 if cauda == "3/8" else n_intervalos - 1
+
+    area = 0.0
+    if fim > 0:
+        z0, z1, z2 = z[0:fim:2], z[1:fim + 1:2], z[2:fim + 1:2]
+        h0, h1 = z1 - z0, z2 - z1
+        # Integral exata da parábola por (z0, z1, z2), forma fechada para passos desiguais
+        area = float(np.sum((h0 + h1) / 6 * ((2 - h1 / h0) * y[0:fim:2]
+                                             + (h0 + h1) ** 2 / (h0 * h1) * y[1:fim + 1:2]
+                                             + (2 - h0 / h1) * y[2:fim + 1:2])))
+
+    if fim < n_intervalos:
+        area += float(_pesos_interpolatorios(z[fim:]) @ y[fim:]) if cauda == "3/8" else trapezios(z[-2:], y[-2:])
+    return area
+
+
+def _spline_cubica(z, y):
+    """Derivadas segundas M da spline cúbica 'not-a-knot' (natural com 3 pontos)."""
+    n = len(z)
+    h = np.diff(z)
+    if n == 2:
+        return np.zeros(2)
+
+    A = np.zeros((n, n))
+    r = np.zeros(n)
+    i = np.arange(1, n - 1)
+    A[i, i - 1] = h[:-1]
+    A[i, i] = 2 * (h[:-1] + h[1:])
+    A[i, i + 1] = h[1:]
+    r[i] = 6 * ((y[2:] - y[1:-1]) / h[1:] - (y[1:-1] - y[:-2]) / h[:-1])
+
+    if n == 3:
+        A[0, 0] = A[-1, -1] = 1.0
+    else:
+        # Terceira derivada contínua no segundo e no penúltimo nó
+        A[0, :3] = [h[1], -(h[0] + h[1]), h[0]]
+        A[-1, -3:] = [h[-1], -(h[-2] + h[-1]), h[-2]]
+    return np.linalg.solve(A, r)
+
+
+def gauss_spline(z, y, pontos_gauss=2):
+    """
+    Gauss-Legendre em cada intervalo sobre a spline cúbica das cotas.
+    Com 2 pontos por intervalo a integral da spline já é exata.
+    """
+    M = _spline_cubica(z, y)
+    h = np.diff(z)
+    t, w = np.polynomial.legendre.leggauss(pontos_gauss)
+
+    # Pontos de Gauss de todos os intervalos: (n_intervalos, pontos_gauss)
+    u = (t[np.newaxis, :] + 1) / 2
+    a, b = (1 - u), u
+    hh = h[:, np.newaxis]
+    valores = (a * y[:-1, np.newaxis] + b * y[1:, np.newaxis]
+               + hh ** 2 / 6 * ((a ** 3 - a) * M[:-1, np.newaxis] + (b ** 3 - b) * M[1:, np.newaxis]))
+    return float(np.sum(hh / 2 * valores * w))
+
+
+# --- ROMBERG ---
+
+def _tabela_romberg(trapezios_por_nivel):
+    """Extrapolação de Richardson sucessiva; devolve (melhor valor, estimativa do erro)."""
+    R = [trapezios_por_nivel[0]]
+    erro = np.inf
+    for k in range(1, len(trapezios_por_nivel)):
+        linha = [trapezios_por_nivel[k]]
+        for j in range(1, k + 1):
+            linha.append(linha[j - 1] + (linha[j - 1] - R[j - 1]) / (4 ** j - 1))
+        erro = abs(linha[-1] - R[-1])
+        R = linha
+    return R[-1], erro
+
+
+def _cauda_romberg(z, y, M):
+    """
+    Integral e erro estimado da cauda z[M:] (1 ou 3 intervalos) do Romberg. Cada regra
+    é comparada com o polinômio interpolador de um grau acima (um ponto a mais, tomado
+    antes da cauda): a diferença estima o erro da regra usada.
+      1 intervalo:  cúbica pelos 4 últimos pontos (contra a quártica pelos 5 últimos;
+                    com só 4 pontos, contra a parábola, estimativa conservadora);
+      3 intervalos: Simpson 3/8 (contra a quártica que inclui o ponto anterior à cauda).
+    """
+    fim = (z[M], z[-1])
+    if len(z) - 1 - M == 1:
+        area = _pesos_interpolatorios(z[-4:], *fim) @ y[-4:]
+        vizinhos = 5 if len(z) >= 5 else 3
+    else:
+        area = _pesos_interpolatorios(z[M:]) @ y[M:]
+        vizinhos = 5
+    return float(area), abs(area - _pesos_interpolatorios(z[-vizinhos:], *fim) @ y[-vizinhos:])
+
+
+def _romberg_trecho(h, y):
+    """Romberg em um trecho cujo número de intervalos é par. Devolve (area, erro, niveis)."""
+    N = len(y) - 1
+
+    # Do passo mais fino (todas as cotas) ao mais grosso, dobrando enquanto couber
+    niveis = []
+    passo = 1
+    while N % passo == 0:
+        niveis.append(trapezios(np.arange(0, N + 1, passo) * h, y[::passo]))
+        passo *= 2
+    niveis.reverse()
+    area, erro = _tabela_romberg(niveis)
+    return area, erro, len(niveis)
+
+
+def romberg_amostras(h, y):
+    """
+    Romberg sobre cotas igualmente espaçadas: trapézios com passos h, 2h, 4h, ... enquanto
+    o número de intervalos for divisível pelo passo.
+
+    Com número ímpar de intervalos, as cotas são divididas em trechos de 2^k intervalos
+    (o maior possível primeiro, cada um com o seu Romberg) e uma cauda de 1 ou 3
+    intervalos (_cauda_romberg); os erros estimados se somam.
+    Devolve (area, erro, niveis do primeiro trecho, intervalos_cauda).
+    """
+    y = np.asarray(y, dtype=float)
+    N = len(y) - 1
+    if N % 2 == 0 or N < 3:
+        return (*_romberg_trecho(h, y), 0)
+
+    area = erro = 0.0
+    inicio, niveis = 0, None
+    while N - inicio > 3 or inicio == 0:
+        M = 1 << ((N - inicio).bit_length() - 1)
+        area_trecho, erro_trecho, niveis_trecho = _romberg_trecho(h, y[inicio:inicio + M + 1])
+        area += area_trecho
+        erro += erro_trecho
+        niveis = niveis or niveis_trecho
+        inicio += M
+
+    cauda, erro_cauda = _cauda_romberg(np.arange(N + 1) * h, y, inicio)
+    return area + cauda, erro + erro_cauda, niveis, N - inicio
+
+
+def romberg(f, a, b, tol=1e-6, max_niveis=20):
+    """
+    Romberg adaptativo para uma função f (ex.: uma medição de meia-largura): dobra os
+    pontos até a estimativa de erro ficar abaixo de tol. Cada ponto é avaliado uma vez.
+    """
+    f_vet = lambda x: np.asarray([f(xi) for xi in np.atleast_1d(x)], dtype=float)
+    h = b - a
+    T = [h / 2 * float(np.sum(f_vet([a, b])))]
+    n_avaliacoes = 2
+    area, erro = T[0], np.inf
+
+    for k in range(1, max_niveis):
+        h /= 2
+        novos = a + h * np.arange(1, 2 ** k, 2)
+        T.append(T[-1] / 2 + h * float(np.sum(f_vet(novos))))
+        n_avaliacoes += len(novos)
+        area, erro = _tabela_romberg(T)
+        if erro < tol:
+            break
+
+    return ResultadoQuadratura(area, erro, "romberg", n_avaliacoes, f"{len(T)} níveis de Romberg")
+
+
+# --- PONTO DE ENTRADA ---
+
+METODOS = ("trapezios", "simpson", "simpson38", "romberg", "gauss_spline")
+
+# Ordem de convergência usada na estimativa de Richardson de cada regra
+_ORDEM = {"trapezios": 2, "simpson": 4, "simpson38": 4, "gauss_spline": 4}
+
+
+def _regra(metodo):
+    return {
+        "trapezios": trapezios,
+        "simpson": simpson,
+        "simpson38": lambda z, y: simpson(z, y, cauda="3/8"),
+        "gauss_spline": gauss_spline,
+    }[metodo]
+
+
+def integrar(y, h=None, z=None, metodo="simpson"):
+    """
+    Integra as cotas y (passo uniforme h ou abscissas z) pelo método escolhido.
+
+    Estimativa do erro: Richardson entre a malha completa e a malha com metade dos
+    pontos (um sim, um não, mantendo o último): erro ≈ |I_h - I_2h| / (2^p - 1).
+    Com poucos pontos para isso, usa a diferença para a regra dos trapézios.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconhecido: {metodo}")
+    z, y = _abscissas(y, h, z)
+
+    if metodo == "romberg":
+        if not _uniforme(z):
+            raise ValueError("Romberg exige cotas igualmente espaçadas.")
+        area, erro, niveis, cauda = romberg_amostras(z[1] - z[0], y)
+        if niveis < 2:
+            raise ValueError("Romberg exige ao menos dois intervalos (passos h e 2h).")
+        info = f"{niveis} níveis de Romberg"
+        if cauda:
+            info += f" em trechos de 2^k intervalos + " + (
+                "cúbica no último" if cauda == 1 else "Simpson 3/8 nos 3 últimos")
+        return ResultadoQuadratura(area, erro, metodo, len(y), info)
+
+    regra = _regra(metodo)
+    area = regra(z, y)
+
+    grossa = np.unique(np.append(np.arange(0, len(y), 2), len(y) - 1))
+    if len(y) == 2:
+        # Com um intervalo todas as regras viram o trapézio: não há com o que comparar
+        erro = np.inf
+        info = "Dois pontos: sem estimativa de erro"
+    elif len(grossa) >= 3 or metodo == "trapezios":
+        erro = abs(area - regra(z[grossa], y[grossa])) / (2 ** _ORDEM[metodo] - 1)
+        info = "Erro estimado por Richardson (malhas h e 2h)"
+    else:
+        erro = abs(area - trapezios(z, y))
+        info = "Poucos pontos: erro estimado pela diferença para os trapézios"
+
+    if metodo == "simpson" and len(y) >= 4 and (len(y) - 1) % 2:
+        # O trapézio do último intervalo aparece igual nas duas malhas e não entra no
+        # Richardson: soma a diferença para a parábola pelos três últimos pontos
+        parabola = _pesos_interpolatorios(z[-3:], z[-2], z[-1]) @ y[-3:]
+        erro += abs(parabola - trapezios(z[-2:], y[-2:]))
+
+    if not _uniforme(z):
+        info += "; espaçamento não uniforme"
+    return ResultadoQuadratura(area, erro, metodo, len(y), info)
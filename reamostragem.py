@@ -0,0 +1,239 @@
+import numpy as np
+
+from ajuste import ModeloPolinomial, ajustar
+
+
+# --- INTERVALOS POR REAMOSTRAGEM (bootstrap e jackknife) PARA O AJUSTE MMQ ---
+#
+# Os milhares de reajustes são feitos em lote: com X fixo (bootstrap dos resíduos)
+# todos os coeficientes saem de um único produto pela pseudo-inversa; reamostrando
+# pares (x, y), cada amostra tem seu X e os ajustes são resolvidos em pilha.
+
+
+class Intervalo:
+    """Estimativa pontual e limites [inferior, superior] com o nível de confiança."""
+
+    def __init__(self, estimativa, inferior, superior, nivel):
+        self.estimativa = estimativa
+        self.inferior = inferior
+        self.superior = superior
+        self.nivel = nivel
+
+    def __iter__(self):
+        return iter((self.estimativa, self.inferior, self.superior))
+
+    def __repr__(self):
+        return (f"Intervalo({self.estimativa:.6g} [{self.inferior:.6g}, {self.superior:.6g}], "
+                f"{self.nivel:.0%})")
+
+
+class ResultadoReamostragem:
+    """
+    parametros: {nome: Intervalo} (alpha, beta, ...)
+    confianca:  intervalos da curva ajustada em cada x de 'previsoes'
+    predicao:   intervalos de predição (incluem a dispersão dos pontos em torno da curva)
+    """
+
+    def __init__(self, metodo, nivel, n_reamostras, parametros, previsoes, confianca, predicao):
+        self.metodo = metodo
+        self.nivel = nivel
+        self.n_reamostras = n_reamostras
+        self.parametros = parametros
+        self.previsoes = previsoes
+        self.confianca = confianca
+        self.predicao = predicao
+
+    def __repr__(self):
+        parametros = ", ".join(f"{k}={v}" for k, v in self.parametros.items())
+        return f"ResultadoReamostragem({self.metodo}, n={self.n_reamostras}: {parametros})"
+
+
+# --- AJUSTES EM LOTE ---
+
+def _coeficientes_em_lote(X, Y):
+    """
+    Mínimos quadrados de várias amostras ao mesmo tempo: X (B, n, p), Y (B, n) -> (B, p).
+    Amostras degeneradas (ex.: todos os x iguais) dão NaN.
+    """
+    B, n, p = X.shape
+    if p == 2:
+        # Forma fechada com somas centradas (mesma do AcumuladorMMQ)
+        xs = X[:, :, 1]
+        mx, my = xs.mean(axis=1), Y.mean(axis=1)
+        cx = xs - mx[:, np.newaxis]
+        sxx = np.einsum("ij,ij->i", cx, cx)
+        sxy = np.einsum("ij,ij->i", cx, Y - my[:, np.newaxis])
+        degenerada = sxx <= 1e-12 * np.maximum(np.einsum("ij,ij->i", xs, xs), 1e-300)
+        A = np.where(degenerada, np.nan, sxy / np.where(degenerada, 1.0, sxx))
+        return np.column_stack([my - A * mx, A])
+
+    # Caso geral: QR em pilha de [X | Y], colunas normalizadas por amostra
+    escala = np.linalg.norm(X, axis=1, keepdims=True)
+    escala[escala == 0] = 1.0
+    R = np.linalg.qr(np.concatenate([X / escala, Y[:, :, np.newaxis]], axis=2), mode="r")
+    Rp, qty = R[:, :p, :p], R[:, :p, p]
+    diag = np.abs(np.diagonal(Rp, axis1=1, axis2=2))
+    degenerada = np.any(diag <= n * np.finfo(float).eps * diag.max(axis=1, keepdims=True), axis=1)
+    Rp[degenerada] = np.eye(p)
+    c = np.linalg.solve(Rp, qty[:, :, np.newaxis])[:, :, 0] / escala[:, 0, :]
+    c[degenerada] = np.nan
+    return c
+
+
+def _bootstrap_parcial(X, Y, c_hat, residuos, X_prev, modo, n_reamostras, semente):
+    """Um pedaço das reamostras (roda em processo separado quando há pool)."""
+    rng = np.random.default_rng(semente)
+    n = len(Y)
+    I = rng.integers(0, n, size=(n_reamostras, n))
+
+    if modo == "residuos":
+        # X fixo: todos os reajustes em um único produto pela pseudo-inversa
+        Y_estrela = X @ c_hat + residuos[I]
+        coef = Y_estrela @ np.linalg.pinv(X).T
+    else:
+        coef = _coeficientes_em_lote(X[I], Y[I])
+
+    curva = coef @ X_prev.T
+    ruido = residuos[rng.integers(0, n, size=curva.shape)]
+    return coef, curva, curva + ruido
+
+
+def _percentis(amostras, nivel):
+    cauda = (1 - nivel) / 2 * 100
+    return np.nanpercentile(amostras, [cauda, 100 - cauda], axis=0)
+
+
+def _quantil_t(prob, gl):
+    """Quantil da t de Student pela expansão de Cornish-Fisher (boa para gl >= 3)."""
+    from statistics import NormalDist
+
+    z = NormalDist().inv_cdf(prob)
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    return z + g1 / gl + g2 / gl ** 2 + g3 / gl ** 3 + g4 / gl ** 4
+
+
+def _preparar(x, y, familia, grau, base, previsoes):
+    ajuste = ajustar(x, y, familia, grau=grau, base=base)
+    modelo = ajuste.modelo
+    x = np.asarray(x, dtype=float).ravel()
+    X = modelo.matriz(x)
+    Y = modelo.transformar_y(np.asarray(y, dtype=float).ravel())
+    previsoes = np.atleast_1d(np.asarray(previsoes, dtype=float))
+    X_prev = modelo.matriz(previsoes) if len(previsoes) else np.zeros((0, X.shape[1]))
+    return ajuste, modelo, X, Y, previsoes, X_prev
+
+
+def _base_parametros(modelo, ajuste):
+    """
+    Matriz T que leva os coeficientes do ajuste aos parâmetros em forma linear (T·c):
+    coeficientes em potências de x no polinômio; (B, A) nos modelos de dois parâmetros,
+    cujo alpha = f(B) é monótono e é aplicado só nos limites do intervalo.
+    """
+    p = len(ajuste.coeficientes)
+    if isinstance(modelo, ModeloPolinomial):
+        return np.array([list(modelo.parametros(e).values()) for e in np.eye(p)]).T
+    return np.eye(p)
+
+
+def _para_parametros(modelo, ajuste, theta):
+    if isinstance(modelo, ModeloPolinomial):
+        return dict(zip(ajuste.parametros, theta))
+    return modelo.parametros(theta)
+
+
+def _intervalos(modelo, ajuste, theta_lim, curva_lim, pred_lim, X_prev, nivel):
+    """Monta os Intervalos no espaço original (as transformações dos modelos são monótonas)."""
+    inferiores = _para_parametros(modelo, ajuste, theta_lim[0])
+    superiores = _para_parametros(modelo, ajuste, theta_lim[1])
+    parametros = {nome: Intervalo(valor, *sorted((inferiores[nome], superiores[nome])), nivel)
+                  for nome, valor in ajuste.parametros.items()}
+
+    curva = modelo.destransformar_y(X_prev @ ajuste.coeficientes)
+    confianca = [Intervalo(c, *sorted(modelo.destransformar_y(curva_lim[:, k])), nivel)
+                 for k, c in enumerate(curva)]
+    predicao = [Intervalo(c, *sorted(modelo.destransformar_y(pred_lim[:, k])), nivel)
+                for k, c in enumerate(curva)]
+    return parametros, confianca, predicao
+
+
+def bootstrap(x, y, familia="exponencial", grau=1, base=10.0, previsoes=(), n_reamostras=10000,
+              nivel=0.95, modo="residuos", processos=None, semente=None):
+    """
+    Intervalos bootstrap (percentis) para os parâmetros e para as previsões em 'previsoes'.
+
+    modo="residuos": mantém os x e reamostra os resíduos do ajuste (padrão; estável
+                     com poucos pontos, como os 11 da Lei de Moore).
+    modo="pares":    reamostra os pares (x, y); amostras degeneradas são descartadas.
+    processos:       reparte as reamostras entre processos (None ou 1: no processo atual).
+    """
+    if modo not in ("residuos", "pares"):
+        raise ValueError(f"Modo de bootstrap desconhecido: {modo}")
+    ajuste, modelo, X, Y, previsoes, X_prev = _preparar(x, y, familia, grau, base, previsoes)
+    # Resíduos inflados por sqrt(n / (n - p)): os do ajuste são menores que os erros
+    # verdadeiros (o ajuste usa p graus de liberdade) e encolheriam os intervalos
+    n, p = X.shape
+    if n <= p:
+        raise ValueError("O bootstrap exige mais pontos que parâmetros no modelo.")
+    residuos = (Y - X @ ajuste.coeficientes) * np.sqrt(n / (n - p))
+
+    processos = max(1, int(processos or 1))
+    partes = np.array_split(np.arange(n_reamostras), processos)
+    sementes = np.random.SeedSequence(semente).spawn(processos)
+    tarefas = [(X, Y, ajuste.coeficientes, residuos, X_prev, modo, len(parte), s)
+               for parte, s in zip(partes, sementes)]
+
+    if processos == 1:
+        resultados = [_bootstrap_parcial(*tarefas[0])]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=processos) as pool:
+            resultados = list(pool.map(_bootstrap_parcial, *zip(*tarefas)))
+
+    coef, curva, pred = (np.concatenate(partes_i) for partes_i in zip(*resultados))
+    theta = coef @ _base_parametros(modelo, ajuste).T
+    parametros, confianca, predicao = _intervalos(
+        modelo, ajuste, _percentis(theta, nivel), _percentis(curva, nivel), _percentis(pred, nivel),
+        X_prev, nivel)
+    validas = int(np.sum(np.all(np.isfinite(coef), axis=1)))
+    return ResultadoReamostragem(f"bootstrap ({modo})", nivel, validas, parametros, previsoes, confianca, predicao)
+
+
+def jackknife(x, y, familia="exponencial", grau=1, base=10.0, previsoes=(), nivel=0.95):
+    """
+    Intervalos jackknife: n ajustes deixando um ponto de fora (em lote), erro padrão
+    pela fórmula de Quenouille-Tukey e quantil t com n - p graus de liberdade.
+    """
+    ajuste, modelo, X, Y, previsoes, X_prev = _preparar(x, y, familia, grau, base, previsoes)
+    n, p = X.shape
+    if n <= p + 1:
+        raise ValueError(f"O jackknife exige pelo menos {p + 2} pontos.")
+
+    fora = ~np.eye(n, dtype=bool)
+    indices = np.nonzero(fora)[1].reshape(n, n - 1)
+    coef = _coeficientes_em_lote(X[indices], Y[indices])
+    T = _base_parametros(modelo, ajuste)
+    theta = coef @ T.T
+    curva = coef @ X_prev.T
+
+    def erro_padrao(amostras):
+        return np.sqrt((n - 1) / n * np.sum((amostras - amostras.mean(axis=0)) ** 2, axis=0))
+
+    t = _quantil_t(1 - (1 - nivel) / 2, n - p)
+    se_theta = erro_padrao(theta)
+    se_curva = erro_padrao(curva) if len(previsoes) else np.zeros(0)
+    residuos = Y - X @ ajuste.coeficientes
+    s2 = float(residuos @ residuos) / (n - p)
+    se_pred = np.sqrt(se_curva ** 2 + s2)
+
+    centro_curva = X_prev @ ajuste.coeficientes
+    centro_theta = T @ ajuste.coeficientes
+    theta_lim = np.array([centro_theta - t * se_theta, centro_theta + t * se_theta])
+    curva_lim = np.array([centro_curva - t * se_curva, centro_curva + t * se_curva])
+    pred_lim = np.array([centro_curva - t * se_pred, centro_curva + t * se_pred])
+
+    parametros, confianca, predicao = _intervalos(modelo, ajuste, theta_lim, curva_lim, pred_lim,
+                                                  X_prev, nivel)
+    return ResultadoReamostragem("jackknife", nivel, n, parametros, previsoes, confianca, predicao)
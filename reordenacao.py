@@ -0,0 +1,207 @@
+import heapq
+
+import numpy as np
+
+from esparsa import MatrizCSR
+
+
+# --- REORDENAÇÃO DAS EQUAÇÕES PARA DOMINÂNCIA DIAGONAL ---
+#
+# A reordenação garante diagonal não nula (sem ela Gauss-Seidel, SOR e ILU dividem por
+# zero na treliça montada) e maximiza o produto da diagonal, mas não cria dominância
+# onde ela não existe. Nas treliças geradas (Pratt, Howe, Warren) a menor razão de
+# dominância fica em 0,31-0,41 e o raio espectral do Gauss-Seidel reordenado é >= 1:
+# ele não converge. Para elas use GMRES/BiCGSTAB (krylov.py) com precond="ilu_banda",
+# em que esta reordenação é o primeiro passo.
+
+def _como_csr(A_in):
+    return A_in if isinstance(A_in, MatrizCSR) else MatrizCSR.de_densa(A_in)
+
+
+def razao_dominancia(A_in):
+    """
+    Razão |a_ii| / Σ_{j≠i} |a_ij| de cada linha (inf quando não há termos fora da diagonal).
+    Valores >= 1 indicam linha diagonalmente dominante.
+    """
+    linhas, colunas, valores = _como_csr(A_in).coordenadas()
+    n = _como_csr(A_in).shape[0]
+
+    na_diagonal = linhas == colunas
+    diag = np.bincount(linhas[na_diagonal], weights=np.abs(valores[na_diagonal]), minlength=n)
+    fora = np.bincount(linhas[~na_diagonal], weights=np.abs(valores[~na_diagonal]), minlength=n)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(fora > 0, diag / np.where(fora > 0, fora, 1.0), np.inf)
+
+
+def ordem_diagonal_dominante(A_in):
+    """
+    Escolhe, para cada incógnita (coluna), a equação (linha) que ficará na diagonal,
+    maximizando o produto dos |a_ii| (emparelhamento bipartido de peso máximo, como no MC64).
+
+    Custo de cada não nulo: c_ij = log(max_k |a_kj|) - log|a_ij| >= 0. O emparelhamento
+    começa guloso pelas arestas de custo reduzido nulo e é completado por caminhos
+    aumentantes mais curtos (Dijkstra com potenciais), usando só os não nulos.
+
+    Retorna 'ordem' tal que A[ordem] tem o coeficiente emparelhado na diagonal.
+    """
+    A = _como_csr(A_in)
+    n = A.shape[0]
+    if A.shape[1] != n:
+        raise ValueError("A reordenação exige uma matriz quadrada.")
+
+    linhas, colunas, valores = A.coordenadas()
+    log_modulo = np.log(np.abs(valores))
+    maximo_coluna = np.full(n, -np.inf)
+    np.maximum.at(maximo_coluna, colunas, log_modulo)
+    custo = maximo_coluna[colunas] - log_modulo
+
+    # Potenciais: custo reduzido c_ij - u_i - v_j >= 0 (nulo nas arestas emparelhadas)
+    u = np.full(n, np.inf)
+    np.minimum.at(u, linhas, custo)
+    if np.isinf(u).any():
+        raise ValueError("Matriz estruturalmente singular: existe equação sem coeficientes.")
+    v = np.zeros(n)
+
+    linha_da_coluna = np.full(n, -1, dtype=np.int64)
+    coluna_da_linha = np.full(n, -1, dtype=np.int64)
+
+    # 1. Emparelhamento guloso nas arestas justas (custo reduzido nulo)
+    for e in np.flatnonzero(custo - u[linhas] <= 0):
+        i, j = linhas[e], colunas[e]
+        if coluna_da_linha[i] < 0 and linha_da_coluna[j] < 0:
+            coluna_da_linha[i] = j
+            linha_da_coluna[j] = i
+
+    indptr = A.indptr
+
+    # 2. Caminhos aumentantes mais curtos para as linhas que sobraram
+    for raiz in np.flatnonzero(coluna_da_linha < 0):
+        dist = {}
+        anterior = {}
+        fechadas = []
+        heap = []
+
+        def relaxar(i, base):
+            s, e = indptr[i], indptr[i + 1]
+            reduzido = custo[s:e] - u[i] - v[colunas[s:e]]
+            for j, d in zip(colunas[s:e], base + np.maximum(reduzido, 0.0)):
+                if j not in visitadas and d < dist.get(j, np.inf):
+                    dist[j] = d
+                    anterior[j] = i
+                    heapq.heappush(heap, (d, j))
+
+        visitadas = set()
+        relaxar(raiz, 0.0)
+        livre, delta = -1, 0.0
+
+        while heap:
+            d, j = heapq.heappop(heap)
+            if j in visitadas or d > dist[j]:
+                continue
+            visitadas.add(j)
+            if linha_da_coluna[j] < 0:
+                livre, delta = j, d
+                break
+            fechadas.append(j)
+            relaxar(linha_da_coluna[j], d)
+
+        if livre < 0:
+            raise ValueError("Matriz estruturalmente singular: não existe ordem com diagonal não nula.")
+
+        # Atualiza os potenciais das colunas fechadas e das linhas emparelhadas a elas
+        u[raiz] += delta
+        for j in fechadas:
+            ajuste = delta - dist[j]
+            v[j] -= ajuste
+            u[linha_da_coluna[j]] += ajuste
+
+        # Inverte o caminho encontrado
+        j = livre
+        while True:
+            i = anterior[j]
+            j_antigo = coluna_da_linha[i]
+            coluna_da_linha[i] = j
+            linha_da_coluna[j] = i
+            if i == raiz:
+                break
+            j = j_antigo
+
+    return linha_da_coluna
+
+
+def reordenar(A_in, b_in):
+    """
+    Aplica ordem_diagonal_dominante a A e b. Retorna (A_reordenada, b_reordenado, ordem).
+    Confira razao_dominancia(A_reordenada) antes de usar Gauss-Seidel/SOR: só há
+    convergência garantida quando todas as razões são >= 1.
+    """
+    ordem = ordem_diagonal_dominante(A_in)
+    b = np.asarray(b_in, dtype=float)[ordem]
+
+    if isinstance(A_in, MatrizCSR):
+        return A_in.permutar(linhas=ordem), b, ordem
+    return np.asarray(A_in, dtype=float)[ordem], b, ordem
+
+
+# --- REORDENAÇÃO DE BANDA (CUTHILL-MCKEE REVERSO) ---
+
+def largura_banda(A_in):
+    """Maior |i - j| entre os não nulos de A (0 para matriz diagonal)."""
+    linhas, colunas, _ = _como_csr(A_in).coordenadas()
+    return int(np.max(np.abs(linhas - colunas), initial=0))
+
+
+def _nivel_mais_distante(vizinhos, grau, inicio, visitado):
+    """Busca em largura a partir de 'inicio'; devolve os nós na ordem de visita e o último nível."""
+    ordem, nivel = [inicio], [inicio]
+    marcado = visitado.copy()
+    marcado[inicio] = True
+    while True:
+        proximo = []
+        for i in nivel:
+            novos = vizinhos[i][~marcado[vizinhos[i]]]
+            novos = novos[np.argsort(grau[novos], kind="stable")]
+            marcado[novos] = True
+            proximo.extend(novos.tolist())
+        if not proximo:
+            return ordem, nivel
+        ordem.extend(proximo)
+        nivel = proximo
+
+
+def ordem_banda(A_in):
+    """
+    Cuthill-McKee reverso no grafo de A + Aᵀ: permutação simétrica (mesma 'ordem' nas
+    linhas e nas colunas) que aproxima os não nulos da diagonal, sem tirar nenhum
+    coeficiente dela. Aplicada depois de ordem_diagonal_dominante, a diagonal emparelhada
+    é mantida; nas treliças geradas a banda cai de ~n para ~5.
+
+    Cada componente começa por um nó pseudo-periférico (grau mínimo no nível mais
+    distante de uma primeira busca). Retorna 'ordem' tal que A[ordem][:, ordem] tem banda estreita.
+    """
+    A = _como_csr(A_in)
+    n = A.shape[0]
+    if A.shape[1] != n:
+        raise ValueError("A reordenação exige uma matriz quadrada.")
+
+    linhas, colunas, _ = A.coordenadas()
+    fora = linhas != colunas
+    grafo = MatrizCSR.de_coordenadas(np.concatenate([linhas[fora], colunas[fora]]),
+                                     np.concatenate([colunas[fora], linhas[fora]]),
+                                     np.ones(2 * int(fora.sum())), (n, n))
+    grau = np.diff(grafo.indptr)
+    vizinhos = np.split(grafo.indices, grafo.indptr[1:-1])
+
+    visitado = np.zeros(n, dtype=bool)
+    ordem = []
+    for inicio in np.argsort(grau, kind="stable"):
+        if visitado[inicio]:
+            continue
+        _, ultimo_nivel = _nivel_mais_distante(vizinhos, grau, inicio, visitado)
+        inicio = min(ultimo_nivel, key=lambda i: grau[i])
+        componente, _ = _nivel_mais_distante(vizinhos, grau, inicio, visitado)
+        visitado[componente] = True
+        ordem.extend(componente)
+
+    return np.array(ordem[::-1], dtype=np.int64)
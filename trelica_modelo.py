@@ -0,0 +1,193 @@
+import numpy as np
+
+from esparsa import MatrizCSR
+
+
+# --- MONTAGEM DO SISTEMA DE EQUILÍBRIO A PARTIR DA GEOMETRIA ---
+
+def montar_equilibrio(nos, barras, apoios, cargas):
+    """
+    Monta o sistema A·F = b do equilíbrio dos nós diretamente em CSR.
+
+    nos:    (N, 2) coordenadas (x, y) dos nós
+    barras: (m, 2) índices (base 0) dos nós de início e fim de cada barra
+    apoios: lista de (nó, 'x' ou 'y') com as reações desconhecidas
+    cargas: (N, 2) forças externas (Px, Py) aplicadas em cada nó
+
+    Linhas: 2·nó (ΣFx = 0) e 2·nó + 1 (ΣFy = 0).
+    Colunas: forças nas barras (tração positiva) seguidas das reações.
+    O termo independente é -carga, como em default_b (500 = carga de 500 para baixo).
+    """
+    nos = np.asarray(nos, dtype=float)
+    barras = np.asarray(barras, dtype=np.int64).reshape(-1, 2)
+    cargas = np.asarray(cargas, dtype=float)
+    n_nos, m = len(nos), len(barras)
+
+    # Vetores unitários de cada barra, do nó de início para o nó de fim
+    delta = nos[barras[:, 1]] - nos[barras[:, 0]]
+    unit = delta / np.linalg.norm(delta, axis=1)[:, np.newaxis]
+
+    # No nó de início a barra tracionada puxa no sentido +unit; no de fim, -unit
+    ids = np.arange(m)
+    linhas = np.concatenate([2 * barras[:, 0], 2 * barras[:, 0] + 1,
+                             2 * barras[:, 1], 2 * barras[:, 1] + 1])
+    colunas = np.concatenate([ids, ids, ids, ids])
+    valores = np.concatenate([unit[:, 0], unit[:, 1], -unit[:, 0], -unit[:, 1]])
+
+    # Reações: coeficiente unitário na equação da direção do apoio
+    if len(apoios):
+        no_apoio = np.array([no for no, _ in apoios], dtype=np.int64)
+        direcao = np.array([0 if d == 'x' else 1 for _, d in apoios], dtype=np.int64)
+        linhas = np.concatenate([linhas, 2 * no_apoio + direcao])
+        colunas = np.concatenate([colunas, m + np.arange(len(apoios))])
+        valores = np.concatenate([valores, np.ones(len(apoios))])
+
+    n_incognitas = m + len(apoios)
+    A = MatrizCSR.de_coordenadas(linhas, colunas, valores, (2 * n_nos, n_incognitas))
+    b = -cargas.reshape(-1)
+
+    return A, b
+
+
+# --- MODELO DE DADOS DA TRELIÇA ---
+
+class Trelica:
+    """
+    Treliça plana: nós, barras, apoios e cargas.
+
+    Compartilhada pelo solver (montar -> sistema A·F = b) e pelo desenho (trelica.py).
+    Os índices de nós e barras são base 0; os nomes exibidos são base 1 (F1, Nó 1, ...).
+    """
+
+    def __init__(self, nos, barras, apoios, cargas=None):
+        self.nos = np.asarray(nos, dtype=float).reshape(-1, 2)
+        self.barras = np.asarray(barras, dtype=np.int64).reshape(-1, 2)
+        self.apoios = [(int(no), d) for no, d in apoios]
+        self.cargas = np.zeros_like(self.nos) if cargas is None else np.asarray(cargas, dtype=float).reshape(-1, 2)
+
+        if self.n_barras + len(self.apoios) != 2 * self.n_nos:
+            raise ValueError(f"Treliça não isostática: {self.n_barras} barras + {len(self.apoios)} reações "
+                             f"!= 2 x {self.n_nos} nós.")
+
+    @property
+    def n_nos(self):
+        return len(self.nos)
+
+    @property
+    def n_barras(self):
+        return len(self.barras)
+
+    def nomes_incognitas(self):
+        """F1..Fm para as barras e H/V + número do nó para as reações (ex.: H1, V1, V3)."""
+        nomes = [f"F{i + 1}" for i in range(self.n_barras)]
+        nomes += [("H" if d == 'x' else "V") + str(no + 1) for no, d in self.apoios]
+        return nomes
+
+    def comprimentos(self):
+        return np.linalg.norm(self.nos[self.barras[:, 1]] - self.nos[self.barras[:, 0]], axis=1)
+
+    def montar(self):
+        """Sistema de equilíbrio (MatrizCSR, b) na ordem natural: ΣFx e ΣFy de cada nó."""
+        return montar_equilibrio(self.nos, self.barras, self.apoios, self.cargas)
+
+    @classmethod
+    def exemplo_questao(cls):
+        """A treliça de 5 nós e 7 barras da questão (cargas de 500 no nó 4 e 100 no nó 5)."""
+        t60 = np.tan(np.radians(60))
+        t30 = np.tan(np.radians(30))
+
+        n5_x = 2 + 1 / t60
+        nos = [(0, 0), (2, 0), (n5_x + 1 / t30, 0), (1, 1), (n5_x, 1)]
+        barras = [(0, 3), (0, 1), (3, 1), (3, 4), (1, 4), (1, 2), (4, 2)]
+        apoios = [(0, 'x'), (0, 'y'), (2, 'y')]
+
+        cargas = np.zeros((5, 2))
+        cargas[3, 1] = -500
+        cargas[4, 1] = -100
+
+        return cls(nos, barras, apoios, cargas)
+
+
+# --- GERADORES PARAMÉTRICOS (N painéis) ---
+
+def _banzos_com_montantes(n_paineis, largura, altura, carga, descendo_para_o_centro):
+    """
+    Treliças com montantes (Pratt e Howe): nós inferiores 0..N, superiores 1..N-1.
+    Carga vertical 'carga' (para baixo) em cada nó inferior interno.
+    Apoio fixo no primeiro nó inferior e móvel no último.
+    """
+    n = int(n_paineis)
+    if n < 2:
+        raise ValueError("São necessários pelo menos 2 painéis.")
+
+    inferiores = np.arange(n + 1)              # nó i  -> x = i·largura, y = 0
+    superiores = n + 1 + np.arange(n - 1)      # nó do topo acima do inferior k = 1..N-1
+    topo = lambda k: superiores[np.asarray(k) - 1]
+
+    nos = np.zeros((2 * n, 2))
+    nos[inferiores, 0] = inferiores * largura
+    nos[superiores, 0] = np.arange(1, n) * largura
+    nos[superiores, 1] = altura
+
+    k = np.arange(1, n - 1)                    # painéis internos (entre k e k+1)
+    esquerda = k + 0.5 < n / 2
+
+    banzo_inf = np.column_stack([inferiores[:-1], inferiores[1:]])
+    banzo_sup = np.column_stack([topo(k), topo(k + 1)])
+    montantes = np.column_stack([np.arange(1, n), topo(np.arange(1, n))])
+    extremos = np.array([[0, topo(1)], [topo(n - 1), n]])
+
+    if descendo_para_o_centro:
+        # Pratt: diagonais descem em direção ao centro (tracionadas sob carga vertical)
+        diag_ini = np.where(esquerda, topo(k), topo(k + 1))
+        diag_fim = np.where(esquerda, k + 1, k)
+    else:
+        # Howe: diagonais sobem em direção ao centro (comprimidas)
+        diag_ini = np.where(esquerda, k, k + 1)
+        diag_fim = np.where(esquerda, topo(k + 1), topo(k))
+    diagonais = np.column_stack([diag_ini, diag_fim])
+
+    barras = np.vstack([banzo_inf, banzo_sup, montantes, extremos, diagonais])
+
+    cargas = np.zeros_like(nos)
+    cargas[inferiores[1:-1], 1] = -carga
+
+    return Trelica(nos, barras, [(0, 'x'), (0, 'y'), (n, 'y')], cargas)
+
+
+def pratt(n_paineis, largura=1.0, altura=1.0, carga=1.0):
+    return _banzos_com_montantes(n_paineis, largura, altura, carga, descendo_para_o_centro=True)
+
+
+def howe(n_paineis, largura=1.0, altura=1.0, carga=1.0):
+    return _banzos_com_montantes(n_paineis, largura, altura, carga, descendo_para_o_centro=False)
+
+
+def warren(n_paineis, largura=1.0, altura=1.0, carga=1.0):
+    """
+    Treliça Warren sem montantes: nós inferiores 0..N e superiores no meio de cada painel,
+    diagonais alternadas. Carga vertical em cada nó inferior interno.
+    """
+    n = int(n_paineis)
+    if n < 1:
+        raise ValueError("É necessário pelo menos 1 painel.")
+
+    inferiores = np.arange(n + 1)
+    superiores = n + 1 + np.arange(n)          # topo do painel i, em x = (i + 0.5)·largura
+
+    nos = np.zeros((2 * n + 1, 2))
+    nos[inferiores, 0] = inferiores * largura
+    nos[superiores, 0] = (np.arange(n) + 0.5) * largura
+    nos[superiores, 1] = altura
+
+    banzo_inf = np.column_stack([inferiores[:-1], inferiores[1:]])
+    banzo_sup = np.column_stack([superiores[:-1], superiores[1:]])
+    sobe = np.column_stack([inferiores[:-1], superiores])
+    desce = np.column_stack([superiores, inferiores[1:]])
+
+    barras = np.vstack([banzo_inf, banzo_sup, sobe, desce])
+
+    cargas = np.zeros_like(nos)
+    cargas[inferiores[1:-1], 1] = -carga
+
+    return Trelica(nos, barras, [(0, 'x'), (0, 'y'), (n, 'y')], cargas)